@@ -1,10 +1,30 @@
 from bson.objectid import ObjectId
-from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify
+from bson.errors import InvalidId
+from bson import json_util
+from flask import Flask, Response, render_template, request, redirect, url_for, session, flash, jsonify, make_response, g, send_file, has_request_context
+from flask.json.provider import DefaultJSONProvider
 from werkzeug.security import check_password_hash, generate_password_hash
-from pymongo import MongoClient
+from werkzeug.middleware.proxy_fix import ProxyFix
+from pymongo import MongoClient, ReturnDocument, InsertOne, UpdateOne, DeleteOne, monitoring
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import os
 from datetime import datetime
 import re
+import json
+import base64
+from collections import OrderedDict
+import hashlib
+import hmac
+import functools
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+import tempfile
+import threading
+import bisect
+import queue
+import time
+import csv
+import io
+import gzip
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -13,6 +33,48 @@ load_dotenv()
 
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY')
+# Behind Heroku's router remote_addr is the router; take the client address from X-Forwarded-For
+TRUSTED_PROXIES = int(os.environ.get('TRUSTED_PROXIES', 1))
+if TRUSTED_PROXIES:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES, x_proto=TRUSTED_PROXIES)
+
+# JSON responses
+# ObjectId and datetime are encoded by the provider, so routes can return raw Mongo documents.
+# orjson, when installed, does the encoding in C; the output is the same either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+def json_default(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    # Datetimes stay HTTP dates, as jsonify has always sent them
+    return DefaultJSONProvider.default(value)
+
+class MongoJSONProvider(DefaultJSONProvider):
+    default = staticmethod(json_default)
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or set(kwargs) - {'separators'}:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=json_default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None or self._app.debug:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=json_default, option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+app.json = MongoJSONProvider(app)
 
 # Always validate session against .env for admin/moderator
 @app.before_request
@@ -31,60 +93,2145 @@ def validate_env_session():
             return redirect(url_for('login'))
 
 # MongoDB Atlas configuration
-MONGO_URI = os.environ.get('MONGO_URI')
-client = MongoClient(MONGO_URI)
-DB_NAME = os.environ.get('DB_NAME', 'fest_sponsor_db')
-db = client[DB_NAME]
+app.config.update(
+    MONGO_URI=os.environ.get('MONGO_URI'),
+    DB_NAME=os.environ.get('DB_NAME', 'fest_sponsor_db'),
+    MONGO_MAX_POOL_SIZE=int(os.environ.get('MONGO_MAX_POOL_SIZE', 20)),
+    MONGO_MIN_POOL_SIZE=int(os.environ.get('MONGO_MIN_POOL_SIZE', 0)),
+    MONGO_CONNECT_TIMEOUT_MS=int(os.environ.get('MONGO_CONNECT_TIMEOUT_MS', 5000)),
+    MONGO_SERVER_SELECTION_TIMEOUT_MS=int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', 5000)),
+    MONGO_SOCKET_TIMEOUT_MS=int(os.environ.get('MONGO_SOCKET_TIMEOUT_MS', 30000)),
+    # Swappable for a compatible client class (the benchmarks use mongomock.MongoClient)
+    MONGO_CLIENT_CLASS=MongoClient,
+)
+
+mongo_state = {'pid': None, 'client': None}
+mongo_lock = threading.Lock()
+
+def get_mongo_client():
+    """One MongoClient per process, created on first use so forked gunicorn workers never share sockets"""
+    pid = os.getpid()
+    if mongo_state['pid'] != pid:
+        with mongo_lock:
+            if mongo_state['pid'] != pid:
+                mongo_state['client'] = app.config['MONGO_CLIENT_CLASS'](
+                    app.config['MONGO_URI'],
+                    maxPoolSize=app.config['MONGO_MAX_POOL_SIZE'],
+                    minPoolSize=app.config['MONGO_MIN_POOL_SIZE'],
+                    connectTimeoutMS=app.config['MONGO_CONNECT_TIMEOUT_MS'],
+                    serverSelectionTimeoutMS=app.config['MONGO_SERVER_SELECTION_TIMEOUT_MS'],
+                    socketTimeoutMS=app.config['MONGO_SOCKET_TIMEOUT_MS'],
+                    event_listeners=[mongo_command_metrics, slow_query_profiler],
+                    connect=False
+                )
+                mongo_state['pid'] = pid
+    return mongo_state['client']
+
+def get_db():
+    return get_mongo_client()[app.config['DB_NAME']]
+
+class LazyCollection:
+    """Stands in for a pymongo Collection and resolves it against this process's client on use"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, attribute):
+        return getattr(get_db()[self.name], attribute)
 
 # Collections
-sponsors_collection = db.sponsors
-alumni_collection = db.alumni
-speakers_collection = db.speakers
-users_collection = db.users
+sponsors_collection = LazyCollection('sponsors')
+alumni_collection = LazyCollection('alumni')
+speakers_collection = LazyCollection('speakers')
+users_collection = LazyCollection('users')
+versions_collection = LazyCollection('collection_versions')
+change_log_collection = LazyCollection('change_log')
+
+# Metrics
+# Kept per process in Prometheus text format, so every gunicorn worker is scraped as its own target
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+def format_labels(names, values):
+    pairs = []
+    for name, value in zip(names, values):
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        pairs.append(f'{name}="{escaped}"')
+    return ','.join(pairs)
+
+class Histogram:
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self.series = {}
+        self.lock = threading.Lock()
+
+    def observe(self, labels, value):
+        with self.lock:
+            series = self.series.get(labels)
+            if series is None:
+                series = self.series[labels] = {'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['buckets'][i] += 1
+                    break
+            series['sum'] += value
+            series['count'] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self.lock:
+            series = {labels: {'buckets': list(values['buckets']), 'sum': values['sum'], 'count': values['count']} for labels, values in self.series.items()}
+        for labels, values in sorted(series.items()):
+            label_text = format_labels(self.label_names, labels)
+            prefix = label_text + ',' if label_text else ''
+            cumulative = 0
+            for bound, count in zip(self.buckets, values['buckets']):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {values["count"]}')
+            lines.append(f'{self.name}_sum{{{label_text}}} {values["sum"]}')
+            lines.append(f'{self.name}_count{{{label_text}}} {values["count"]}')
+        return lines
+
+class Counter:
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def inc(self, labels, amount=1):
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self.lock:
+            values = dict(self.values)
+        for labels, value in sorted(values.items()):
+            lines.append(f'{self.name}{{{format_labels(self.label_names, labels)}}} {value}')
+        return lines
+
+request_duration = Histogram('http_request_duration_seconds', 'Time spent in request handlers.', ('endpoint', 'method', 'status'), LATENCY_BUCKETS)
+response_size = Histogram('http_response_size_bytes', 'Size of response bodies.', ('endpoint',), SIZE_BUCKETS)
+mongo_command_duration = Histogram('mongodb_command_duration_seconds', 'Duration of MongoDB commands.', ('collection', 'command'), LATENCY_BUCKETS)
+mongo_command_failures = Counter('mongodb_command_failures_total', 'MongoDB commands that returned an error.', ('collection', 'command'))
+METRICS = [request_duration, response_size, mongo_command_duration, mongo_command_failures]
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Times every command the driver sends, labelled by collection"""
+
+    def __init__(self):
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def started(self, event):
+        target = event.command.get(event.command_name)
+        # getMore carries the cursor id under the command name and the collection separately
+        collection = target if isinstance(target, str) else event.command.get('collection', '')
+        with self.lock:
+            self.pending[(event.connection_id, event.request_id)] = collection
+
+    def _finish(self, event):
+        with self.lock:
+            return self.pending.pop((event.connection_id, event.request_id), '')
+
+    def succeeded(self, event):
+        collection = self._finish(event)
+        mongo_command_duration.observe((collection, event.command_name), event.duration_micros / 1e6)
+
+    def failed(self, event):
+        collection = self._finish(event)
+        mongo_command_duration.observe((collection, event.command_name), event.duration_micros / 1e6)
+        mongo_command_failures.inc((collection, event.command_name))
+
+mongo_command_metrics = MongoCommandMetrics()
+
+# Slow-query log
+# Read commands slower than the threshold are logged with their values redacted. Each new
+# query shape gets an explain() run on a background thread (never inside the listener).
+SLOW_QUERY_THRESHOLD_MS = int(os.environ.get('SLOW_QUERY_THRESHOLD_MS', 100))
+SLOW_QUERY_MAX_SHAPES = 200
+SLOW_QUERY_EXPLAIN_INTERVAL = 600
+PROFILED_COMMANDS = {
+    'find': ['find', 'filter', 'sort', 'projection', 'limit', 'skip', 'hint'],
+    'aggregate': ['aggregate', 'pipeline', 'cursor', 'hint'],
+    'count': ['count', 'query', 'limit', 'skip', 'hint'],
+    'distinct': ['distinct', 'key', 'query'],
+}
+
+def redact_query(value):
+    """Keep field names and operators, replace every value with '?'"""
+    if isinstance(value, dict):
+        return {key: redact_query(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact_query(item) for item in value]
+    return '?'
+
+def summarize_explain(explain):
+    """Reduce explain(executionStats) output to the plan stages and examined/returned counts"""
+    stages, indexes = [], []
+    def walk(node):
+        if isinstance(node, dict):
+            if isinstance(node.get('stage'), str):
+                stages.append(node['stage'])
+                if node.get('indexName'):
+                    indexes.append(node['indexName'])
+            for item in node.values():
+                walk(item)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+    walk(explain.get('queryPlanner', {}).get('winningPlan') or explain.get('stages') or explain)
+    stats = explain.get('executionStats', {})
+    if not stats:
+        # Aggregations nest the find-layer stats under their first stage
+        for stage in explain.get('stages', []):
+            stats = stage.get('$cursor', {}).get('executionStats', {})
+            if stats:
+                break
+    return {
+        'collscan': 'COLLSCAN' in stages,
+        'stages': sorted(set(stages)),
+        'indexes': sorted(set(indexes)),
+        'docs_examined': stats.get('totalDocsExamined'),
+        'keys_examined': stats.get('totalKeysExamined'),
+        'returned': stats.get('nReturned'),
+        'execution_ms': stats.get('executionTimeMillis')
+    }
+
+class SlowQueryProfiler(monitoring.CommandListener):
+    def __init__(self):
+        self.pending = {}
+        self.shapes = {}
+        self.lock = threading.Lock()
+        self.explain_queue = queue.Queue(maxsize=20)
+        self.explain_thread = None
+
+    def started(self, event):
+        if SLOW_QUERY_THRESHOLD_MS <= 0 or event.command_name not in PROFILED_COMMANDS:
+            return
+        command = {key: event.command[key] for key in PROFILED_COMMANDS[event.command_name] if key in event.command}
+        with self.lock:
+            self.pending[(event.connection_id, event.request_id)] = (event.database_name, command)
+
+    def failed(self, event):
+        with self.lock:
+            self.pending.pop((event.connection_id, event.request_id), None)
+
+    def succeeded(self, event):
+        with self.lock:
+            pending = self.pending.pop((event.connection_id, event.request_id), None)
+        if pending is None:
+            return
+        duration_ms = event.duration_micros / 1000
+        if duration_ms < SLOW_QUERY_THRESHOLD_MS:
+            return
+        database_name, command = pending
+        self.record(database_name, event.command_name, command, duration_ms)
+
+    def record(self, database_name, command_name, command, duration_ms):
+        collection = command.get(command_name)
+        shape = {key: redact_query(value) for key, value in command.items() if key != command_name}
+        shape_key = json.dumps([collection, command_name, shape], sort_keys=True, default=str)
+        now = time.time()
+        with self.lock:
+            entry = self.shapes.get(shape_key)
+            if entry is None:
+                if len(self.shapes) >= SLOW_QUERY_MAX_SHAPES:
+                    fastest = min(self.shapes, key=lambda key: self.shapes[key]['max_ms'])
+                    del self.shapes[fastest]
+                entry = self.shapes[shape_key] = {
+                    'collection': collection,
+                    'command': command_name,
+                    'shape': shape,
+                    'count': 0,
+                    'total_ms': 0.0,
+                    'max_ms': 0.0,
+                    'last_seen': None,
+                    'explain': None,
+                    'explained_at': 0
+                }
+            entry['count'] += 1
+            entry['total_ms'] += duration_ms
+            entry['max_ms'] = max(entry['max_ms'], duration_ms)
+            entry['last_seen'] = datetime.utcnow().isoformat()
+            needs_explain = now - entry['explained_at'] >= SLOW_QUERY_EXPLAIN_INTERVAL
+            if needs_explain:
+                entry['explained_at'] = now
+        app.logger.warning('Slow query on %s: %s %s took %.1f ms', collection, command_name, json.dumps(shape, default=str), duration_ms)
+        if needs_explain:
+            self.schedule_explain(shape_key, database_name, command)
+
+    def schedule_explain(self, shape_key, database_name, command):
+        try:
+            self.explain_queue.put_nowait((shape_key, database_name, command))
+        except queue.Full:
+            return
+        with self.lock:
+            if self.explain_thread is None or not self.explain_thread.is_alive():
+                self.explain_thread = threading.Thread(target=self.run_explains, name='slow-query-explain', daemon=True)
+                self.explain_thread.start()
+
+    def run_explains(self):
+        while True:
+            try:
+                shape_key, database_name, command = self.explain_queue.get(timeout=30)
+            except queue.Empty:
+                return
+            try:
+                explain_command = dict(command)
+                if 'cursor' not in explain_command and 'aggregate' in explain_command:
+                    explain_command['cursor'] = {}
+                explain = get_mongo_client()[database_name].command('explain', explain_command, verbosity='executionStats')
+                summary = summarize_explain(explain)
+            except Exception as e:
+                summary = {'error': str(e)}
+            with self.lock:
+                if shape_key in self.shapes:
+                    self.shapes[shape_key]['explain'] = summary
+
+    def report(self, limit=50):
+        with self.lock:
+            entries = [dict(entry) for entry in self.shapes.values()]
+        for entry in entries:
+            entry['avg_ms'] = entry['total_ms'] / entry['count']
+            entry.pop('explained_at', None)
+        entries.sort(key=lambda entry: entry['max_ms'], reverse=True)
+        return entries[:limit]
+
+slow_query_profiler = SlowQueryProfiler()
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.get('request_started')
+    if started is not None:
+        endpoint = request.endpoint or 'unmatched'
+        request_duration.observe((endpoint, request.method, response.status_code), time.perf_counter() - started)
+        if response.content_length is not None:
+            response_size.observe((endpoint,), response.content_length)
+    return response
+
+# Response compression
+# JSON bodies above a few hundred bytes go out as brotli (when the package is installed) or gzip,
+# whichever the client accepts. Files and streamed responses are left alone.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESS_MIN_SIZE = 500
+COMPRESS_MIMETYPES = {'application/json'}
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+def choose_content_encoding(accept_encodings):
+    if brotli is not None and accept_encodings['br']:
+        return 'br'
+    if accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+@app.after_request
+def compress_response(response):
+    if response.status_code != 200 or response.mimetype not in COMPRESS_MIMETYPES:
+        return response
+    response.vary.add('Accept-Encoding')
+    if response.direct_passthrough or response.is_streamed or 'Content-Encoding' in response.headers:
+        return response
+    encoding = choose_content_encoding(request.accept_encodings)
+    data = response.get_data()
+    if encoding is None or len(data) < COMPRESS_MIN_SIZE:
+        return response
+    if encoding == 'br':
+        response.set_data(brotli.compress(data, quality=BROTLI_QUALITY))
+    else:
+        response.set_data(gzip.compress(data, compresslevel=GZIP_LEVEL))
+    response.headers['Content-Encoding'] = encoding
+    # The compressed bytes differ from the identity ones, so the tag can only be a weak match
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+# Static assets
+# `flask build-assets` writes minified copies of static/css and static/js to static/dist, named
+# after their content hash, plus a manifest. url_for('static', ...) then links those copies,
+# which browsers may cache for good since any change gets a new name.
+ASSET_DIRECTORIES = ['css', 'js']
+ASSET_BUILD_DIR = 'dist'
+ASSET_MANIFEST = os.path.join(app.static_folder, ASSET_BUILD_DIR, 'manifest.json')
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+asset_state = {'manifest': None, 'built': None}
+
+def load_asset_manifest():
+    """Source path -> built path, read once per process; empty until the assets are built"""
+    if asset_state['manifest'] is None:
+        try:
+            with open(ASSET_MANIFEST) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = {}
+        asset_state['built'] = set(manifest.values())
+        asset_state['manifest'] = manifest
+    return asset_state['manifest']
+
+@app.url_defaults
+def fingerprint_static_url(endpoint, values):
+    # The debug server links the sources, so edits show up without a rebuild
+    if endpoint != 'static' or app.debug or 'filename' not in values:
+        return
+    values['filename'] = load_asset_manifest().get(values['filename'], values['filename'])
+
+@app.after_request
+def cache_built_assets(response):
+    if request.endpoint != 'static' or response.status_code not in (200, 304):
+        return response
+    load_asset_manifest()
+    if (request.view_args or {}).get('filename') in asset_state['built']:
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = ASSET_MAX_AGE
+        response.cache_control.immutable = True
+    return response
+
+JS_WORD_CHAR = re.compile(r'[\w$\\\u0080-\uffff]')
+JS_WORD = re.compile(r'[\w$\u0080-\uffff]+')
+# After these keywords a '/' starts a regex; after any other word it is a division
+JS_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw'}
+
+def skip_js_quoted(source, i, quote):
+    """Index just past the string, regex or template chunk starting at i"""
+    i += 1
+    while source[i] != quote:
+        i += 2 if source[i] == '\\' else 1
+    return i + 1
+
+def minify_js(source):
+    """Drop comments and indentation. Strings, template literals (nested ones too) and regexes are
+    copied as they are, and line breaks that end a statement stay, so ASI behaves as before."""
+    out = []
+    templates = []
+    depth = 0
+    # Whether the last token ends an operand; a '/' after one is a division, otherwise a regex
+    operand = False
+    i, n = 0, len(source)
+
+    def copy_template(i):
+        # From just inside a template literal to its closing backtick or next ${
+        start = i
+        while source[i] != '`' and not source.startswith('${', i):
+            i += 2 if source[i] == '\\' else 1
+        if source[i] == '`':
+            out.append(source[start:i + 1])
+            return i + 1
+        out.append(source[start:i + 2])
+        templates.append(depth)
+        return i + 2
+
+    while i < n:
+        char = source[i]
+        if char.isspace() or source.startswith('//', i) or source.startswith('/*', i):
+            newline = False
+            while i < n:
+                if source[i].isspace():
+                    newline = newline or source[i] == '\n'
+                    i += 1
+                elif source.startswith('//', i):
+                    end = source.find('\n', i)
+                    i = n if end < 0 else end
+                elif source.startswith('/*', i):
+                    end = source.find('*/', i + 2)
+                    newline = newline or '\n' in source[i:end]
+                    i = end + 2
+                else:
+                    break
+            previous = out[-1][-1] if out else ''
+            following = source[i] if i < n else ''
+            if not previous or not following:
+                continue
+            if newline and previous not in '{(,;' and following not in '})],.':
+                out.append('\n')
+            elif JS_WORD_CHAR.match(previous) and JS_WORD_CHAR.match(following) or previous + following in ('++', '--'):
+                out.append(' ')
+            continue
+        if char in '\'"':
+            end = skip_js_quoted(source, i, char)
+            out.append(source[i:end])
+            i = end
+            operand = True
+        elif char == '`':
+            out.append('`')
+            i = copy_template(i + 1)
+            operand = out[-1].endswith('`')
+        elif char == '/' and not operand:
+            end = i + 1
+            in_class = False
+            while in_class or source[end] != '/':
+                if source[end] == '\\':
+                    end += 1
+                elif source[end] == '[':
+                    in_class = True
+                elif source[end] == ']':
+                    in_class = False
+                end += 1
+            out.append(source[i:end + 1])
+            i = end + 1
+            operand = True
+        elif char == '}' and templates and templates[-1] == depth:
+            templates.pop()
+            out.append('}')
+            i = copy_template(i + 1)
+            operand = out[-1].endswith('`')
+        elif JS_WORD.match(source, i):
+            word = JS_WORD.match(source, i).group()
+            out.append(word)
+            i += len(word)
+            operand = word not in JS_REGEX_KEYWORDS
+        elif source.startswith('++', i) or source.startswith('--', i):
+            # Postfix after an operand, so the expression still ends in one; prefix otherwise
+            out.append(source[i:i + 2])
+            i += 2
+        else:
+            if char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+            out.append(char)
+            i += 1
+            operand = char in ')]'
+    return ''.join(out) + '\n'
+
+def minify_css(source):
+    source = re.sub(r'/\*.*?\*/', '', source, flags=re.S)
+    source = re.sub(r'\s+', ' ', source)
+    source = re.sub(r' ?([{};,>]) ?', r'\1', source)
+    return source.replace(';}', '}').strip() + '\n'
+
+def build_static_assets():
+    build_folder = os.path.join(app.static_folder, ASSET_BUILD_DIR)
+    manifest = {}
+    for directory in ASSET_DIRECTORIES:
+        os.makedirs(os.path.join(build_folder, directory), exist_ok=True)
+        for name in sorted(os.listdir(os.path.join(app.static_folder, directory))):
+            stem, extension = os.path.splitext(name)
+            if extension not in ('.js', '.css'):
+                continue
+            with open(os.path.join(app.static_folder, directory, name), encoding='utf-8') as f:
+                source = f.read()
+            content = (minify_js(source) if extension == '.js' else minify_css(source)).encode('utf-8')
+            built_path = f'{ASSET_BUILD_DIR}/{directory}/{stem}.{hashlib.sha256(content).hexdigest()[:12]}{extension}'
+            with open(os.path.join(app.static_folder, built_path), 'wb') as f:
+                f.write(content)
+            manifest[f'{directory}/{name}'] = built_path
+    # Files from earlier builds
+    for directory in ASSET_DIRECTORIES:
+        for name in os.listdir(os.path.join(build_folder, directory)):
+            if f'{ASSET_BUILD_DIR}/{directory}/{name}' not in manifest.values():
+                os.remove(os.path.join(build_folder, directory, name))
+    temporary_path = ASSET_MANIFEST + '.tmp'
+    with open(temporary_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temporary_path, ASSET_MANIFEST)
+    asset_state['manifest'] = None
+    return manifest
+
+@app.cli.command('build-assets')
+def build_assets():
+    """Minify and fingerprint static/css and static/js into static/dist"""
+    for source_path, built_path in sorted(build_static_assets().items()):
+        print(f'{source_path} -> {built_path}')
+
+# Search configuration
+# Fields that feed the normalized search keys of each collection
+SEARCH_FIELDS = {
+    'sponsors': ['company_name', 'website'],
+    'alumni': ['ruetian_name', 'ruetian_mail', 'ruetian_linkedin'],
+    'speakers': ['name', 'mail', 'linkedin', 'designation'],
+}
+SEARCH_LIMIT = 50
+SEARCH_CANDIDATE_LIMIT = 200
+SEARCH_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+def tokenize_search_text(value):
+    return SEARCH_TOKEN_PATTERN.findall(str(value or '').lower())
+
+def build_search_keys(document, entity_name):
+    """Build the lowercased search keys (whole values and their tokens) for a document"""
+    keys = set()
+    for field in SEARCH_FIELDS[entity_name]:
+        value = ' '.join(str(document.get(field) or '').lower().split())
+        if not value:
+            continue
+        keys.add(value)
+        keys.update(tokenize_search_text(value))
+    return sorted(keys)
+
+def build_search_query(search_term):
+    """Anchored prefix query on the search keys, so MongoDB can answer it from the index"""
+    words = tokenize_search_text(search_term)
+    if not words:
+        return None
+    return {'$and': [{'search_keys': re.compile('^' + re.escape(word))} for word in words]}
+
+def build_regex_search_query(search_term, entity_name):
+    # Unanchored fallback for documents without search keys and for infix matches
+    regex = re.compile(re.escape(search_term), re.IGNORECASE)
+    return {'$or': [{field: {'$regex': regex}} for field in SEARCH_FIELDS[entity_name]]}
+
+def rank_search_results(documents, search_term, entity_name):
+    """Order matches by how closely their fields match the search term"""
+    term = ' '.join(search_term.lower().split())
+    words = tokenize_search_text(search_term)
+    def score(document):
+        total = 0
+        for field in SEARCH_FIELDS[entity_name]:
+            value = ' '.join(str(document.get(field) or '').lower().split())
+            if not value:
+                continue
+            if value == term:
+                total += 10
+            elif value.startswith(term):
+                total += 5
+            tokens = set(tokenize_search_text(value))
+            for word in words:
+                if word in tokens:
+                    total += 2
+                elif any(token.startswith(word) for token in tokens):
+                    total += 1
+        return total
+    return sorted(documents, key=score, reverse=True)
+
+def search_projection(entity_name, projection):
+    """Widen an inclusion projection with the fields ranking reads; returns it and the fields to drop afterwards"""
+    if not projection or 1 not in projection.values():
+        return projection, []
+    ranking_only = [field for field in SEARCH_FIELDS[entity_name] if field not in projection]
+    return dict(projection, **{field: 1 for field in ranking_only}), ranking_only
+
+def run_search(collection, entity_name, search_term, projection=None):
+    """Indexed prefix search with a ranked, limited result set and a $regex fallback"""
+    projection, ranking_only = search_projection(entity_name, projection)
+    documents = []
+    query = build_search_query(search_term)
+    if query is not None:
+        documents = list(collection.find(query, projection).limit(SEARCH_CANDIDATE_LIMIT))
+    if not documents:
+        documents = list(collection.find(build_regex_search_query(search_term, entity_name), projection).limit(SEARCH_CANDIDATE_LIMIT))
+    documents = rank_search_results(documents, search_term, entity_name)[:SEARCH_LIMIT]
+    for document in documents:
+        for field in ranking_only:
+            document.pop(field, None)
+    return documents
+
+# Duplicate sponsor detection
+# Sponsors store a normalized website domain and company-name key, both indexed, so finding
+# a duplicate is one indexed $or lookup instead of a scan.
+COMPANY_NAME_STOPWORDS = {'the', 'ltd', 'limited', 'inc', 'incorporated', 'corp', 'corporation', 'co', 'company', 'plc', 'llc', 'pvt', 'private', 'pte'}
+MATCH_KEY_FIELDS = ['website_domain', 'name_key']
+# Stored fields computed from others; clients can't write them
+DERIVED_FIELDS = ['search_keys'] + MATCH_KEY_FIELDS + ['export_row']
+
+# Hosts many sponsors share (social pages, site builders): their key keeps the page path
+SHARED_WEBSITE_HOSTS = {
+    'facebook.com', 'fb.com', 'linkedin.com', 'instagram.com', 'twitter.com', 'x.com', 'youtube.com',
+    'tiktok.com', 'github.com', 'medium.com', 'linktr.ee', 't.me', 'sites.google.com', 'bit.ly',
+}
+# Path segments that name a kind of page rather than the page, e.g. linkedin.com/company/<name>
+GENERIC_PATH_SEGMENTS = {'company', 'in', 'school', 'showcase', 'pages', 'pg', 'groups', 'channel', 'c', 'user', 'people', 'profile.php', 'view'}
+WEBSITE_HOST_PATTERN = re.compile(r'^[a-z0-9-]+(\.[a-z0-9-]+)+$')
+
+def normalize_website_domain(website):
+    """'https://www.Acme.com/about' -> 'acme.com', 'fb.com/Acme' -> 'fb.com/acme', 'N/A' -> ''"""
+    value = str(website or '').strip().lower()
+    value = re.sub(r'^[a-z][a-z0-9+.-]*://', '', value)
+    host, _, path = re.split(r'[?#]', value, 1)[0].partition('/')
+    host = host.rsplit('@', 1)[-1].split(':', 1)[0].strip('.')
+    host = host[4:] if host.startswith('www.') else host
+    # Placeholders like 'N/A' or '-' must not match each other
+    if not WEBSITE_HOST_PATTERN.match(host):
+        return ''
+    shared = next((base for base in SHARED_WEBSITE_HOSTS if host == base or host.endswith('.' + base)), None)
+    if shared is None:
+        return host
+    # m.facebook.com/acme and facebook.com/acme are one page; facebook.com alone is nobody's
+    segment = next((segment for segment in path.split('/') if segment and segment not in GENERIC_PATH_SEGMENTS), None)
+    return f'{shared}/{segment}' if segment else ''
+
+def normalize_company_name(company_name):
+    """'The ACME Co. Ltd' -> 'acme'"""
+    return ''.join(word for word in tokenize_search_text(company_name) if word not in COMPANY_NAME_STOPWORDS)
+
+def sponsor_match_keys(document):
+    return {
+        'website_domain': normalize_website_domain(document.get('website')),
+        'name_key': normalize_company_name(document.get('company_name'))
+    }
+
+def derived_fields(document, entity_name):
+    """Fields computed from a document: search keys, plus a sponsor's match keys and flattened export row"""
+    fields = {'search_keys': build_search_keys(document, entity_name)}
+    if entity_name == 'sponsors':
+        fields.update(sponsor_match_keys(document))
+        fields['export_row'] = sponsor_export_row(document)
+    return fields
+
+def derived_source_projection(entity_name):
+    """What derived_fields reads: the search fields, or all of a sponsor for its export row"""
+    if entity_name == 'sponsors':
+        return {field: 0 for field in DERIVED_FIELDS}
+    return {field: 1 for field in SEARCH_FIELDS[entity_name]}
+
+def derived_fields_stale(entity_name, fields):
+    """Whether a $set of these fields leaves the stored derived fields out of date"""
+    if entity_name == 'sponsors':
+        return bool(fields)
+    return any(field in fields for field in SEARCH_FIELDS[entity_name])
+
+def duplicate_sponsor_query(match_keys, exclude_id=None):
+    clauses = [{field: match_keys[field]} for field in MATCH_KEY_FIELDS if match_keys.get(field)]
+    if not clauses:
+        return None
+    query = {'$or': clauses}
+    if exclude_id is not None:
+        query['_id'] = {'$ne': exclude_id}
+    return query
+
+def find_duplicate_sponsor(match_keys, exclude_id=None):
+    query = duplicate_sponsor_query(match_keys, exclude_id)
+    return sponsors_collection.find_one(query) if query else None
+
+def duplicate_sponsor_response(duplicate):
+    return jsonify({
+        'success': False,
+        'message': f"Sponsor already exists: {duplicate.get('company_name', '')} ({duplicate.get('website', '')})",
+        'duplicate_id': str(duplicate['_id'])
+    }), 409
+
+def sponsor_merge_update(existing, sponsor):
+    """Update folding a duplicate submission into the stored sponsor: fill its empty fields, add new contacts and ruetians"""
+    update = {}
+    fields = {field: sponsor[field] for field in ['previous_sponsor', 'category', 'other_category'] if sponsor.get(field) and not existing.get(field)}
+    if fields:
+        update['$set'] = fields
+    additions = {}
+    for field in ['contacts', 'ruetians']:
+        stored = existing.get(field) or []
+        new_items = [item for item in sponsor.get(field) or [] if item not in stored]
+        if new_items:
+            additions[field] = {'$each': new_items}
+    if additions:
+        update['$push'] = additions
+    return update
+
+def refresh_search_keys(collection, entity_name, document_ids):
+    """Recompute the derived fields of stored documents after a partial update"""
+    updates = [
+        UpdateOne({'_id': document['_id']}, {'$set': derived_fields(document, entity_name)})
+        for document in collection.find({'_id': {'$in': list(document_ids)}}, derived_source_projection(entity_name))
+    ]
+    if updates:
+        collection.bulk_write(updates, ordered=False)
+
+# Pagination configuration
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+# Fields each /list endpoint returns, projected on the server
+LIST_FIELDS = {
+    'sponsors': ['company_name', 'website', 'ruetian_name', 'category'],
+    'alumni': ['ruetian_name', 'ruetian_phone', 'ruetian_mail', 'ruetian_linkedin', 'created_at', 'created_by'],
+    'speakers': ['name', 'phone', 'mail', 'linkedin', 'designation', 'created_at', 'created_by'],
+}
+LIST_SORT = [('created_at', -1), ('_id', -1)]
+
+def encode_cursor(document):
+    created_at = document.get('created_at')
+    payload = [created_at.isoformat() if isinstance(created_at, datetime) else None, str(document['_id'])]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+def decode_cursor(cursor):
+    """Turn an opaque cursor back into the (created_at, _id) position it points at"""
+    try:
+        created_at, document_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (datetime.fromisoformat(created_at) if created_at else None), ObjectId(document_id)
+    except Exception:
+        raise ValueError('Invalid cursor')
+
+def build_cursor_query(cursor):
+    created_at, document_id = decode_cursor(cursor)
+    # Documents without created_at sort after every dated one in descending order
+    if created_at is None:
+        return {'created_at': None, '_id': {'$lt': document_id}}
+    return {'$or': [
+        {'created_at': {'$lt': created_at}},
+        {'created_at': created_at, '_id': {'$lt': document_id}},
+        {'created_at': None}
+    ]}
+
+def parse_page_size(value):
+    try:
+        page_size = int(value) if value else DEFAULT_PAGE_SIZE
+    except ValueError:
+        raise ValueError('Invalid limit')
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+def list_projection(entity_name, fields=None):
+    """The entity's list fields, or the ?fields= selection; created_at is always read for the cursor"""
+    projection = parse_projection(fields) if fields else {field: 1 for field in LIST_FIELDS[entity_name]}
+    if 1 in projection.values():
+        projection['created_at'] = 1
+    return projection
+
+def fetch_page(collection, entity_name, args):
+    """Read one page of a collection, newest first, returning the documents and the next cursor"""
+    page_size = parse_page_size(args.get('limit'))
+    query = build_cursor_query(args['cursor']) if args.get('cursor') else {}
+    projection = list_projection(entity_name, args.get('fields'))
+    documents = list(collection.find(query, projection).sort(LIST_SORT).limit(page_size + 1))
+    next_cursor = None
+    if len(documents) > page_size:
+        documents = documents[:page_size]
+        next_cursor = encode_cursor(documents[-1])
+    return documents, next_cursor
+
+def page_response(items, next_cursor, change_token=None):
+    response = jsonify(items)
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    # Read before the page, so /changes?since=<token> can only repeat a change, never miss one
+    if change_token is not None:
+        response.headers['X-Change-Token'] = str(change_token)
+    return response
+
+# Export configuration
+EXPORT_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+EXPORT_BATCH_SIZE = 500
+EXPORT_MAX_COLUMN_WIDTH = 50
+CONTACT_ROLES = ['CEO', 'CTO', 'Brand Manager', 'Sponsor Manager', 'HR']
+MAX_EXPORT_RUETIANS = 5
+
+def format_export_date(value):
+    return value.strftime('%Y-%m-%d %H:%M:%S') if isinstance(value, datetime) else ''
+
+SPONSOR_EXPORT_COLUMNS = ['Company Name', 'Website', 'Previous Sponsor', 'Category', 'Other Category']
+for role in CONTACT_ROLES:
+    SPONSOR_EXPORT_COLUMNS += [f'{role} Name', f'{role} Phone', f'{role} Mail', f'{role} LinkedIn']
+for i in range(1, MAX_EXPORT_RUETIANS + 1):
+    SPONSOR_EXPORT_COLUMNS += [f'Ruetian {i} Name', f'Ruetian {i} Phone', f'Ruetian {i} Mail', f'Ruetian {i} LinkedIn']
+SPONSOR_EXPORT_COLUMNS += ['Created At', 'Created By']
+
+def sponsor_export_row(sponsor):
+    """Flatten a sponsor with its contacts and ruetians into one spreadsheet row"""
+    row = [
+        sponsor.get('company_name', ''),
+        sponsor.get('website', ''),
+        sponsor.get('previous_sponsor', ''),
+        sponsor.get('category', ''),
+        sponsor.get('other_category', ''),
+    ]
+    # The last contact listed for a role wins, as in the original export
+    contacts = {}
+    for contact in sponsor.get('contacts') or []:
+        if contact.get('role') in CONTACT_ROLES:
+            contacts[contact['role']] = contact
+    for role in CONTACT_ROLES:
+        contact = contacts.get(role, {})
+        row += [contact.get('name', ''), contact.get('phone', ''), contact.get('mail', ''), contact.get('linkedin', '')]
+    ruetians = (sponsor.get('ruetians') or [])[:MAX_EXPORT_RUETIANS]
+    for i in range(MAX_EXPORT_RUETIANS):
+        ruetian = ruetians[i] if i < len(ruetians) else {}
+        row += [ruetian.get('name', ''), ruetian.get('phone', ''), ruetian.get('mail', ''), ruetian.get('linkedin', '')]
+    row += [format_export_date(sponsor.get('created_at')), sponsor.get('created_by', '')]
+    return row
+
+ALUMNI_EXPORT_COLUMNS = ['Ruetian Name', 'Ruetian Phone', 'Ruetian Mail', 'Ruetian LinkedIn', 'Created At', 'Created By']
+
+def alumni_export_row(alumni):
+    return [
+        alumni.get('ruetian_name', ''),
+        alumni.get('ruetian_phone', ''),
+        alumni.get('ruetian_mail', ''),
+        alumni.get('ruetian_linkedin', ''),
+        format_export_date(alumni.get('created_at')),
+        alumni.get('created_by', '')
+    ]
+
+SPEAKER_EXPORT_COLUMNS = ['Name', 'Phone', 'Mail', 'LinkedIn', 'Designation', 'Created At', 'Created By']
+
+def speaker_export_row(speaker):
+    return [
+        speaker.get('name', ''),
+        speaker.get('phone', ''),
+        speaker.get('mail', ''),
+        speaker.get('linkedin', ''),
+        speaker.get('designation', ''),
+        format_export_date(speaker.get('created_at')),
+        speaker.get('created_by', '')
+    ]
+
+# Sheet name, download name, columns and row builder per entity
+EXPORTS = {
+    'sponsors': ('Sponsors', 'sponsors_list.xlsx', SPONSOR_EXPORT_COLUMNS, sponsor_export_row),
+    'alumni': ('Alumni', 'alumni_list.xlsx', ALUMNI_EXPORT_COLUMNS, alumni_export_row),
+    'speakers': ('Speakers', 'speakers_list.xlsx', SPEAKER_EXPORT_COLUMNS, speaker_export_row),
+}
+
+class ExportSheet:
+    """A worksheet filled in batches of rows, tracking the widest value of each column as it goes"""
+
+    def __init__(self, workbook, sheet_name, columns):
+        self.worksheet = workbook.add_worksheet(sheet_name)
+        self.widths = [len(column) for column in columns]
+        self.worksheet.write_row(0, 0, columns, workbook.add_format({'bold': True, 'border': 1}))
+        self.next_row = 1
+
+    def write_rows(self, rows):
+        widths = self.widths
+        for row in rows:
+            self.worksheet.write_row(self.next_row, 0, row)
+            self.next_row += 1
+            for i, value in enumerate(row):
+                length = len(str(value)) if value is not None else 0
+                if length > widths[i]:
+                    widths[i] = length
+
+    def finish(self):
+        for i, width in enumerate(self.widths):
+            self.worksheet.set_column(i, i, min(width + 2, EXPORT_MAX_COLUMN_WIDTH))
+
+def export_documents(collection):
+    return collection.find({}, {field: 0 for field in DERIVED_FIELDS}).sort('created_at', -1).batch_size(EXPORT_BATCH_SIZE)
+
+def batched(documents):
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def export_row_batches(entity_name, collection):
+    """Read and flatten a collection, yielding its spreadsheet rows EXPORT_BATCH_SIZE at a time"""
+    build_row = EXPORTS[entity_name][3]
+    if entity_name != 'sponsors':
+        for documents in batched(export_documents(collection)):
+            yield [build_row(document) for document in documents]
+        return
+    # Sponsors store their row, so only those written before it existed (or before a column change) are flattened here
+    stored = collection.find({}, {'export_row': 1}).sort('created_at', -1).batch_size(EXPORT_BATCH_SIZE)
+    for documents in batched(stored):
+        missing = [document['_id'] for document in documents if len(document.get('export_row') or []) != len(SPONSOR_EXPORT_COLUMNS)]
+        rebuilt = {}
+        if missing:
+            rebuilt = {document['_id']: build_row(document) for document in collection.find({'_id': {'$in': missing}}, derived_source_projection(entity_name))}
+        rows = []
+        for document in documents:
+            if document['_id'] in rebuilt:
+                rows.append(rebuilt[document['_id']])
+            elif len(document.get('export_row') or []) == len(SPONSOR_EXPORT_COLUMNS):
+                rows.append(document['export_row'])
+        yield rows
+
+def write_export_workbook(entity_name, collection, path):
+    """Build the entity workbook at path in constant-memory mode"""
+    sheet_name, download_name, columns, build_row = EXPORTS[entity_name]
+    # Imported here so workers that never export don't pay for it
+    import xlsxwriter
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    sheet = ExportSheet(workbook, sheet_name, columns)
+    for rows in export_row_batches(entity_name, collection):
+        sheet.write_rows(rows)
+    sheet.finish()
+    workbook.close()
+
+# Combined export
+# One workbook with a sheet per entity. Each collection is read and flattened on its own thread;
+# finished batches queue up for this thread, the only one that touches the workbook.
+COMBINED_EXPORT = 'all'
+COMBINED_EXPORT_DOWNLOAD_NAME = 'fest_export.xlsx'
+# Bounds the rows held in memory to this many batches
+EXPORT_QUEUE_BATCHES = 8
+
+export_executor = ThreadPoolExecutor(max_workers=len(EXPORTS), thread_name_prefix='export')
+
+def write_combined_workbook(path):
+    import xlsxwriter
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    sheets = {entity_name: ExportSheet(workbook, sheet_name, columns) for entity_name, (sheet_name, download_name, columns, build_row) in EXPORTS.items()}
+    batches = queue.Queue(maxsize=EXPORT_QUEUE_BATCHES)
+    stopped = threading.Event()
+
+    def put(item):
+        # Gives up once the writer has failed, instead of blocking on a queue nobody drains
+        while not stopped.is_set():
+            try:
+                batches.put(item, timeout=1)
+                return
+            except queue.Full:
+                pass
+
+    def read_entity(entity_name):
+        try:
+            for rows in export_row_batches(entity_name, COLLECTIONS[entity_name]):
+                if stopped.is_set():
+                    return
+                put((entity_name, rows))
+        finally:
+            put((entity_name, None))
+
+    futures = [export_executor.submit(read_entity, entity_name) for entity_name in EXPORTS]
+    try:
+        remaining = len(futures)
+        while remaining:
+            entity_name, rows = batches.get()
+            if rows is None:
+                remaining -= 1
+            else:
+                sheets[entity_name].write_rows(rows)
+    finally:
+        stopped.set()
+    # Surfaces a failed read
+    for future in futures:
+        future.result()
+    for sheet in sheets.values():
+        sheet.finish()
+    workbook.close()
+
+# Export cache
+# The last workbook of each entity stays on disk, named after the collection version it was
+# built from. Writes schedule a debounced rebuild, so downloads are normally a plain file send.
+EXPORT_CACHE_DIR = os.environ.get('EXPORT_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'fest-sponsor-exports'))
+EXPORT_REBUILD_DELAY = float(os.environ.get('EXPORT_REBUILD_DELAY', 5))
+EXPORT_REBUILD_MAX_DELAY = 60
+
+class ExportCache:
+    def __init__(self, directory):
+        self.directory = directory
+        self.build_locks = {name: threading.Lock() for name in list(EXPORTS) + [COMBINED_EXPORT]}
+        self.timers = {}
+        self.timer_lock = threading.Lock()
+
+    def prefix(self, entity_name):
+        return f"{app.config['DB_NAME']}-{entity_name}-"
+
+    def version(self, entity_name):
+        if entity_name == COMBINED_EXPORT:
+            return '-'.join(str(get_collection_version(name)) for name in EXPORTS)
+        return get_collection_version(entity_name)
+
+    def path(self, entity_name, version):
+        return os.path.join(self.directory, f'{self.prefix(entity_name)}{version}.xlsx')
+
+    def cached_files(self, entity_name):
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [os.path.join(self.directory, name) for name in names if name.startswith(self.prefix(entity_name)) and name.endswith('.xlsx')]
+
+    def build(self, entity_name):
+        """Path of the workbook for the current version, building it first if no worker has yet"""
+        with self.build_locks[entity_name]:
+            # Read the version first, so a file never claims to be newer than its contents
+            version = self.version(entity_name)
+            path = self.path(entity_name, version)
+            if os.path.exists(path):
+                return path
+            os.makedirs(self.directory, exist_ok=True)
+            handle, temporary_path = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+            os.close(handle)
+            try:
+                if entity_name == COMBINED_EXPORT:
+                    write_combined_workbook(temporary_path)
+                else:
+                    write_export_workbook(entity_name, COLLECTIONS[entity_name], temporary_path)
+                # Atomic, so other workers never see a half-written file
+                os.replace(temporary_path, path)
+            except Exception:
+                os.remove(temporary_path)
+                raise
+            for old_path in self.cached_files(entity_name):
+                if old_path != path:
+                    try:
+                        os.remove(old_path)
+                    except OSError:
+                        pass
+            return path
+
+    def schedule(self, entity_name):
+        """Rebuild in the background once writes pause, for entities that have been downloaded on this host"""
+        if not self.cached_files(entity_name):
+            return
+        now = time.monotonic()
+        with self.timer_lock:
+            pending = self.timers.get(entity_name)
+            if pending:
+                timer, first_scheduled = pending
+                # A steady stream of writes still gets a rebuild every EXPORT_REBUILD_MAX_DELAY seconds
+                if now - first_scheduled >= EXPORT_REBUILD_MAX_DELAY:
+                    return
+                timer.cancel()
+            else:
+                first_scheduled = now
+            timer = threading.Timer(EXPORT_REBUILD_DELAY, self.rebuild, args=(entity_name,))
+            timer.daemon = True
+            self.timers[entity_name] = (timer, first_scheduled)
+            timer.start()
+
+    def rebuild(self, entity_name):
+        with self.timer_lock:
+            self.timers.pop(entity_name, None)
+        try:
+            self.build(entity_name)
+        except Exception as e:
+            app.logger.warning('Could not rebuild the %s export: %s', entity_name, e)
+
+    def response(self, entity_name):
+        """Send the cached workbook with Last-Modified, answering If-Modified-Since with 304"""
+        download_name = COMBINED_EXPORT_DOWNLOAD_NAME if entity_name == COMBINED_EXPORT else EXPORTS[entity_name][1]
+        for attempt in range(2):
+            path = self.build(entity_name)
+            try:
+                export_file = open(path, 'rb')
+                break
+            except FileNotFoundError:
+                # Replaced by a newer version between the build and the open
+                if attempt:
+                    raise
+        return send_file(
+            export_file,
+            mimetype=EXPORT_MIMETYPE,
+            as_attachment=True,
+            download_name=download_name,
+            last_modified=os.fstat(export_file.fileno()).st_mtime,
+            conditional=True,
+            etag=False,
+            max_age=0
+        )
+
+export_cache = ExportCache(EXPORT_CACHE_DIR)
+
+FIELD_NAME_PATTERN = re.compile(r'^[A-Za-z_][\w.]*$')
+
+def parse_projection(fields):
+    """Map a comma-separated ?fields= value to a Mongo projection, hiding internal keys by default"""
+    names = [name.strip() for name in (fields or '').split(',')]
+    names = [name for name in names if FIELD_NAME_PATTERN.match(name) and name not in DERIVED_FIELDS]
+    if not names:
+        return {field: 0 for field in DERIVED_FIELDS}
+    return {name: 1 for name in names}
+
+# Sponsor search only shows other roles these fields; contacts stay with the admin
+SPONSOR_SEARCH_FIELDS = ['company_name', 'previous_sponsor', 'website']
+
+def sponsor_search_projection(fields, is_admin):
+    """The ?fields= projection for sponsor search, narrowed to SPONSOR_SEARCH_FIELDS for non-admins"""
+    projection = parse_projection(fields)
+    if is_admin:
+        return projection
+    names = [name for name, included in projection.items() if included and name in SPONSOR_SEARCH_FIELDS]
+    return {name: 1 for name in names or SPONSOR_SEARCH_FIELDS}
+
+def load_document(collection, document_id, fields):
+    """Fetch one document ready for JSON, or {} when it does not exist (so misses are cached too)"""
+    document = collection.find_one({'_id': ObjectId(document_id)}, parse_projection(fields))
+    return document or {}
+
+def load_all_documents(collection, fields=None):
+    return list(collection.find({}, parse_projection(fields)).sort('created_at', -1))
+
+def conditional_json(payload):
+    """jsonify with a content ETag, answering 304 when the client already has this version"""
+    response = jsonify(payload)
+    response.add_etag()
+    return response.make_conditional(request)
+
+COLLECTIONS = {
+    'sponsors': sponsors_collection,
+    'alumni': alumni_collection,
+    'speakers': speakers_collection,
+}
+
+# Read-through cache
+# Entries live in a bounded LRU with a TTL. Each namespace has a generation number that writes bump.
+# In-process keys also include the collection version from MongoDB ('stats' includes all of them),
+# re-read at most every CACHE_VERSION_CHECK seconds, so another worker's write retires them too.
+# Set CACHE_REDIS_URL to share entries and generations between gunicorn workers.
+CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 1024))
+CACHE_TTL = int(os.environ.get('CACHE_TTL', 60))
+CACHE_VERSION_CHECK = float(os.environ.get('CACHE_VERSION_CHECK', 2))
+CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+STATS_CACHE_TTL = 60
+
+class LocalCacheBackend:
+    """Bounded LRU with per-entry expiry, private to this process"""
+    name = 'local'
+    shared = False
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.generations = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self.lock:
+            self.entries[key] = (value, time.monotonic() + ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def get_generation(self, namespace):
+        with self.lock:
+            return self.generations.get(namespace, 0)
+
+    def bump_generation(self, namespace):
+        with self.lock:
+            self.generations[namespace] = self.generations.get(namespace, 0) + 1
+
+    def size(self):
+        with self.lock:
+            return len(self.entries)
+
+class RedisCacheBackend:
+    """Shared backend; eviction follows the server's maxmemory-policy (use allkeys-lru)"""
+    name = 'redis'
+    shared = True
+
+    def __init__(self, url):
+        import redis
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        value = self.client.get(f'cache:{key}')
+        return json_util.loads(value) if value is not None else None
+
+    def set(self, key, value, ttl):
+        self.client.setex(f'cache:{key}', ttl, json_util.dumps(value))
+
+    def delete(self, key):
+        self.client.delete(f'cache:{key}')
+
+    def get_generation(self, namespace):
+        return int(self.client.get(f'cache-generation:{namespace}') or 0)
+
+    def bump_generation(self, namespace):
+        self.client.incr(f'cache-generation:{namespace}')
+
+    def size(self):
+        return self.client.dbsize()
+
+class ReadThroughCache:
+    def __init__(self, backend, ttl):
+        self.backend = backend
+        self.ttl = ttl
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    def count(self, namespace, outcome):
+        with self.lock:
+            counters = self.counters.setdefault(namespace, {'hits': 0, 'misses': 0, 'errors': 0})
+            counters[outcome] += 1
+
+    def make_key(self, namespace, key):
+        if self.backend.shared:
+            # Every worker's writes bump the shared generation, which is all a key needs
+            return f'{namespace}:{self.backend.get_generation(namespace)}:{key}'
+        versions = get_cached_collection_versions()
+        if namespace == 'stats':
+            version = '-'.join(str(versions.get(entity_name, 0)) for entity_name in COLLECTIONS)
+        else:
+            version = versions.get(namespace, 0)
+        return f'{namespace}:{version}:{self.backend.get_generation(namespace)}:{key}'
+
+    def get_or_load(self, namespace, key, loader, ttl=None):
+        """Return the cached value, calling loader() and storing its result on a miss"""
+        try:
+            full_key = self.make_key(namespace, key)
+            value = self.backend.get(full_key)
+        except Exception as e:
+            # A broken shared backend degrades to reading MongoDB directly
+            app.logger.warning('Cache read failed: %s', e)
+            self.count(namespace, 'errors')
+            return loader()
+        if value is not None:
+            self.count(namespace, 'hits')
+            return value
+        self.count(namespace, 'misses')
+        value = loader()
+        try:
+            self.backend.set(full_key, value, ttl or self.ttl)
+        except Exception as e:
+            app.logger.warning('Cache write failed: %s', e)
+            self.count(namespace, 'errors')
+        return value
+
+    def invalidate(self, namespace, key=None):
+        try:
+            if key is None:
+                self.backend.bump_generation(namespace)
+            else:
+                self.backend.delete(self.make_key(namespace, key))
+        except Exception as e:
+            app.logger.warning('Cache invalidation failed: %s', e)
+            self.count(namespace, 'errors')
+
+    def stats(self):
+        with self.lock:
+            namespaces = {namespace: dict(counters) for namespace, counters in self.counters.items()}
+        hits = sum(counters['hits'] for counters in namespaces.values())
+        misses = sum(counters['misses'] for counters in namespaces.values())
+        try:
+            size = self.backend.size()
+        except Exception:
+            size = None
+        return {
+            'backend': self.backend.name,
+            'entries': size,
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': hits / (hits + misses) if hits + misses else 0,
+            'namespaces': namespaces
+        }
+
+def create_cache_backend():
+    if CACHE_REDIS_URL:
+        try:
+            return RedisCacheBackend(CACHE_REDIS_URL)
+        except ImportError:
+            app.logger.warning('CACHE_REDIS_URL is set but the redis package is not installed; using the local cache')
+    return LocalCacheBackend(CACHE_MAX_ENTRIES)
+
+cache = ReadThroughCache(create_cache_backend(), CACHE_TTL)
+
+# Dashboard stats
+def compute_stats():
+    """Collection totals plus a per-category sponsor breakdown from a single $facet pass"""
+    facets = list(sponsors_collection.aggregate([
+        {'$facet': {
+            'total': [{'$count': 'count'}],
+            'categories': [
+                {'$group': {'_id': '$category', 'count': {'$sum': 1}}},
+                {'$sort': {'count': -1}}
+            ]
+        }}
+    ]))[0]
+    return {
+        'sponsors': facets['total'][0]['count'] if facets['total'] else 0,
+        'alumni': alumni_collection.count_documents({}),
+        'speakers': speakers_collection.count_documents({}),
+        'sponsor_categories': [
+            {'category': category['_id'] or 'uncategorized', 'count': category['count']}
+            for category in facets['categories']
+        ]
+    }
+
+def get_stats():
+    return cache.get_or_load('stats', 'dashboard', compute_stats, STATS_CACHE_TTL)
 
+# Collection versions
+# Every write bumps a per-collection counter stored in MongoDB, so all workers agree on it
+def get_collection_version(entity_name):
+    document = versions_collection.find_one({'_id': entity_name})
+    return document['version'] if document else 0
 
+def bump_collection_version(entity_name):
+    document = versions_collection.find_one_and_update(
+        {'_id': entity_name},
+        {'$inc': {'version': 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    if has_request_context() and 'collection_versions' in g:
+        g.collection_versions[entity_name] = document['version']
+    collection_version_state['versions'] = {**collection_version_state['versions'], entity_name: document['version']}
+    return document['version']
+
+collection_version_state = {'versions': {}, 'checked_at': None}
+
+def get_cached_collection_versions():
+    """The request's versions once it has read them, otherwise this process's copy, refreshed
+    every CACHE_VERSION_CHECK seconds, so a cache hit doesn't wait on MongoDB"""
+    if has_request_context() and 'collection_versions' in g:
+        return g.collection_versions
+    checked_at = collection_version_state['checked_at']
+    if checked_at is None or time.monotonic() - checked_at >= CACHE_VERSION_CHECK:
+        versions = {document['_id']: document['version'] for document in versions_collection.find({})}
+        collection_version_state.update(versions=versions, checked_at=time.monotonic())
+    return collection_version_state['versions']
+
+def get_request_collection_versions():
+    """Every collection's version in one read, reused for the rest of the request so the ETag
+    and the cache keys agree"""
+    if has_request_context() and 'collection_versions' in g:
+        return g.collection_versions
+    versions = {document['_id']: document['version'] for document in versions_collection.find({})}
+    collection_version_state.update(versions=versions, checked_at=time.monotonic())
+    if has_request_context():
+        g.collection_versions = versions
+    return versions
+
+def versioned_etag(entity_name):
+    """Strong ETag from the collection version and everything that shapes the response"""
+    request_key = request.full_path + '\n' + request.get_data(as_text=True)
+    digest = hashlib.sha1(request_key.encode()).hexdigest()[:16]
+    return f'{entity_name}-{get_request_collection_versions().get(entity_name, 0)}-{digest}'
+
+def versioned(entity_name):
+    """Answer 304 while the collection is unchanged, without reading any of its documents"""
+    def decorator(f):
+        @functools.wraps(f)
+        def decorated_function(*args, **kwargs):
+            etag = versioned_etag(entity_name)
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return decorated_function
+    return decorator
+
+# Change log
+# Every write logs the documents it touched under the collection version it bumped to,
+# so clients holding that version as a token can fetch just the delta.
+CHANGE_LOG_TTL = int(os.environ.get('CHANGE_LOG_TTL', 7 * 24 * 3600))
+CHANGE_LOG_GAP_GRACE = 30
+CHANGES_MAX_ENTRIES = 1000
+
+def change_log_entries(entity_name, version, updated_ids=(), deleted_ids=()):
+    """Log entries for one write; a write that can't name its documents (an import) asks clients to reload"""
+    now = datetime.utcnow()
+    entries = [{'entity': entity_name, 'version': version, 'document_id': document_id, 'op': 'upsert', 'at': now} for document_id in updated_ids]
+    entries += [{'entity': entity_name, 'version': version, 'document_id': document_id, 'op': 'delete', 'at': now} for document_id in deleted_ids]
+    return entries or [{'entity': entity_name, 'version': version, 'document_id': None, 'op': 'reset', 'at': now}]
+
+def parse_change_token(token):
+    try:
+        since = int(token)
+    except (TypeError, ValueError):
+        raise ValueError('Invalid change token')
+    if since < 0:
+        raise ValueError('Invalid change token')
+    return since
+
+def read_changes(entity_name, since):
+    """Ids upserted and deleted after version `since` and the new token, or None when the client must reload"""
+    current = get_collection_version(entity_name)
+    if since > current:
+        return None, current
+    entries = list(change_log_collection.find(
+        {'entity': entity_name, 'version': {'$gt': since}},
+        {'version': 1, 'document_id': 1, 'op': 1, 'at': 1}
+    ).sort([('version', 1), ('_id', 1)]).limit(CHANGES_MAX_ENTRIES + 1))
+    if len(entries) > CHANGES_MAX_ENTRIES:
+        return None, current
+    changes, token = {}, since
+    for entry in entries:
+        if entry['version'] > token + 1:
+            # A version with no entries yet is a write still in flight; one that never shows up has expired
+            if (datetime.utcnow() - entry['at']).total_seconds() > CHANGE_LOG_GAP_GRACE:
+                return None, current
+            break
+        if entry['op'] == 'reset':
+            return None, current
+        changes[entry['document_id']] = entry['op']
+        token = entry['version']
+    else:
+        # Versions bumped without entries (expired, or written before the log existed)
+        if token < current:
+            return None, current
+    updated_ids = [document_id for document_id, op in changes.items() if op == 'upsert']
+    deleted_ids = [document_id for document_id, op in changes.items() if op == 'delete']
+    return (updated_ids, deleted_ids), token
+
+def changes_response(entity_name, collection):
+    """JSON body for GET /api/<entity>/changes?since=<token>, shaped like the list rows"""
+    since = parse_change_token(request.args.get('since'))
+    changes, token = read_changes(entity_name, since)
+    if changes is None:
+        return jsonify({'token': str(token), 'reset': True, 'changed': [], 'deleted': []})
+    updated_ids, deleted_ids = changes
+    projection = {field: 1 for field in LIST_FIELDS[entity_name]}
+    projection['created_at'] = 1
+    changed = list(collection.find({'_id': {'$in': updated_ids}}, projection).sort(LIST_SORT)) if updated_ids else []
+    found = {document['_id'] for document in changed}
+    # Updated and then deleted in a later write that isn't part of this delta yet
+    deleted_ids += [document_id for document_id in updated_ids if document_id not in found]
+    if entity_name == 'sponsors':
+        changed = [dict({field: document.get(field, '') for field in LIST_FIELDS['sponsors']}, _id=document['_id']) for document in changed]
+    for document in changed:
+        document['_id'] = str(document['_id'])
+    return jsonify({'token': str(token), 'reset': False, 'changed': changed, 'deleted': [str(document_id) for document_id in deleted_ids]})
+
+def invalidate_after_write(entity_name):
+    """Drop this process's derived state for a collection; shared with the async app"""
+    cache.invalidate(entity_name)
+    cache.invalidate('stats')
+    suggest_indexes[entity_name].stale = True
+    export_cache.schedule(entity_name)
+    export_cache.schedule(COMBINED_EXPORT)
+
+def record_write(entity_name, updated_ids=(), deleted_ids=()):
+    """Called by every route that adds, updates or deletes documents, with the ids it touched"""
+    version = bump_collection_version(entity_name)
+    change_log_collection.insert_many(change_log_entries(entity_name, version, updated_ids, deleted_ids))
+    invalidate_after_write(entity_name)
+
+# Typeahead suggestions
+# Each process keeps a sorted array of lowercased names and name words per entity, answers
+# prefix lookups with bisect, and catches up with writes from other workers via the change log.
+SUGGEST_FIELDS = {
+    'sponsors': 'company_name',
+    'alumni': 'ruetian_name',
+    'speakers': 'name',
+}
+SUGGEST_LIMIT = 10
+SUGGEST_MAX_LIMIT = 50
+SUGGEST_SYNC_INTERVAL = 2
+
+def suggest_keys(name):
+    value = ' '.join(name.lower().split())
+    return sorted({value, *tokenize_search_text(value)}) if value else []
+
+class SuggestIndex:
+    def __init__(self, entity_name):
+        self.entity_name = entity_name
+        self.field = SUGGEST_FIELDS[entity_name]
+        self.lock = threading.Lock()
+        self.sync_lock = threading.Lock()
+        self.names = None
+        self.keys = []
+        self.owners = []
+        self.version = 0
+        self.synced_at = 0
+        self.stale = False
+
+    def build(self):
+        # Read the version first, so catching up may repeat a change but never miss one
+        version = get_collection_version(self.entity_name)
+        names, entries = {}, []
+        for document in COLLECTIONS[self.entity_name].find({}, {self.field: 1}):
+            name = str(document.get(self.field) or '').strip()
+            if name:
+                document_id = str(document['_id'])
+                names[document_id] = name
+                entries.extend((key, document_id) for key in suggest_keys(name))
+        entries.sort()
+        with self.lock:
+            self.names = names
+            self.keys = [key for key, _ in entries]
+            self.owners = [owner for _, owner in entries]
+        self.version = version
+        self.synced_at = time.monotonic()
+
+    def remove(self, document_id):
+        name = self.names.pop(document_id, None)
+        for key in suggest_keys(name or ''):
+            position = bisect.bisect_left(self.keys, key)
+            while position < len(self.keys) and self.keys[position] == key:
+                if self.owners[position] == document_id:
+                    del self.keys[position]
+                    del self.owners[position]
+                    break
+                position += 1
+
+    def apply(self, updated_ids, deleted_ids):
+        documents = list(COLLECTIONS[self.entity_name].find({'_id': {'$in': list(updated_ids)}}, {self.field: 1})) if updated_ids else []
+        with self.lock:
+            for document_id in list(deleted_ids) + list(updated_ids):
+                self.remove(str(document_id))
+            for document in documents:
+                name = str(document.get(self.field) or '').strip()
+                if name:
+                    document_id = str(document['_id'])
+                    self.names[document_id] = name
+                    for key in suggest_keys(name):
+                        position = bisect.bisect_right(self.keys, key)
+                        self.keys.insert(position, key)
+                        self.owners.insert(position, document_id)
+
+    def sync(self):
+        """Build on first use, then catch up through the change log after local writes or every few seconds"""
+        if self.names is not None and not self.stale and time.monotonic() - self.synced_at < SUGGEST_SYNC_INTERVAL:
+            return
+        # Once built, a request never waits for another thread's catch-up
+        if not self.sync_lock.acquire(blocking=self.names is None):
+            return
+        try:
+            self.stale = False
+            if self.names is None:
+                self.build()
+                return
+            changes, token = read_changes(self.entity_name, self.version)
+            if changes is None:
+                self.build()
+                return
+            self.apply(*changes)
+            self.version = token
+            self.synced_at = time.monotonic()
+        finally:
+            self.sync_lock.release()
+
+    def suggest(self, prefix, limit=SUGGEST_LIMIT):
+        """Names with a word or the whole name starting with the prefix, whole-name matches first"""
+        prefix = ' '.join(prefix.lower().split())
+        if not prefix:
+            return []
+        matches = {}
+        with self.lock:
+            position = bisect.bisect_left(self.keys, prefix)
+            while position < len(self.keys) and self.keys[position].startswith(prefix) and len(matches) < limit * 5:
+                owner = self.owners[position]
+                if owner not in matches:
+                    matches[owner] = self.names[owner]
+                position += 1
+        ranked = sorted(matches.items(), key=lambda item: (not item[1].lower().startswith(prefix), item[1].lower()))
+        return [{'_id': document_id, 'name': name} for document_id, name in ranked[:limit]]
+
+suggest_indexes = {entity_name: SuggestIndex(entity_name) for entity_name in SUGGEST_FIELDS}
+
+def warm_suggest_indexes():
+    """Build every suggestion index in the background so the first keystroke doesn't pay for it"""
+    for index in suggest_indexes.values():
+        try:
+            index.sync()
+        except Exception as e:
+            app.logger.warning('Could not build %s suggestions: %s', index.entity_name, e)
+
+def suggest_response(entity_name):
+    try:
+        limit = min(max(int(request.args.get('limit', SUGGEST_LIMIT)), 1), SUGGEST_MAX_LIMIT)
+    except ValueError:
+        raise ValueError('limit must be a number')
+    index = suggest_indexes[entity_name]
+    index.sync()
+    return jsonify(index.suggest(request.args.get('q', ''), limit))
+
+# Import configuration
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_ERRORS = 500
+# Fields that must be filled, shared by the add routes and the importer
+REQUIRED_FIELDS = {
+    'sponsors': ['company_name', 'website', 'category'],
+    'alumni': [],
+    'speakers': ['name', 'linkedin', 'designation'],
+}
+# Existing documents with the same value are updated instead of duplicated
+IMPORT_KEYS = {
+    'sponsors': 'website_domain',
+    'alumni': 'ruetian_mail',
+    'speakers': 'mail',
+}
+# Spreadsheet column -> document field, the inverse of the export layout
+IMPORT_COLUMNS = {
+    'sponsors': {
+        'Company Name': 'company_name',
+        'Website': 'website',
+        'Previous Sponsor': 'previous_sponsor',
+        'Category': 'category',
+        'Other Category': 'other_category',
+    },
+    'alumni': {
+        'Ruetian Name': 'ruetian_name',
+        'Ruetian Phone': 'ruetian_phone',
+        'Ruetian Mail': 'ruetian_mail',
+        'Ruetian LinkedIn': 'ruetian_linkedin',
+    },
+    'speakers': {
+        'Name': 'name',
+        'Phone': 'phone',
+        'Mail': 'mail',
+        'LinkedIn': 'linkedin',
+        'Designation': 'designation',
+    },
+}
+
+def clean_import_value(value):
+    if value is None:
+        return ''
+    # Spreadsheets turn phone numbers into floats
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+def read_import_rows(upload):
+    """Yield (row number, {column: value}) from an uploaded XLSX or CSV file without loading it whole"""
+    filename = (upload.filename or '').lower()
+    if filename.endswith('.csv'):
+        reader = csv.reader(io.TextIOWrapper(upload.stream, encoding='utf-8-sig', newline=''))
+    elif filename.endswith('.xlsx'):
+        import openpyxl
+        workbook = openpyxl.load_workbook(upload.stream, read_only=True, data_only=True)
+        reader = workbook.worksheets[0].iter_rows(values_only=True)
+    else:
+        raise ValueError('Upload a .xlsx or .csv file')
+    header = None
+    for row_number, values in enumerate(reader, start=1):
+        values = [clean_import_value(value) for value in values]
+        if header is None:
+            header = values
+            continue
+        if any(values):
+            yield row_number, dict(zip(header, values))
+
+PERSON_COLUMNS = [('name', 'Name'), ('phone', 'Phone'), ('mail', 'Mail'), ('linkedin', 'LinkedIn')]
+
+def document_from_import_row(entity_name, row):
+    """Rebuild a document from a sheet row; columns missing from the file leave stored fields alone"""
+    document = {field: row[column] for column, field in IMPORT_COLUMNS[entity_name].items() if column in row}
+    if entity_name == 'sponsors':
+        if any(f'{role} Name' in row for role in CONTACT_ROLES):
+            document['contacts'] = []
+            for role in CONTACT_ROLES:
+                contact = {key: row.get(f'{role} {column}', '') for key, column in PERSON_COLUMNS}
+                if any(contact.values()):
+                    contact['role'] = role
+                    document['contacts'].append(contact)
+        if 'Ruetian 1 Name' in row:
+            document['ruetians'] = []
+            for i in range(1, MAX_EXPORT_RUETIANS + 1):
+                ruetian = {key: row.get(f'Ruetian {i} {column}', '') for key, column in PERSON_COLUMNS}
+                if any(ruetian.values()):
+                    document['ruetians'].append(ruetian)
+    return document
+
+def write_import_batch(entity_name, collection, operations, row_numbers, summary, keys):
+    try:
+        result = collection.bulk_write(operations, ordered=False)
+        details = result.bulk_api_result
+    except BulkWriteError as e:
+        details = e.details
+        for error in details.get('writeErrors', []):
+            summary['errors'].append({'row': row_numbers[error['index']], 'message': error.get('errmsg', 'Write failed')})
+    summary['inserted'] += details.get('nInserted', 0) + details.get('nUpserted', 0)
+    summary['updated'] += details.get('nModified', 0)
+    if keys:
+        # An upsert sets only the columns in the file, so derived fields are rebuilt from the stored documents
+        clauses = [{field: {'$in': [value for key_field, value in keys if key_field == field]}} for field in {field for field, _ in keys}]
+        refresh_search_keys(collection, entity_name, [document['_id'] for document in collection.find({'$or': clauses}, {'_id': 1})])
+
+def run_import(entity_name, collection, upload):
+    """Validate and write an uploaded sheet in unordered batches, upserting on the entity's key field"""
+    key_field = IMPORT_KEYS[entity_name]
+    summary = {'rows': 0, 'inserted': 0, 'updated': 0, 'errors': []}
+    operations, row_numbers, batch_keys = [], [], set()
+    now = datetime.utcnow()
+    username = session.get('username')
+    for row_number, row in read_import_rows(upload):
+        if summary['rows'] == 0 and not set(row) & set(IMPORT_COLUMNS[entity_name]):
+            raise ValueError('The file does not use the export column layout')
+        summary['rows'] += 1
+        document = document_from_import_row(entity_name, row)
+        missing = [field for field in REQUIRED_FIELDS[entity_name] if not document.get(field)]
+        if missing:
+            if len(summary['errors']) < IMPORT_MAX_ERRORS:
+                summary['errors'].append({'row': row_number, 'message': f'Missing required field: {missing[0]}'})
+            continue
+        on_insert = {'created_at': now, 'created_by': username}
+        key = (key_field, document[key_field]) if document.get(key_field) else None
+        if entity_name == 'sponsors':
+            # Upsert on the normalized domain, so a re-import matches however the URL was written
+            document.update({field: value for field, value in sponsor_match_keys(document).items() if value})
+            if document.get('website_domain'):
+                key = ('website_domain', document['website_domain'])
+            elif document.get('name_key'):
+                # Placeholder and shared-host websites give no domain, so match on the company name,
+                # and only write the website when the sponsor is new
+                key = ('name_key', document['name_key'])
+                on_insert['website'] = document.pop('website')
+        # Two upserts on the same key in one unordered batch could both insert
+        if len(operations) >= IMPORT_BATCH_SIZE or (key and key in batch_keys):
+            write_import_batch(entity_name, collection, operations, row_numbers, summary, batch_keys)
+            operations, row_numbers, batch_keys = [], [], set()
+        if key:
+            batch_keys.add(key)
+            operations.append(UpdateOne(
+                {key[0]: key[1]},
+                {'$set': document, '$setOnInsert': on_insert},
+                upsert=True
+            ))
+        else:
+            document.update(on_insert)
+            document['search_keys'] = build_search_keys(document, entity_name)
+            if entity_name == 'sponsors':
+                document['export_row'] = sponsor_export_row(document)
+            operations.append(InsertOne(document))
+        row_numbers.append(row_number)
+    if operations:
+        write_import_batch(entity_name, collection, operations, row_numbers, summary, batch_keys)
+    if summary['inserted'] or summary['updated']:
+        # Upserts don't report the ids they updated, so clients reload after an import
+        record_write(entity_name)
+    return summary
+
+# Bulk operations
+BULK_MAX_OPERATIONS = 1000
+PROTECTED_FIELDS = ['_id'] + DERIVED_FIELDS
+
+def run_bulk_operations(entity_name, collection, operations):
+    """Apply a batch of delete and $set operations as one unordered bulk_write, with a result per item"""
+    results = [None] * len(operations)
+    writes, positions, document_ids, updated_ids = [], [], [], set()
+    for i, operation in enumerate(operations):
+        action = operation.get('action') if isinstance(operation, dict) else None
+        try:
+            document_id = ObjectId(operation.get('id'))
+        except (InvalidId, TypeError, AttributeError):
+            results[i] = {'index': i, 'success': False, 'message': 'Invalid id'}
+            continue
+        if action == 'delete':
+            writes.append(DeleteOne({'_id': document_id}))
+        elif action == 'update':
+            fields = operation.get('set')
+            if not isinstance(fields, dict):
+                fields = {}
+            fields = {key: value for key, value in fields.items() if key not in PROTECTED_FIELDS}
+            if not fields:
+                results[i] = {'index': i, 'id': str(document_id), 'success': False, 'message': 'Nothing to update'}
+                continue
+            if entity_name == 'sponsors' and 'website' in fields and not str(fields['website'] or '').strip():
+                results[i] = {'index': i, 'id': str(document_id), 'success': False, 'message': 'Website is required'}
+                continue
+            writes.append(UpdateOne({'_id': document_id}, {'$set': fields}))
+            if derived_fields_stale(entity_name, fields):
+                updated_ids.add(document_id)
+        else:
+            results[i] = {'index': i, 'id': str(document_id), 'success': False, 'message': 'Unknown action'}
+            continue
+        positions.append(i)
+        document_ids.append(document_id)
+
+    write_errors = {}
+    if writes:
+        # One indexed read tells found from missing documents per item
+        existing = {document['_id'] for document in collection.find({'_id': {'$in': document_ids}}, {'_id': 1})}
+        try:
+            collection.bulk_write(writes, ordered=False)
+        except BulkWriteError as e:
+            write_errors = {error['index']: error.get('errmsg', 'Write failed') for error in e.details.get('writeErrors', [])}
+        for write_index, (i, document_id) in enumerate(zip(positions, document_ids)):
+            if write_index in write_errors:
+                results[i] = {'index': i, 'id': str(document_id), 'success': False, 'message': write_errors[write_index]}
+            elif document_id not in existing:
+                results[i] = {'index': i, 'id': str(document_id), 'success': False, 'message': f'{entity_name.title()[:-1]} not found'}
+            else:
+                results[i] = {'index': i, 'id': str(document_id), 'success': True}
+
+    succeeded = sum(1 for result in results if result['success'])
+    if succeeded:
+        if updated_ids:
+            refresh_search_keys(collection, entity_name, updated_ids & existing)
+        succeeded_ids = [(operation['action'], ObjectId(result['id'])) for operation, result in zip(operations, results) if result['success']]
+        record_write(
+            entity_name,
+            updated_ids=[document_id for action, document_id in succeeded_ids if action == 'update'],
+            deleted_ids=[document_id for action, document_id in succeeded_ids if action == 'delete']
+        )
+    return {'results': results, 'succeeded': succeeded, 'failed': len(results) - succeeded}
+
+def read_bulk_operations():
+    data = request.get_json(silent=True) or {}
+    operations = data.get('operations')
+    if not isinstance(operations, list) or not operations:
+        raise ValueError('Provide a non-empty list of operations')
+    if len(operations) > BULK_MAX_OPERATIONS:
+        raise ValueError(f'At most {BULK_MAX_OPERATIONS} operations per request')
+    return operations
+
+indexes_ready = False
+
+def create_index_safely(collection, keys, **options):
+    """Build one index, logging a failure instead of letting it stop the others"""
+    try:
+        collection.create_index(keys, **options)
+    except DuplicateKeyError as e:
+        app.logger.warning('Duplicate values in %s block the unique %s index: %s', collection.name, keys, e)
+    except Exception as e:
+        app.logger.warning('Could not create %s index on %s: %s', keys, collection.name, e)
+
+def ensure_indexes():
+    # Each index is built on its own, so duplicate usernames can't leave the entity collections unindexed
+    create_index_safely(users_collection, 'username', unique=True)
+    for collection in COLLECTIONS.values():
+        create_index_safely(collection, 'search_keys')
+        create_index_safely(collection, LIST_SORT)
+    for entity_name, key_field in IMPORT_KEYS.items():
+        create_index_safely(COLLECTIONS[entity_name], key_field)
+    create_index_safely(sponsors_collection, 'name_key')
+    create_index_safely(change_log_collection, [('entity', 1), ('version', 1)])
+    create_index_safely(change_log_collection, 'at', expireAfterSeconds=CHANGE_LOG_TTL)
+
+@app.before_request
+def ensure_indexes_once():
+    global indexes_ready
+    if indexes_ready or request.endpoint in ('healthz', 'readyz', 'static'):
+        return
+    # Only try once per process, so a failing index build doesn't slow every request
+    indexes_ready = True
+    try:
+        ensure_indexes()
+    except Exception as e:
+        app.logger.warning('Could not create indexes: %s', e)
+    threading.Thread(target=warm_suggest_indexes, name='suggest-warmup', daemon=True).start()
+
+@app.cli.command('reindex-search')
+def reindex_search():
+    """Backfill search keys, sponsor match keys and export rows for documents created before they existed"""
+    ensure_indexes()
+    for entity_name, collection in COLLECTIONS.items():
+        updated = 0
+        for documents in batched(collection.find({}, derived_source_projection(entity_name))):
+            collection.bulk_write([
+                UpdateOne({'_id': document['_id']}, {'$set': derived_fields(document, entity_name)})
+                for document in documents
+            ], ordered=False)
+            updated += len(documents)
+        print(f'{entity_name}: {updated} documents reindexed')
+
+@app.cli.command('rebuild-export-rows')
+def rebuild_export_rows():
+    """Recompute every sponsor's stored export row, e.g. after the export columns change"""
+    updated = 0
+    for documents in batched(sponsors_collection.find({}, derived_source_projection('sponsors'))):
+        sponsors_collection.bulk_write([
+            UpdateOne({'_id': document['_id']}, {'$set': {'export_row': sponsor_export_row(document)}})
+            for document in documents
+        ], ordered=False)
+        updated += len(documents)
+    print(f'sponsors: {updated} export rows rebuilt')
+
+def find_duplicate_clusters():
+    """Group sponsors on each match key with $group, then join groups that share a sponsor"""
+    parents, sponsors = {}, {}
+    def find(document_id):
+        while parents[document_id] != document_id:
+            parents[document_id] = parents[parents[document_id]]
+            document_id = parents[document_id]
+        return document_id
+    for field in MATCH_KEY_FIELDS:
+        pipeline = [
+            {'$match': {field: {'$nin': [None, '']}}},
+            {'$group': {
+                '_id': f'${field}',
+                'count': {'$sum': 1},
+                'sponsors': {'$push': {'_id': '$_id', 'company_name': '$company_name', 'website': '$website'}}
+            }},
+            {'$match': {'count': {'$gt': 1}}}
+        ]
+        for group in sponsors_collection.aggregate(pipeline, allowDiskUse=True):
+            ids = [sponsor['_id'] for sponsor in group['sponsors']]
+            for sponsor in group['sponsors']:
+                sponsors[sponsor['_id']] = sponsor
+                parents.setdefault(sponsor['_id'], sponsor['_id'])
+            for document_id in ids[1:]:
+                parents[find(document_id)] = find(ids[0])
+    clusters = {}
+    for document_id in sponsors:
+        clusters.setdefault(find(document_id), []).append(sponsors[document_id])
+    return sorted(clusters.values(), key=len, reverse=True)
+
+@app.cli.command('find-duplicate-sponsors')
+def find_duplicate_sponsors():
+    """List clusters of sponsors sharing a website domain or company-name key"""
+    ensure_indexes()
+    missing = list(sponsors_collection.find({'name_key': {'$exists': False}}, {'_id': 1}))
+    if missing:
+        refresh_search_keys(sponsors_collection, 'sponsors', [document['_id'] for document in missing])
+        print(f'Backfilled match keys for {len(missing)} sponsors')
+    clusters = find_duplicate_clusters()
+    for cluster in clusters:
+        print(f'{len(cluster)} sponsors:')
+        for sponsor in cluster:
+            print(f"  {sponsor['_id']}  {sponsor.get('company_name', '')}  {sponsor.get('website', '')}")
+    print(f'{len(clusters)} duplicate clusters found')
+
+
+# Health checks for the platform; neither needs a session
+@app.route('/healthz')
+def healthz():
+    return jsonify({'status': 'ok'})
+
+@app.route('/readyz')
+def readyz():
+    """Ready once this worker can reach MongoDB"""
+    try:
+        get_mongo_client().admin.command('ping')
+        return jsonify({'status': 'ready'})
+    except Exception as e:
+        return jsonify({'status': 'unavailable', 'error': str(e)}), 503
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus scrape target; needs METRICS_TOKEN as a bearer token, or an admin session"""
+    token = os.environ.get('METRICS_TOKEN')
+    authorized = session.get('role') == 'admin'
+    if token and hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        authorized = True
+    if not authorized:
+        return jsonify({'error': 'Unauthorized'}), 403
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return Response('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
 
 @app.route('/')
 def index():
     if 'user_id' not in session:
         return redirect(url_for('login'))
-    return render_template('dashboard.html')
+    from os import environ
+    is_admin = session.get('username') == environ.get('ADMIN_USERNAME')
+    return render_template('dashboard.html', is_admin=is_admin)
+
+# Login configuration
+# Password hashes are checked on a small thread pool while the request thread waits. Under the
+# Procfile's threaded gunicorn workers, at most LOGIN_HASH_QUEUE of a worker's threads wait on
+# hashing, so a login burst can't take every thread from the API; further attempts get a 503.
+LOGIN_HASH_WORKERS = int(os.environ.get('LOGIN_HASH_WORKERS', 2))
+LOGIN_HASH_QUEUE = int(os.environ.get('LOGIN_HASH_QUEUE', 4))
+LOGIN_HASH_TIMEOUT = 5
+LOGIN_MAX_ATTEMPTS = 5
+LOGIN_MAX_ATTEMPTS_PER_IP = 30
+LOGIN_WINDOW = 300
+LOGIN_THROTTLE_MAX_KEYS = 10000
+
+password_executor = ThreadPoolExecutor(max_workers=LOGIN_HASH_WORKERS, thread_name_prefix='password-hash')
+password_slots = threading.BoundedSemaphore(LOGIN_HASH_QUEUE)
+
+class LoginBusyError(Exception):
+    pass
+
+def verify_password(password_hash, password):
+    """Run check_password_hash off the request thread, refusing work when the pool is saturated"""
+    if not password_slots.acquire(blocking=False):
+        raise LoginBusyError()
+    try:
+        future = password_executor.submit(check_password_hash, password_hash, password)
+    except Exception:
+        password_slots.release()
+        raise
+    future.add_done_callback(lambda _: password_slots.release())
+    try:
+        return future.result(timeout=LOGIN_HASH_TIMEOUT)
+    except FuturesTimeoutError:
+        raise LoginBusyError()
+
+class LoginThrottle:
+    """Fixed-window failure counters per username+IP and per IP, checked before any hashing"""
+
+    def __init__(self):
+        self.failures = {}
+        self.lock = threading.Lock()
+
+    def _count(self, key, now):
+        count, window_start = self.failures.get(key, (0, now))
+        if now - window_start >= LOGIN_WINDOW:
+            return 0
+        return count
+
+    def is_blocked(self, username, ip):
+        now = time.monotonic()
+        with self.lock:
+            return (self._count(('user', username, ip), now) >= LOGIN_MAX_ATTEMPTS
+                    or self._count(('ip', ip), now) >= LOGIN_MAX_ATTEMPTS_PER_IP)
+
+    def record_failure(self, username, ip):
+        now = time.monotonic()
+        with self.lock:
+            if len(self.failures) >= LOGIN_THROTTLE_MAX_KEYS:
+                self.failures = {key: value for key, value in self.failures.items() if now - value[1] < LOGIN_WINDOW}
+            for key in [('user', username, ip), ('ip', ip)]:
+                count, window_start = self.failures.get(key, (0, now))
+                if now - window_start >= LOGIN_WINDOW:
+                    count, window_start = 0, now
+                self.failures[key] = (count + 1, window_start)
+
+    def reset(self, username, ip):
+        with self.lock:
+            self.failures.pop(('user', username, ip), None)
+
+login_throttle = LoginThrottle()
+
+# The .env passwords are hashed once per process, on the first login, instead of
+# comparing plain strings per request
+ENV_PASSWORD_VARIABLES = {'admin': 'ADMIN_PASSWORD', 'moderator': 'NORMAL_PASSWORD'}
+env_password_hashes = {}
+env_password_lock = threading.Lock()
+
+def get_env_password_hash(role):
+    with env_password_lock:
+        if role not in env_password_hashes:
+            password = os.environ.get(ENV_PASSWORD_VARIABLES[role])
+            env_password_hashes[role] = generate_password_hash(password) if password else None
+        return env_password_hashes[role]
+
+def find_login_account(username):
+    """Candidate accounts for a username: the .env admin/moderator first, then the users collection"""
+    admin_username = os.environ.get('ADMIN_USERNAME')
+    moderator_username = os.environ.get('MODERATOR_USERNAME')
+    if username == admin_username and get_env_password_hash('admin'):
+        yield get_env_password_hash('admin'), {'user_id': 'admin', 'username': admin_username, 'role': 'admin'}
+    elif username == moderator_username and get_env_password_hash('moderator'):
+        yield get_env_password_hash('moderator'), {'user_id': 'moderator', 'username': moderator_username, 'role': 'moderator'}
+    user = users_collection.find_one({'username': username}, {'password': 1, 'username': 1, 'role': 1})
+    if user:
+        yield user['password'], {'user_id': str(user['_id']), 'username': user['username'], 'role': user.get('role', 'user')}
 
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         username = request.form['username']
         password = request.form['password']
+        ip = request.remote_addr or ''
 
-        # Always check .env for admin/moderator
-        admin_username = os.environ.get('ADMIN_USERNAME')
-        admin_password = os.environ.get('ADMIN_PASSWORD')
-        moderator_username = os.environ.get('MODERATOR_USERNAME')
-        moderator_password = os.environ.get('NORMAL_PASSWORD')
-
-        if username == admin_username and password == admin_password:
-            session['user_id'] = 'admin'
-            session['username'] = admin_username
-            session['role'] = 'admin'
-            flash("Login successfully!", 'success')
-            return redirect(url_for('index'))
-        elif username == moderator_username and password == moderator_password:
-            session['user_id'] = 'moderator'
-            session['username'] = moderator_username
-            session['role'] = 'moderator'
-            flash("Login successfully!", 'success')
-            return redirect(url_for('index'))
-        else:
-            # Fallback to DB for other users
-            user = users_collection.find_one({'username': username})
-            if user and check_password_hash(user['password'], password):
-                session['user_id'] = str(user['_id'])
-                session['username'] = user['username']
-                session['role'] = user.get('role', 'user')
-                flash("Login successfully!", 'success')
-                return redirect(url_for('index'))
-            else:
-                flash('Invalid username or password!', 'error')
+        if login_throttle.is_blocked(username, ip):
+            flash('Too many login attempts. Please wait a few minutes and try again.', 'error')
+            return render_template('login.html'), 429
+
+        try:
+            for password_hash, account in find_login_account(username):
+                if verify_password(password_hash, password):
+                    login_throttle.reset(username, ip)
+                    session['user_id'] = account['user_id']
+                    session['username'] = account['username']
+                    session['role'] = account['role']
+                    flash("Login successfully!", 'success')
+                    return redirect(url_for('index'))
+        except LoginBusyError:
+            flash('The server is busy. Please try again in a moment.', 'error')
+            return render_template('login.html'), 503
+        login_throttle.record_failure(username, ip)
+        flash('Invalid username or password!', 'error')
     return render_template('login.html')
 
 @app.route('/logout')
@@ -107,11 +2254,11 @@ def login_required(f):
 @login_required
 def get_sponsor_details(sponsor_id):
     try:
-        sponsor = sponsors_collection.find_one({'_id': ObjectId(sponsor_id)})
+        sponsor = cache.get_or_load('sponsors', f'details:{sponsor_id}:{request.args.get("fields", "")}',
+                                    lambda: load_document(sponsors_collection, sponsor_id, request.args.get('fields')))
         if not sponsor:
             return jsonify({'error': 'Sponsor not found'}), 404
-        sponsor['_id'] = str(sponsor['_id'])
-        return jsonify(sponsor)
+        return conditional_json(sponsor)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -147,16 +2294,19 @@ def speakers():
 
 @app.route('/api/sponsors/search', methods=['POST'])
 @login_required
+@versioned('sponsors')
 def search_sponsors():
-    search_term = request.json.get('search_term', '')
-    if search_term:
-        regex = re.compile(re.escape(search_term), re.IGNORECASE)
-        sponsors = list(sponsors_collection.find({
-            '$or': [
-                {'company_name': regex},
-                {'website': regex}
-            ]
-        }))
+    search_term = request.json.get('search_term', '').strip()
+    fields = request.args.get('fields')
+    if search_term and fields:
+        projection = sponsor_search_projection(fields, session.get('role') == 'admin')
+        sponsors = run_search(sponsors_collection, 'sponsors', search_term, projection)
+    elif search_term:
+        sponsors = run_search(sponsors_collection, 'sponsors', search_term, {
+            'company_name': 1,
+            'previous_sponsor': 1,
+            'website': 1
+        })
         # Only return required fields
         filtered = []
         for sponsor in sponsors:
@@ -194,18 +2344,35 @@ def add_sponsor():
             'created_at': datetime.utcnow(),
             'created_by': session.get('username')
         }
+        sponsor_data.update(derived_fields(sponsor_data, 'sponsors'))
+        duplicate = find_duplicate_sponsor(sponsor_data)
+        if duplicate:
+            # on_duplicate=merge folds the submission into the sponsor already stored
+            if request.json.get('on_duplicate') != 'merge':
+                return duplicate_sponsor_response(duplicate)
+            update = sponsor_merge_update(duplicate, sponsor_data)
+            if update:
+                sponsors_collection.update_one({'_id': duplicate['_id']}, update)
+                refresh_search_keys(sponsors_collection, 'sponsors', [duplicate['_id']])
+                record_write('sponsors', updated_ids=[duplicate['_id']])
+            return jsonify({'success': True, 'merged': True, 'message': f"Merged into existing sponsor {duplicate.get('company_name', '')}", 'id': str(duplicate['_id'])})
         result = sponsors_collection.insert_one(sponsor_data)
+        record_write('sponsors', updated_ids=[result.inserted_id])
         return jsonify({'success': True, 'message': 'Sponsor added successfully', 'id': str(result.inserted_id)})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
 
 @app.route('/api/sponsors/list')
 @login_required
+@versioned('sponsors')
 def list_sponsors():
     if session.get('role') != 'admin':
         return jsonify({'error': 'Unauthorized'}), 403
     try:
-        sponsors = list(sponsors_collection.find().sort('created_at', -1))
+        change_token = get_collection_version('sponsors')
+        sponsors, next_cursor = fetch_page(sponsors_collection, 'sponsors', request.args)
+        if request.args.get('fields'):
+            return page_response(sponsors, next_cursor, change_token)
         filtered = []
         for sponsor in sponsors:
             filtered.append({
@@ -215,133 +2382,54 @@ def list_sponsors():
                 'ruetian_name': sponsor.get('ruetian_name', ''),
                 'category': sponsor.get('category', '')
             })
-        return jsonify(filtered)
+        return page_response(filtered, next_cursor, change_token)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/sponsors/suggest')
+@login_required
+def suggest_sponsors():
+    try:
+        return suggest_response('sponsors')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/sponsors/changes')
+@login_required
+def sponsor_changes():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    try:
+        return changes_response('sponsors', sponsors_collection)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-from flask import send_file
-import io
-import pandas as pd
 @app.route('/api/sponsors/download')
 @login_required
+@versioned('sponsors')
 def download_sponsors():
     if session.get('role') != 'admin':
         return jsonify({'error': 'Unauthorized'}), 403
     try:
-        sponsors = list(sponsors_collection.find().sort('created_at', -1))
-        data = []
-        for sponsor in sponsors:
-            # Initialize contact fields
-            contact_data = {
-                'CEO Name': '',
-                'CEO Phone': '',
-                'CEO Mail': '',
-                'CEO LinkedIn': '',
-                'CTO Name': '',
-                'CTO Phone': '',
-                'CTO Mail': '',
-                'CTO LinkedIn': '',
-                'Brand Manager Name': '',
-                'Brand Manager Phone': '',
-                'Brand Manager Mail': '',
-                'Brand Manager LinkedIn': '',
-                'Sponsor Manager Name': '',
-                'Sponsor Manager Phone': '',
-                'Sponsor Manager Mail': '',
-                'Sponsor Manager LinkedIn': '',
-                'HR Name': '',
-                'HR Phone': '',
-                'HR Mail': '',
-                'HR LinkedIn': ''
-            }
-            
-            # Fill contact data from contacts array
-            if sponsor.get('contacts'):
-                for contact in sponsor['contacts']:
-                    role = contact.get('role', '')
-                    name = contact.get('name', '')
-                    phone = contact.get('phone', '')
-                    mail = contact.get('mail', '')
-                    linkedin = contact.get('linkedin', '')
-                    
-                    if role == 'CEO':
-                        contact_data['CEO Name'] = name
-                        contact_data['CEO Phone'] = phone
-                        contact_data['CEO Mail'] = mail
-                        contact_data['CEO LinkedIn'] = linkedin
-                    elif role == 'CTO':
-                        contact_data['CTO Name'] = name
-                        contact_data['CTO Phone'] = phone
-                        contact_data['CTO Mail'] = mail
-                        contact_data['CTO LinkedIn'] = linkedin
-                    elif role == 'Brand Manager':
-                        contact_data['Brand Manager Name'] = name
-                        contact_data['Brand Manager Phone'] = phone
-                        contact_data['Brand Manager Mail'] = mail
-                        contact_data['Brand Manager LinkedIn'] = linkedin
-                    elif role == 'Sponsor Manager':
-                        contact_data['Sponsor Manager Name'] = name
-                        contact_data['Sponsor Manager Phone'] = phone
-                        contact_data['Sponsor Manager Mail'] = mail
-                        contact_data['Sponsor Manager LinkedIn'] = linkedin
-                    elif role == 'HR':
-                        contact_data['HR Name'] = name
-                        contact_data['HR Phone'] = phone
-                        contact_data['HR Mail'] = mail
-                        contact_data['HR LinkedIn'] = linkedin
-            
-            # Initialize ruetian fields (up to 5 ruetians)
-            ruetian_data = {}
-            for i in range(1, 6):  # Support up to 5 ruetians
-                ruetian_data[f'Ruetian {i} Name'] = ''
-                ruetian_data[f'Ruetian {i} Phone'] = ''
-                ruetian_data[f'Ruetian {i} Mail'] = ''
-                ruetian_data[f'Ruetian {i} LinkedIn'] = ''
-            
-            # Fill ruetian data from ruetians array
-            if sponsor.get('ruetians'):
-                for idx, ruetian in enumerate(sponsor['ruetians'][:5]):  # Limit to 5 ruetians
-                    num = idx + 1
-                    ruetian_data[f'Ruetian {num} Name'] = ruetian.get('name', '')
-                    ruetian_data[f'Ruetian {num} Phone'] = ruetian.get('phone', '')
-                    ruetian_data[f'Ruetian {num} Mail'] = ruetian.get('mail', '')
-                    ruetian_data[f'Ruetian {num} LinkedIn'] = ruetian.get('linkedin', '')
-            
-            # Combine all data
-            row_data = {
-                'Company Name': sponsor.get('company_name', ''),
-                'Website': sponsor.get('website', ''),
-                'Previous Sponsor': sponsor.get('previous_sponsor', ''),
-                'Category': sponsor.get('category', ''),
-                'Other Category': sponsor.get('other_category', ''),
-            }
-            
-            # Add contact data
-            row_data.update(contact_data)
-            
-            # Add ruetian data
-            row_data.update(ruetian_data)
-            
-            # Add metadata
-            row_data.update({
-                'Created At': sponsor.get('created_at', '').strftime('%Y-%m-%d %H:%M:%S') if sponsor.get('created_at') else '',
-                'Created By': sponsor.get('created_by', '')
-            })
-            
-            data.append(row_data)
-        
-        df = pd.DataFrame(data)
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, index=False, sheet_name='Sponsors')
-            
-            # Auto-adjust column widths
-            worksheet = writer.sheets['Sponsors']
-            for i, col in enumerate(df.columns):
-                max_length = max(df[col].astype(str).map(len).max(), len(col))
-                worksheet.set_column(i, i, min(max_length + 2, 50))  # Max width of 50
-        
-        output.seek(0)
-        return send_file(output, download_name='sponsors_list.xlsx', as_attachment=True, mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+        return export_cache.response('sponsors')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/export/all')
+@login_required
+def download_all():
+    from os import environ
+    admin_username = environ.get('ADMIN_USERNAME')
+    # Includes alumni and speakers, so only the env admin
+    if session.get('username') != admin_username:
+        return jsonify({'error': 'Unauthorized'}), 403
+    try:
+        return export_cache.response(COMBINED_EXPORT)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -349,12 +2437,69 @@ def download_sponsors():
 @login_required
 def count_sponsors():
     try:
-        count = sponsors_collection.count_documents({})
+        count = cache.get_or_load('sponsors', 'count', lambda: sponsors_collection.count_documents({}))
         return jsonify({'count': count})
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/sponsors/import', methods=['POST'])
+@login_required
+def import_sponsors():
+    if session.get('role') != 'admin':
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+    if 'file' not in request.files:
+        return jsonify({'success': False, 'message': 'No file uploaded'}), 400
+    try:
+        summary = run_import('sponsors', sponsors_collection, request.files['file'])
+        return jsonify({'success': True, **summary})
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@app.route('/api/sponsors/bulk', methods=['POST'])
+@login_required
+def bulk_sponsors():
+    if session.get('role') != 'admin':
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+    try:
+        summary = run_bulk_operations('sponsors', sponsors_collection, read_bulk_operations())
+        return jsonify({'success': True, **summary})
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@app.route('/api/cache/stats')
+@login_required
+def cache_stats():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    return jsonify(cache.stats())
+
+@app.route('/api/admin/slow-queries')
+@login_required
+def slow_queries():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    try:
+        limit = int(request.args.get('limit', 50))
+    except ValueError:
+        return jsonify({'error': 'Invalid limit'}), 400
+    return jsonify({
+        'threshold_ms': SLOW_QUERY_THRESHOLD_MS,
+        'queries': slow_query_profiler.report(max(1, min(limit, SLOW_QUERY_MAX_SHAPES)))
+    })
+
+@app.route('/api/stats')
+@login_required
+def dashboard_stats():
+    try:
+        return jsonify(get_stats())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/sponsors/delete/<sponsor_id>', methods=['DELETE'])
 @login_required
 def delete_sponsor(sponsor_id):
@@ -364,6 +2509,7 @@ def delete_sponsor(sponsor_id):
         from bson.objectid import ObjectId
         result = sponsors_collection.delete_one({'_id': ObjectId(sponsor_id)})
         if result.deleted_count:
+            record_write('sponsors', deleted_ids=[ObjectId(sponsor_id)])
             return jsonify({'success': True, 'message': 'Sponsor deleted successfully'})
         else:
             return jsonify({'success': False, 'message': 'Sponsor not found'}), 404
@@ -382,11 +2528,27 @@ def update_sponsor(sponsor_id):
         if not website:
             return jsonify({'success': False, 'message': 'Website is required'}), 400
         # CTO Phone is optional, no validation needed
+        for field in DERIVED_FIELDS:
+            update_data.pop(field, None)
+        stored = sponsors_collection.find_one({'_id': ObjectId(sponsor_id)}, {'company_name': 1, 'website': 1})
+        if stored:
+            match_keys = sponsor_match_keys({**stored, **update_data})
+            # Only keys this edit changes are checked, so existing duplicates stay editable
+            current_keys = sponsor_match_keys(stored)
+            changed_keys = {field: value for field, value in match_keys.items() if value != current_keys[field]}
+            duplicate = find_duplicate_sponsor(changed_keys, exclude_id=stored['_id'])
+            if duplicate:
+                return duplicate_sponsor_response(duplicate)
+            update_data.update(match_keys)
         result = sponsors_collection.update_one(
             {'_id': ObjectId(sponsor_id)},
             {'$set': update_data}
         )
         if result.matched_count:
+            # Derived fields first, so an export built for the new version already has the new row
+            if derived_fields_stale('sponsors', update_data):
+                refresh_search_keys(sponsors_collection, 'sponsors', [ObjectId(sponsor_id)])
+            record_write('sponsors', updated_ids=[ObjectId(sponsor_id)])
             return jsonify({'success': True, 'message': 'Sponsor updated successfully'})
         else:
             return jsonify({'success': False, 'message': 'Sponsor not found'}), 404
@@ -399,33 +2561,15 @@ def update_sponsor(sponsor_id):
 def create_entity_routes(entity_name, collection):
     @app.route(f'/api/{entity_name}/search', methods=['POST'], endpoint=f'search_{entity_name}')
     @login_required
+    @versioned(entity_name)
     def search_entity():
         try:
-            search_term = request.json.get('search_term', '')
-            entities = []
+            search_term = request.json.get('search_term', '').strip()
+            fields = request.args.get('fields', '')
             if search_term:
-                regex = re.compile(re.escape(search_term), re.IGNORECASE)
-                if entity_name == 'speakers':
-                    entities = list(collection.find({
-                        '$or': [
-                            {'name': {'$regex': regex}},
-                            {'mail': {'$regex': regex}},
-                            {'linkedin': {'$regex': regex}},
-                            {'designation': {'$regex': regex}}
-                        ]
-                    }))
-                else:
-                    entities = list(collection.find({
-                        '$or': [
-                            {'ruetian_name': {'$regex': regex}},
-                            {'ruetian_mail': {'$regex': regex}},
-                            {'ruetian_linkedin': {'$regex': regex}}
-                        ]
-                    }))
+                entities = run_search(collection, entity_name, search_term, parse_projection(fields))
             else:
-                entities = list(collection.find().sort('created_at', -1))
-            for entity in entities:
-                entity['_id'] = str(entity['_id'])
+                entities = cache.get_or_load(entity_name, f'search:{fields}', lambda: load_all_documents(collection, fields))
             return jsonify(entities)
         except Exception as e:
             return jsonify({'error': str(e)}), 500
@@ -447,19 +2591,22 @@ def create_entity_routes(entity_name, collection):
                 return jsonify({'success': False, 'message': 'Request must be JSON'}), 400
             data = request.get_json()
             # Basic validation for required fields
-            if entity_name == 'speakers':
-                required_fields = ['name', 'linkedin', 'designation']
-                for field in required_fields:
-                    if not data.get(field):
-                        return jsonify({'success': False, 'message': f'Missing required field: {field}'}), 400
+            for field in REQUIRED_FIELDS[entity_name]:
+                if not data.get(field):
+                    return jsonify({'success': False, 'message': f'Missing required field: {field}'}), 400
+            data.setdefault('created_at', datetime.utcnow())
+            data.setdefault('created_by', session.get('username'))
+            data['search_keys'] = build_search_keys(data, entity_name)
             # Insert into collection
             result = collection.insert_one(data)
+            record_write(entity_name, updated_ids=[result.inserted_id])
             return jsonify({'success': True, 'message': f'{entity_name.title()[:-1]} added successfully', 'id': str(result.inserted_id)})
         except Exception as e:
             return jsonify({'success': False, 'message': str(e)}), 500
 
     @app.route(f'/api/{entity_name}/list', endpoint=f'list_{entity_name}')
     @login_required
+    @versioned(entity_name)
     def list_entities():
         from os import environ
         admin_username = environ.get('ADMIN_USERNAME')
@@ -468,14 +2615,59 @@ def create_entity_routes(entity_name, collection):
         if entity_name in ['alumni', 'speakers'] and not is_admin:
             return jsonify({'error': 'Unauthorized'}), 403
         try:
-            entities = list(collection.find().sort('created_at', -1))
-            for entity in entities:
-                entity['_id'] = str(entity['_id'])
-            return jsonify(entities)
+            change_token = get_collection_version(entity_name)
+            entities, next_cursor = fetch_page(collection, entity_name, request.args)
+            return page_response(entities, next_cursor, change_token)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    @app.route(f'/api/{entity_name}/suggest', endpoint=f'suggest_{entity_name}')
+    @login_required
+    def suggest_entities():
+        try:
+            return suggest_response(entity_name)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    @app.route(f'/api/{entity_name}/changes', endpoint=f'changes_{entity_name}')
+    @login_required
+    def entity_changes():
+        from os import environ
+        admin_username = environ.get('ADMIN_USERNAME')
+        is_admin = session.get('username') == admin_username
+        # Same access as the list
+        if entity_name in ['alumni', 'speakers'] and not is_admin:
+            return jsonify({'error': 'Unauthorized'}), 403
+        try:
+            return changes_response(entity_name, collection)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+    @app.route(f'/api/{entity_name}/<entity_id>', methods=['GET'], endpoint=f'get_{entity_name}')
+    @login_required
+    def get_entity(entity_id):
+        from os import environ
+        admin_username = environ.get('ADMIN_USERNAME')
+        is_admin = session.get('username') == admin_username
+        # Only admin can read single alumni and speakers, same as list
+        if entity_name in ['alumni', 'speakers'] and not is_admin:
+            return jsonify({'error': 'Unauthorized'}), 403
+        try:
+            entity = cache.get_or_load(entity_name, f'details:{entity_id}:{request.args.get("fields", "")}',
+                                       lambda: load_document(collection, entity_id, request.args.get('fields')))
+            if not entity:
+                return jsonify({'error': f'{entity_name.title()[:-1]} not found'}), 404
+            return conditional_json(entity)
+        except InvalidId:
+            return jsonify({'error': f'Invalid {entity_name.title()[:-1].lower()} id'}), 400
         except Exception as e:
             return jsonify({'error': str(e)}), 500
     @app.route(f'/api/{entity_name}/download', endpoint=f'download_{entity_name}')
     @login_required
+    @versioned(entity_name)
     def download_entities():
         from os import environ
         admin_username = environ.get('ADMIN_USERNAME')
@@ -484,55 +2676,51 @@ def create_entity_routes(entity_name, collection):
         if entity_name in ['alumni', 'speakers'] and not is_admin:
             return jsonify({'error': 'Unauthorized'}), 403
         try:
-            entities = list(collection.find().sort('created_at', -1))
-            data = []
-            if entity_name == 'alumni':
-                for a in entities:
-                    data.append({
-                        'Ruetian Name': a.get('ruetian_name', ''),
-                        'Ruetian Phone': a.get('ruetian_phone', ''),
-                        'Ruetian Mail': a.get('ruetian_mail', ''),
-                        'Ruetian LinkedIn': a.get('ruetian_linkedin', ''),
-                        'Created At': a.get('created_at', '').strftime('%Y-%m-%d %H:%M:%S') if a.get('created_at') else '',
-                        'Created By': a.get('created_by', '')
-                    })
-                import io
-                import pandas as pd
-                from flask import send_file
-                df = pd.DataFrame(data)
-                output = io.BytesIO()
-                with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                    df.to_excel(writer, index=False, sheet_name='Alumni')
-                output.seek(0)
-                return send_file(output, download_name='alumni_list.xlsx', as_attachment=True, mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-            if entity_name == 'speakers':
-                for s in entities:
-                    data.append({
-                        'Name': s.get('name', ''),
-                        'Phone': s.get('phone', ''),
-                        'Mail': s.get('mail', ''),
-                        'LinkedIn': s.get('linkedin', ''),
-                        'Designation': s.get('designation', ''),
-                        'Created At': s.get('created_at', '').strftime('%Y-%m-%d %H:%M:%S') if s.get('created_at') else '',
-                        'Created By': s.get('created_by', '')
-                    })
-                import io
-                import pandas as pd
-                from flask import send_file
-                df = pd.DataFrame(data)
-                output = io.BytesIO()
-                with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                    df.to_excel(writer, index=False, sheet_name='Speakers')
-                output.seek(0)
-                return send_file(output, download_name='speakers_list.xlsx', as_attachment=True, mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+            return export_cache.response(entity_name)
         except Exception as e:
             return jsonify({'error': str(e)}), 500
 
+    @app.route(f'/api/{entity_name}/import', methods=['POST'], endpoint=f'import_{entity_name}')
+    @login_required
+    def import_entities():
+        from os import environ
+        admin_username = environ.get('ADMIN_USERNAME')
+        is_admin = session.get('username') == admin_username
+        # Imports can overwrite existing records, so they are admin only like update
+        if not is_admin:
+            return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+        if 'file' not in request.files:
+            return jsonify({'success': False, 'message': 'No file uploaded'}), 400
+        try:
+            summary = run_import(entity_name, collection, request.files['file'])
+            return jsonify({'success': True, **summary})
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        except Exception as e:
+            return jsonify({'success': False, 'message': str(e)}), 500
+
+    @app.route(f'/api/{entity_name}/bulk', methods=['POST'], endpoint=f'bulk_{entity_name}')
+    @login_required
+    def bulk_entities():
+        from os import environ
+        admin_username = environ.get('ADMIN_USERNAME')
+        is_admin = session.get('username') == admin_username
+        # Only admin can update or delete alumni and speakers
+        if not is_admin:
+            return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+        try:
+            summary = run_bulk_operations(entity_name, collection, read_bulk_operations())
+            return jsonify({'success': True, **summary})
+        except ValueError as e:
+            return jsonify({'success': False, 'message': str(e)}), 400
+        except Exception as e:
+            return jsonify({'success': False, 'message': str(e)}), 500
+
     @app.route(f'/api/{entity_name}/count', endpoint=f'count_{entity_name}')
     @login_required
     def count_entities():
         try:
-            count = collection.count_documents({})
+            count = cache.get_or_load(entity_name, 'count', lambda: collection.count_documents({}))
             return jsonify({'count': count})
         except Exception as e:
             return jsonify({'error': str(e)}), 500
@@ -550,6 +2738,7 @@ def create_entity_routes(entity_name, collection):
             from bson.objectid import ObjectId
             result = collection.delete_one({'_id': ObjectId(entity_id)})
             if result.deleted_count:
+                record_write(entity_name, deleted_ids=[ObjectId(entity_id)])
                 return jsonify({'success': True, 'message': f'{entity_name.title()[:-1]} deleted successfully'})
             else:
                 return jsonify({'success': False, 'message': f'{entity_name.title()[:-1]} not found'}), 404
@@ -567,11 +2756,16 @@ def create_entity_routes(entity_name, collection):
         try:
             from bson.objectid import ObjectId
             update_data = request.json
+            for field in DERIVED_FIELDS:
+                update_data.pop(field, None)
             result = collection.update_one(
                 {'_id': ObjectId(entity_id)},
                 {'$set': update_data}
             )
             if result.matched_count:
+                if derived_fields_stale(entity_name, update_data):
+                    refresh_search_keys(collection, entity_name, [ObjectId(entity_id)])
+                record_write(entity_name, updated_ids=[ObjectId(entity_id)])
                 return jsonify({'success': True, 'message': f'{entity_name.title()[:-1]} updated successfully'})
             else:
                 return jsonify({'success': False, 'message': f'{entity_name.title()[:-1]} not found'}), 404
@@ -583,5 +2777,11 @@ def create_entity_routes(entity_name, collection):
 create_entity_routes('alumni', alumni_collection)
 create_entity_routes('speakers', speakers_collection)
 
+def create_app(config=None):
+    """Application factory used by gunicorn; MongoDB and the export libraries load lazily per worker"""
+    if config:
+        app.config.update(config)
+    return app
+
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    create_app().run(debug=True, host='0.0.0.0', port=5000)
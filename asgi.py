@@ -0,0 +1,507 @@
+"""Async serving mode.
+
+Serves the JSON API on Quart with PyMongo's async driver, so one process can keep
+hundreds of requests waiting on MongoDB Atlas at once. URLs, sessions and JSON
+responses are the same as the Flask app; any route not implemented here (pages,
+login, exports, imports, bulk operations, stats, change feeds) is passed through to the Flask app.
+
+Run with:  hypercorn asgi:application --bind 0.0.0.0:$PORT
+"""
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import wraps
+
+from bson.errors import InvalidId
+from bson.objectid import ObjectId
+from pymongo import AsyncMongoClient, ReturnDocument
+from quart import Quart, Response, g, jsonify, redirect, request, session
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+from werkzeug.exceptions import HTTPException
+
+import app as flask_module
+from app import (
+    DERIVED_FIELDS, LIST_SORT, REQUIRED_FIELDS, SEARCH_CANDIDATE_LIMIT, SEARCH_LIMIT,
+    build_cursor_query, build_regex_search_query, build_search_keys, build_search_query, change_log_entries,
+    derived_fields, derived_fields_stale, derived_source_projection, duplicate_sponsor_query, encode_cursor,
+    invalidate_after_write, list_projection, parse_page_size, parse_projection, rank_search_results,
+    request_duration, response_size, search_projection, sponsor_match_keys, sponsor_merge_update,
+    sponsor_search_projection,
+)
+
+flask_app = flask_module.create_app()
+# Static files stay on Flask, which sets the long-lived cache headers on built assets
+quart_app = Quart(__name__, static_folder=None)
+quart_app.secret_key = flask_app.secret_key
+
+mongo_state = {'client': None}
+
+@quart_app.before_serving
+async def connect_mongo():
+    config = flask_app.config
+    mongo_state['client'] = AsyncMongoClient(
+        config['MONGO_URI'],
+        maxPoolSize=config['MONGO_MAX_POOL_SIZE'],
+        minPoolSize=config['MONGO_MIN_POOL_SIZE'],
+        connectTimeoutMS=config['MONGO_CONNECT_TIMEOUT_MS'],
+        serverSelectionTimeoutMS=config['MONGO_SERVER_SELECTION_TIMEOUT_MS'],
+        socketTimeoutMS=config['MONGO_SOCKET_TIMEOUT_MS'],
+        event_listeners=[flask_module.mongo_command_metrics, flask_module.slow_query_profiler]
+    )
+    try:
+        await asyncio.to_thread(flask_module.ensure_indexes)
+    except Exception as e:
+        quart_app.logger.warning('Could not create indexes: %s', e)
+    threading.Thread(target=flask_module.warm_suggest_indexes, name='suggest-warmup', daemon=True).start()
+
+@quart_app.after_serving
+async def close_mongo():
+    if mongo_state['client'] is not None:
+        await mongo_state['client'].close()
+
+def get_collection(name):
+    return mongo_state['client'][flask_app.config['DB_NAME']][name]
+
+def is_env_admin():
+    return session.get('username') == os.environ.get('ADMIN_USERNAME')
+
+def entity_label(entity_name):
+    return entity_name.title()[:-1]
+
+# Request metrics, recorded into the same histograms as the Flask hooks so /metrics covers both apps
+@quart_app.before_request
+async def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@quart_app.after_request
+async def record_request_metrics(response):
+    started = g.get('request_started')
+    if started is not None:
+        endpoint = request.endpoint or 'unmatched'
+        request_duration.observe((endpoint, request.method, response.status_code), time.perf_counter() - started)
+        if response.content_length is not None:
+            response_size.observe((endpoint,), response.content_length)
+    return response
+
+# Session handling, identical to the Flask app
+@quart_app.before_request
+async def validate_env_session():
+    if 'role' in session:
+        if session['role'] == 'admin' and session.get('username') != os.environ.get('ADMIN_USERNAME'):
+            session.clear()
+            return redirect('/login')
+        if session['role'] == 'moderator' and session.get('username') != os.environ.get('MODERATOR_USERNAME'):
+            session.clear()
+            return redirect('/login')
+
+def login_required(f):
+    @wraps(f)
+    async def decorated_function(*args, **kwargs):
+        if 'user_id' not in session:
+            return redirect('/login')
+        return await f(*args, **kwargs)
+    return decorated_function
+
+# Collection versions and ETags
+async def get_collection_version(entity_name):
+    document = await get_collection('collection_versions').find_one({'_id': entity_name})
+    return document['version'] if document else 0
+
+async def record_write(entity_name, updated_ids=(), deleted_ids=()):
+    document = await get_collection('collection_versions').find_one_and_update(
+        {'_id': entity_name},
+        {'$inc': {'version': 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    await get_collection('change_log').insert_many(change_log_entries(entity_name, document['version'], updated_ids, deleted_ids))
+    await asyncio.to_thread(invalidate_after_write, entity_name)
+
+def versioned(entity_name):
+    """Async counterpart of app.versioned, producing the same ETags"""
+    def decorator(f):
+        @wraps(f)
+        async def decorated_function(*args, **kwargs):
+            body = await request.get_data(as_text=True)
+            request_key = request.full_path + '\n' + body
+            digest = hashlib.sha1(request_key.encode()).hexdigest()[:16]
+            etag = f'{entity_name}-{await get_collection_version(entity_name)}-{digest}'
+            if request.if_none_match.contains_weak(etag):
+                response = Response('', status=304)
+            else:
+                response = await quart_app.make_response(await f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return decorated_function
+    return decorator
+
+async def conditional_json(payload):
+    response = jsonify(payload)
+    etag = hashlib.sha1(await response.get_data()).hexdigest()
+    if request.if_none_match.contains_weak(etag):
+        response = Response('', status=304)
+    response.set_etag(etag)
+    return response
+
+# Query helpers
+async def run_search(collection, entity_name, search_term, projection=None):
+    projection, ranking_only = search_projection(entity_name, projection)
+    documents = []
+    query = build_search_query(search_term)
+    if query is not None:
+        documents = await collection.find(query, projection).limit(SEARCH_CANDIDATE_LIMIT).to_list(None)
+    if not documents:
+        documents = await collection.find(build_regex_search_query(search_term, entity_name), projection).limit(SEARCH_CANDIDATE_LIMIT).to_list(None)
+    documents = rank_search_results(documents, search_term, entity_name)[:SEARCH_LIMIT]
+    for document in documents:
+        for field in ranking_only:
+            document.pop(field, None)
+    return documents
+
+async def fetch_page(collection, entity_name, args):
+    page_size = parse_page_size(args.get('limit'))
+    query = build_cursor_query(args['cursor']) if args.get('cursor') else {}
+    projection = list_projection(entity_name, args.get('fields'))
+    documents = await collection.find(query, projection).sort(LIST_SORT).limit(page_size + 1).to_list(None)
+    next_cursor = None
+    if len(documents) > page_size:
+        documents = documents[:page_size]
+        next_cursor = encode_cursor(documents[-1])
+    return documents, next_cursor
+
+def page_response(items, next_cursor, change_token):
+    response = jsonify(items)
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    response.headers['X-Change-Token'] = str(change_token)
+    return response
+
+async def refresh_search_keys(collection, entity_name, document_id):
+    document = await collection.find_one({'_id': document_id}, derived_source_projection(entity_name))
+    if document:
+        await collection.update_one({'_id': document_id}, {'$set': derived_fields(document, entity_name)})
+
+async def find_duplicate_sponsor(match_keys, exclude_id=None):
+    query = duplicate_sponsor_query(match_keys, exclude_id)
+    return await get_collection('sponsors').find_one(query) if query else None
+
+def duplicate_sponsor_response(duplicate):
+    return jsonify({
+        'success': False,
+        'message': f"Sponsor already exists: {duplicate.get('company_name', '')} ({duplicate.get('website', '')})",
+        'duplicate_id': str(duplicate['_id'])
+    }), 409
+
+# Sponsor routes
+@quart_app.route('/api/sponsors/<sponsor_id>', methods=['GET'])
+@login_required
+async def get_sponsor_details(sponsor_id):
+    try:
+        sponsor = await get_collection('sponsors').find_one({'_id': ObjectId(sponsor_id)}, parse_projection(request.args.get('fields')))
+        if not sponsor:
+            return jsonify({'error': 'Sponsor not found'}), 404
+        sponsor['_id'] = str(sponsor['_id'])
+        return await conditional_json(sponsor)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@quart_app.route('/api/sponsors/search', methods=['POST'])
+@login_required
+@versioned('sponsors')
+async def search_sponsors():
+    data = await request.get_json()
+    search_term = data.get('search_term', '').strip()
+    sponsors = []
+    if search_term and request.args.get('fields'):
+        projection = sponsor_search_projection(request.args.get('fields'), session.get('role') == 'admin')
+        sponsors = await run_search(get_collection('sponsors'), 'sponsors', search_term, projection)
+        for sponsor in sponsors:
+            sponsor['_id'] = str(sponsor['_id'])
+    elif search_term:
+        found = await run_search(get_collection('sponsors'), 'sponsors', search_term, {
+            'company_name': 1,
+            'previous_sponsor': 1,
+            'website': 1
+        })
+        sponsors = [{
+            'company_name': sponsor.get('company_name', ''),
+            'previous_sponsor': sponsor.get('previous_sponsor', ''),
+            'website': sponsor.get('website', '')
+        } for sponsor in found]
+    return jsonify(sponsors)
+
+@quart_app.route('/api/sponsors/add', methods=['POST'])
+@login_required
+async def add_sponsor():
+    if session.get('role') not in ['admin', 'moderator']:
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+    data = await request.get_json()
+    company_name = data.get('company_name', '').strip()
+    website = data.get('website', '').strip()
+    category = data.get('category', '').strip()
+    if not company_name or not website or not category:
+        return jsonify({'success': False, 'message': 'Missing required fields'}), 400
+    try:
+        sponsor_data = {
+            'company_name': company_name,
+            'previous_sponsor': data.get('previous_sponsor', ''),
+            'website': website,
+            'contacts': data.get('contacts', []),
+            'ruetians': data.get('ruetians', []),
+            'category': category,
+            'other_category': data.get('other_category', ''),
+            'created_at': datetime.utcnow(),
+            'created_by': session.get('username')
+        }
+        sponsor_data.update(derived_fields(sponsor_data, 'sponsors'))
+        duplicate = await find_duplicate_sponsor(sponsor_data)
+        if duplicate:
+            if data.get('on_duplicate') != 'merge':
+                return duplicate_sponsor_response(duplicate)
+            update = sponsor_merge_update(duplicate, sponsor_data)
+            if update:
+                await get_collection('sponsors').update_one({'_id': duplicate['_id']}, update)
+                await refresh_search_keys(get_collection('sponsors'), 'sponsors', duplicate['_id'])
+                await record_write('sponsors', updated_ids=[duplicate['_id']])
+            return jsonify({'success': True, 'merged': True, 'message': f"Merged into existing sponsor {duplicate.get('company_name', '')}", 'id': str(duplicate['_id'])})
+        result = await get_collection('sponsors').insert_one(sponsor_data)
+        await record_write('sponsors', updated_ids=[result.inserted_id])
+        return jsonify({'success': True, 'message': 'Sponsor added successfully', 'id': str(result.inserted_id)})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@quart_app.route('/api/sponsors/list')
+@login_required
+@versioned('sponsors')
+async def list_sponsors():
+    if session.get('role') != 'admin':
+        return jsonify({'error': 'Unauthorized'}), 403
+    try:
+        change_token = await get_collection_version('sponsors')
+        sponsors, next_cursor = await fetch_page(get_collection('sponsors'), 'sponsors', request.args)
+        if request.args.get('fields'):
+            for sponsor in sponsors:
+                sponsor['_id'] = str(sponsor['_id'])
+            return page_response(sponsors, next_cursor, change_token)
+        return page_response([{
+            '_id': str(sponsor.get('_id', '')),
+            'company_name': sponsor.get('company_name', ''),
+            'website': sponsor.get('website', ''),
+            'ruetian_name': sponsor.get('ruetian_name', ''),
+            'category': sponsor.get('category', '')
+        } for sponsor in sponsors], next_cursor, change_token)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@quart_app.route('/api/sponsors/count')
+@login_required
+async def count_sponsors():
+    try:
+        return jsonify({'count': await get_collection('sponsors').count_documents({})})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@quart_app.route('/api/sponsors/delete/<sponsor_id>', methods=['DELETE'])
+@login_required
+async def delete_sponsor(sponsor_id):
+    if session.get('role') != 'admin':
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+    try:
+        result = await get_collection('sponsors').delete_one({'_id': ObjectId(sponsor_id)})
+        if result.deleted_count:
+            await record_write('sponsors', deleted_ids=[ObjectId(sponsor_id)])
+            return jsonify({'success': True, 'message': 'Sponsor deleted successfully'})
+        return jsonify({'success': False, 'message': 'Sponsor not found'}), 404
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+@quart_app.route('/api/sponsors/update/<sponsor_id>', methods=['PUT'])
+@login_required
+async def update_sponsor(sponsor_id):
+    if session.get('role') != 'admin':
+        return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+    try:
+        update_data = await request.get_json()
+        website = update_data.get('website', '').strip()
+        if not website:
+            return jsonify({'success': False, 'message': 'Website is required'}), 400
+        for field in DERIVED_FIELDS:
+            update_data.pop(field, None)
+        collection = get_collection('sponsors')
+        stored = await collection.find_one({'_id': ObjectId(sponsor_id)}, {'company_name': 1, 'website': 1})
+        if stored:
+            match_keys = sponsor_match_keys({**stored, **update_data})
+            # Only keys this edit changes are checked, so existing duplicates stay editable
+            current_keys = sponsor_match_keys(stored)
+            changed_keys = {field: value for field, value in match_keys.items() if value != current_keys[field]}
+            duplicate = await find_duplicate_sponsor(changed_keys, exclude_id=stored['_id'])
+            if duplicate:
+                return duplicate_sponsor_response(duplicate)
+            update_data.update(match_keys)
+        result = await collection.update_one({'_id': ObjectId(sponsor_id)}, {'$set': update_data})
+        if result.matched_count:
+            if derived_fields_stale('sponsors', update_data):
+                await refresh_search_keys(collection, 'sponsors', ObjectId(sponsor_id))
+            await record_write('sponsors', updated_ids=[ObjectId(sponsor_id)])
+            return jsonify({'success': True, 'message': 'Sponsor updated successfully'})
+        return jsonify({'success': False, 'message': 'Sponsor not found'}), 404
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+# Alumni and speaker routes
+def create_entity_routes(entity_name):
+    @quart_app.route(f'/api/{entity_name}/search', methods=['POST'], endpoint=f'search_{entity_name}')
+    @login_required
+    @versioned(entity_name)
+    async def search_entity():
+        try:
+            data = await request.get_json()
+            search_term = data.get('search_term', '').strip()
+            collection = get_collection(entity_name)
+            projection = parse_projection(request.args.get('fields'))
+            if search_term:
+                entities = await run_search(collection, entity_name, search_term, projection)
+            else:
+                entities = await collection.find({}, projection).sort('created_at', -1).to_list(None)
+            for entity in entities:
+                entity['_id'] = str(entity['_id'])
+            return jsonify(entities)
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+
+    @quart_app.route(f'/api/{entity_name}/add', methods=['POST'], endpoint=f'add_{entity_name}')
+    @login_required
+    async def add_entity():
+        if not (is_env_admin() or session.get('role') == 'moderator'):
+            return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+        try:
+            if not request.is_json:
+                return jsonify({'success': False, 'message': 'Request must be JSON'}), 400
+            data = await request.get_json()
+            for field in REQUIRED_FIELDS[entity_name]:
+                if not data.get(field):
+                    return jsonify({'success': False, 'message': f'Missing required field: {field}'}), 400
+            data.setdefault('created_at', datetime.utcnow())
+            data.setdefault('created_by', session.get('username'))
+            data['search_keys'] = build_search_keys(data, entity_name)
+            result = await get_collection(entity_name).insert_one(data)
+            await record_write(entity_name, updated_ids=[result.inserted_id])
+            return jsonify({'success': True, 'message': f'{entity_label(entity_name)} added successfully', 'id': str(result.inserted_id)})
+        except Exception as e:
+            return jsonify({'success': False, 'message': str(e)}), 500
+
+    @quart_app.route(f'/api/{entity_name}/list', endpoint=f'list_{entity_name}')
+    @login_required
+    @versioned(entity_name)
+    async def list_entities():
+        if not is_env_admin():
+            return jsonify({'error': 'Unauthorized'}), 403
+        try:
+            change_token = await get_collection_version(entity_name)
+            entities, next_cursor = await fetch_page(get_collection(entity_name), entity_name, request.args)
+            for entity in entities:
+                entity['_id'] = str(entity['_id'])
+            return page_response(entities, next_cursor, change_token)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+
+    @quart_app.route(f'/api/{entity_name}/<entity_id>', methods=['GET'], endpoint=f'get_{entity_name}')
+    @login_required
+    async def get_entity(entity_id):
+        if not is_env_admin():
+            return jsonify({'error': 'Unauthorized'}), 403
+        try:
+            entity = await get_collection(entity_name).find_one({'_id': ObjectId(entity_id)}, parse_projection(request.args.get('fields')))
+            if not entity:
+                return jsonify({'error': f'{entity_label(entity_name)} not found'}), 404
+            entity['_id'] = str(entity['_id'])
+            return await conditional_json(entity)
+        except InvalidId:
+            return jsonify({'error': f'Invalid {entity_label(entity_name).lower()} id'}), 400
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+
+    @quart_app.route(f'/api/{entity_name}/count', endpoint=f'count_{entity_name}')
+    @login_required
+    async def count_entities():
+        try:
+            return jsonify({'count': await get_collection(entity_name).count_documents({})})
+        except Exception as e:
+            return jsonify({'error': str(e)}), 500
+
+    @quart_app.route(f'/api/{entity_name}/delete/<entity_id>', methods=['DELETE'], endpoint=f'delete_{entity_name}')
+    @login_required
+    async def delete_entity(entity_id):
+        if not is_env_admin():
+            return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+        try:
+            result = await get_collection(entity_name).delete_one({'_id': ObjectId(entity_id)})
+            if result.deleted_count:
+                await record_write(entity_name, deleted_ids=[ObjectId(entity_id)])
+                return jsonify({'success': True, 'message': f'{entity_label(entity_name)} deleted successfully'})
+            return jsonify({'success': False, 'message': f'{entity_label(entity_name)} not found'}), 404
+        except Exception as e:
+            return jsonify({'success': False, 'message': str(e)}), 500
+
+    @quart_app.route(f'/api/{entity_name}/update/<entity_id>', methods=['PUT'], endpoint=f'update_{entity_name}')
+    @login_required
+    async def update_entity(entity_id):
+        if not is_env_admin():
+            return jsonify({'success': False, 'message': 'Unauthorized'}), 403
+        try:
+            update_data = await request.get_json()
+            for field in DERIVED_FIELDS:
+                update_data.pop(field, None)
+            collection = get_collection(entity_name)
+            result = await collection.update_one({'_id': ObjectId(entity_id)}, {'$set': update_data})
+            if result.matched_count:
+                if derived_fields_stale(entity_name, update_data):
+                    await refresh_search_keys(collection, entity_name, ObjectId(entity_id))
+                await record_write(entity_name, updated_ids=[ObjectId(entity_id)])
+                return jsonify({'success': True, 'message': f'{entity_label(entity_name)} updated successfully'})
+            return jsonify({'success': False, 'message': f'{entity_label(entity_name)} not found'}), 404
+        except Exception as e:
+            return jsonify({'success': False, 'message': str(e)}), 500
+
+create_entity_routes('alumni')
+create_entity_routes('speakers')
+
+# Everything else runs on the Flask app in a pool of worker threads. WsgiToAsgi's default is one
+# shared thread per process, where a long export or import would queue every page load behind it.
+WSGI_FALLBACK_THREADS = int(os.environ.get('WSGI_FALLBACK_THREADS', 16))
+wsgi_executor = ThreadPoolExecutor(max_workers=WSGI_FALLBACK_THREADS, thread_name_prefix='wsgi')
+
+class PooledWsgiToAsgiInstance(WsgiToAsgiInstance):
+    run_wsgi_app = sync_to_async(WsgiToAsgiInstance.__dict__['run_wsgi_app'].func, thread_sensitive=False, executor=wsgi_executor)
+
+class PooledWsgiToAsgi(WsgiToAsgi):
+    async def __call__(self, scope, receive, send):
+        await PooledWsgiToAsgiInstance(self.wsgi_application, self.duplicate_header_limit)(scope, receive, send)
+
+wsgi_fallback = PooledWsgiToAsgi(flask_app)
+
+def is_async_route(scope):
+    """Route by the Flask endpoint the URL resolves to, so both apps agree on every path"""
+    try:
+        endpoint, _ = flask_app.url_map.bind('localhost').match(scope['path'], method=scope['method'])
+    except HTTPException:
+        return False
+    return endpoint in quart_app.view_functions
+
+async def application(scope, receive, send):
+    if scope['type'] == 'http' and not is_async_route(scope):
+        await wsgi_fallback(scope, receive, send)
+    else:
+        await quart_app(scope, receive, send)
@@ -0,0 +1,39 @@
+"""Compare two benchmark result files scenario by scenario
+
+    python benchmarks/compare.py benchmarks/results/before.json benchmarks/results/after.json
+"""
+import json
+import sys
+
+METRICS = ['p50_ms', 'p95_ms', 'p99_ms', 'throughput_rps']
+
+
+def change(before, after):
+    if before in (None, 0) or after is None:
+        return ''
+    return f'{(after - before) / before * 100:+.1f}%'
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        sys.exit(__doc__)
+    with open(argv[0]) as f:
+        before = json.load(f)
+    with open(argv[1]) as f:
+        after = json.load(f)
+    for key in ('scale', 'backend', 'driver', 'concurrency'):
+        if before['meta'].get(key) != after['meta'].get(key):
+            print(f'warning: {key} differs ({before["meta"].get(key)} vs {after["meta"].get(key)})')
+    print(f'{"scenario":<24}' + ''.join(f'{metric:>32}' for metric in METRICS))
+    for name in sorted(set(before['scenarios']) | set(after['scenarios'])):
+        old, new = before['scenarios'].get(name, {}), after['scenarios'].get(name, {})
+        cells = []
+        for metric in METRICS:
+            cells.append(f'{old.get(metric, "-")!s:>9} -> {new.get(metric, "-")!s:>9} {change(old.get(metric), new.get(metric)):>6}')
+        print(f'{name:<24}' + ''.join(f'{cell:>32}' for cell in cells))
+    print(f'{"peak_rss_mb":<24}{before.get("peak_rss_mb")!s:>9} -> {after.get("peak_rss_mb")!s:>9} {change(before.get("peak_rss_mb"), after.get("peak_rss_mb")):>6}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""Seeded generator for realistic sponsor, alumni and speaker documents"""
+import random
+from datetime import datetime, timedelta
+
+SCALES = {'1k': 1000, '10k': 10000, '100k': 100000}
+INSERT_BATCH_SIZE = 1000
+
+CATEGORIES = ['Title', 'Platinum', 'Gold', 'Silver', 'Food', 'Media', 'Others']
+COMPANY_WORDS = [
+    'Bengal', 'Delta', 'Padma', 'Meghna', 'Sonar', 'Green', 'Nova', 'Apex', 'Orbit', 'Pioneer',
+    'Quantum', 'River', 'Summit', 'Vertex', 'Zenith', 'Blue', 'Crescent', 'Falcon', 'Horizon', 'Matrix'
+]
+COMPANY_SUFFIXES = ['Group', 'Limited', 'Technologies', 'Foods', 'Telecom', 'Pharma', 'Textiles', 'Bank', 'Motors', 'Labs']
+FIRST_NAMES = [
+    'Arif', 'Nusrat', 'Tanvir', 'Farhana', 'Rakib', 'Sadia', 'Imran', 'Tasnim', 'Mahmud', 'Jannat',
+    'Sabbir', 'Mim', 'Hasan', 'Sumaiya', 'Rafi', 'Anika', 'Shakil', 'Lamia', 'Towhid', 'Raisa'
+]
+LAST_NAMES = [
+    'Rahman', 'Hossain', 'Islam', 'Ahmed', 'Chowdhury', 'Khan', 'Sarker', 'Uddin', 'Akter', 'Hasan',
+    'Karim', 'Alam', 'Mahmud', 'Roy', 'Das', 'Siddique', 'Bhuiyan', 'Talukder', 'Mollah', 'Kabir'
+]
+DESIGNATIONS = ['Software Engineer', 'Product Manager', 'Professor', 'Founder', 'Data Scientist', 'Head of Marketing', 'CTO', 'Researcher']
+CONTACT_ROLES = ['CEO', 'CTO', 'Brand Manager', 'Sponsor Manager', 'HR']
+CREATORS = ['admin', 'moderator']
+
+
+def person(rng, domain='gmail.com'):
+    name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+    handle = name.lower().replace(' ', '.') + str(rng.randint(1, 9999))
+    return {
+        'name': name,
+        'phone': f'01{rng.randint(3, 9)}{rng.randint(10000000, 99999999)}',
+        'mail': f'{handle}@{domain}',
+        'linkedin': f'https://www.linkedin.com/in/{handle.replace(".", "-")}'
+    }
+
+
+def created_at(rng, index, count):
+    """Spread creation times over two years, newest last, with some jitter"""
+    start = datetime(2023, 1, 1)
+    return start + timedelta(minutes=int(index * (2 * 365 * 24 * 60) / max(count, 1)) + rng.randint(0, 59))
+
+
+DUPLICATE_RATE = 0.02
+
+
+def generate_sponsors(rng, count):
+    previous = None
+    for i in range(count):
+        company_name = f'{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)} {i}'
+        domain = company_name.lower().replace(' ', '') + '.com'
+        # A few sponsors are entered twice, with the name or URL written differently
+        if previous and rng.random() < DUPLICATE_RATE:
+            company_name, domain = previous
+            company_name = rng.choice([f'{company_name} Ltd', company_name.upper(), f'The {company_name}'])
+        previous = (company_name, domain)
+        contacts = []
+        for role in rng.sample(CONTACT_ROLES, rng.randint(0, 3)):
+            contact = person(rng, domain)
+            contact['role'] = role
+            contacts.append(contact)
+        category = rng.choice(CATEGORIES)
+        yield {
+            'company_name': company_name,
+            'previous_sponsor': rng.choice(['Yes', 'No', '']),
+            'website': rng.choice([f'https://www.{domain}', f'http://{domain}/', domain]),
+            'contacts': contacts,
+            'ruetians': [person(rng, 'student.ruet.ac.bd') for _ in range(rng.randint(0, 4))],
+            'category': category,
+            'other_category': 'Tech partner' if category == 'Others' else '',
+            'created_at': created_at(rng, i, count),
+            'created_by': rng.choice(CREATORS)
+        }
+
+
+def generate_alumni(rng, count):
+    for i in range(count):
+        alumnus = person(rng)
+        yield {
+            'ruetian_name': alumnus['name'],
+            'ruetian_phone': alumnus['phone'],
+            'ruetian_mail': f'{i}.{alumnus["mail"]}',
+            'ruetian_linkedin': alumnus['linkedin'],
+            'created_at': created_at(rng, i, count),
+            'created_by': rng.choice(CREATORS)
+        }
+
+
+def generate_speakers(rng, count):
+    for i in range(count):
+        speaker = person(rng)
+        speaker['mail'] = f'{i}.{speaker["mail"]}'
+        speaker['designation'] = rng.choice(DESIGNATIONS)
+        speaker['created_at'] = created_at(rng, i, count)
+        speaker['created_by'] = rng.choice(CREATORS)
+        yield speaker
+
+
+GENERATORS = {
+    'sponsors': generate_sponsors,
+    'alumni': generate_alumni,
+    'speakers': generate_speakers,
+}
+
+
+def seed_database(db, count, seed=42, derived_fields=None):
+    """Replace the three collections with `count` generated documents each; returns sample _ids per collection"""
+    sample_ids = {}
+    for entity_name, generate in GENERATORS.items():
+        rng = random.Random(f'{seed}-{entity_name}')
+        collection = db[entity_name]
+        collection.delete_many({})
+        batch = []
+        for document in generate(rng, count):
+            if derived_fields:
+                document.update(derived_fields(document, entity_name))
+            batch.append(document)
+            if len(batch) >= INSERT_BATCH_SIZE:
+                collection.insert_many(batch)
+                batch = []
+        if batch:
+            collection.insert_many(batch)
+        sample_ids[entity_name] = [str(doc['_id']) for doc in collection.find({}, {'_id': 1}).limit(200)]
+    return sample_ids
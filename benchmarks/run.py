@@ -0,0 +1,399 @@
+"""Seed a dataset, drive every /api endpoint and report latency percentiles, throughput and peak RSS
+
+    python benchmarks/run.py --scale 10k
+    python benchmarks/run.py --scale 100k --mongo-uri mongodb://localhost:27017 --driver http --concurrency 16
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.cookiejar import CookieJar
+from urllib import request as urllib_request
+from urllib.error import HTTPError
+from urllib.parse import urlencode, urlparse
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCHMARK_DIR))
+sys.path.insert(0, BENCHMARK_DIR)
+
+# The in-process app gets its own admin; set before app.py loads .env so real credentials are never used.
+# A server given with --url is logged into with its own admin credentials instead.
+BENCH_USERNAME = 'bench-admin'
+BENCH_PASSWORD = uuid.uuid4().hex
+os.environ['ADMIN_USERNAME'] = BENCH_USERNAME
+os.environ['ADMIN_PASSWORD'] = BENCH_PASSWORD
+os.environ.setdefault('SECRET_KEY', uuid.uuid4().hex)
+
+import datagen
+
+ENTITIES = ['sponsors', 'alumni', 'speakers']
+SEARCH_WORDS = {
+    'sponsors': [word.lower() for word in datagen.COMPANY_WORDS + datagen.COMPANY_SUFFIXES],
+    'alumni': [word.lower() for word in datagen.FIRST_NAMES + datagen.LAST_NAMES],
+    'speakers': [word.lower() for word in datagen.FIRST_NAMES + datagen.LAST_NAMES + ['engineer', 'professor', 'founder']],
+}
+# Field each generated import row makes unique, so uploads insert rather than update
+IMPORT_UNIQUE_FIELDS = {
+    'sponsors': 'website',
+    'alumni': 'ruetian_mail',
+    'speakers': 'mail',
+}
+UPDATE_FIELDS = {
+    'sponsors': 'previous_sponsor',
+    'alumni': 'ruetian_phone',
+    'speakers': 'phone',
+}
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCHMARK_DIR, stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+
+def import_csv(flask_module, entity_name, rng, count):
+    """A CSV upload in the app's import layout, with freshly generated documents"""
+    columns = flask_module.IMPORT_COLUMNS[entity_name]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(list(columns))
+    run_id = uuid.uuid4().hex[:8]
+    for i, document in enumerate(datagen.GENERATORS[entity_name](rng, count)):
+        field = IMPORT_UNIQUE_FIELDS[entity_name]
+        document[field] = f'https://{run_id}-{i}.example.com' if entity_name == 'sponsors' else f'{run_id}-{i}-{document[field]}'
+        writer.writerow([document.get(field, '') for field in columns.values()])
+    return buffer.getvalue().encode('utf-8')
+
+
+class Scenario:
+    def __init__(self, name, build, iterations):
+        self.name = name
+        self.build = build
+        self.iterations = iterations
+
+
+def build_scenarios(flask_module, sample_ids, requests_per_scenario, import_rows):
+    """Reads first so the cache and collection versions are warm, then every write route"""
+    added_ids = {entity_name: [] for entity_name in ENTITIES}
+    slow = max(2, requests_per_scenario // 20)
+    scenarios = [
+        Scenario('stats', lambda rng: ('GET', '/api/stats', None, None), requests_per_scenario),
+        Scenario('cache_stats', lambda rng: ('GET', '/api/cache/stats', None, None), requests_per_scenario),
+        Scenario('slow_queries', lambda rng: ('GET', '/api/admin/slow-queries', None, None), requests_per_scenario),
+    ]
+    for entity_name in ENTITIES:
+        ids = sample_ids[entity_name]
+        words = SEARCH_WORDS[entity_name]
+        scenarios += [
+            Scenario(f'{entity_name}_list', lambda rng, e=entity_name: ('GET', f'/api/{e}/list?limit=100', None, None), requests_per_scenario),
+            Scenario(f'{entity_name}_list_all', lambda rng, e=entity_name: ('GET', f'/api/{e}/list', None, None), slow),
+            Scenario(f'{entity_name}_search', lambda rng, e=entity_name, w=words: ('POST', f'/api/{e}/search', {'search_term': rng.choice(w)}, None), requests_per_scenario),
+            Scenario(f'{entity_name}_search_empty', lambda rng, e=entity_name: ('POST', f'/api/{e}/search', {'search_term': ''}, None), slow),
+            Scenario(f'{entity_name}_get', lambda rng, e=entity_name, i=ids: ('GET', f'/api/{e}/{rng.choice(i)}', None, None), requests_per_scenario),
+            Scenario(f'{entity_name}_count', lambda rng, e=entity_name: ('GET', f'/api/{e}/count', None, None), requests_per_scenario),
+            Scenario(f'{entity_name}_suggest', lambda rng, e=entity_name, w=words: ('GET', f'/api/{e}/suggest?q={rng.choice(w)[:rng.randint(1, 4)]}', None, None), requests_per_scenario),
+            Scenario(f'{entity_name}_download', lambda rng, e=entity_name: ('GET', f'/api/{e}/download', None, None), slow),
+        ]
+    scenarios.append(Scenario('export_all', lambda rng: ('GET', '/api/export/all', None, None), slow))
+    for entity_name in ENTITIES:
+        ids = sample_ids[entity_name]
+        field = UPDATE_FIELDS[entity_name]
+
+        def add(rng, e=entity_name):
+            document = next(datagen.GENERATORS[e](rng, 1))
+            document.pop('created_at')
+            suffix = rng.randint(0, 10 ** 9)
+            if e == 'sponsors':
+                document['company_name'] += f' {suffix}'
+                document['website'] = f'https://www.bench-{suffix}.example.com'
+            else:
+                field = IMPORT_UNIQUE_FIELDS[e]
+                document[field] = f'{suffix}.{document[field]}'
+            return 'POST', f'/api/{e}/add', document, None
+
+        def update(rng, e=entity_name, i=ids, f=field):
+            fields = {f: str(rng.randint(0, 10 ** 6))}
+            if e == 'sponsors':
+                # The sponsor update route requires a website on every call
+                fields['website'] = f'https://www.bench-{rng.randint(0, 10 ** 9)}.example.com'
+            return 'PUT', f'/api/{e}/update/{rng.choice(i)}', fields, None
+
+        def bulk(rng, e=entity_name, i=ids, f=field):
+            operations = [{'action': 'update', 'id': document_id, 'set': {f: str(rng.randint(0, 10 ** 6))}} for document_id in rng.sample(i, min(20, len(i)))]
+            return 'POST', f'/api/{e}/bulk', {'operations': operations}, None
+
+        def upload(rng, e=entity_name):
+            return 'POST', f'/api/{e}/import', None, (f'{e}.csv', import_csv(flask_module, e, rng, import_rows))
+
+        def delete(rng, e=entity_name):
+            return 'DELETE', f'/api/{e}/delete/{added_ids[e].pop()}', None, None
+
+        def changes(rng, e=entity_name):
+            since = max(0, flask_module.get_collection_version(e) - rng.randint(1, 50))
+            return 'GET', f'/api/{e}/changes?since={since}', None, None
+
+        scenarios += [
+            Scenario(f'{entity_name}_add', add, requests_per_scenario),
+            Scenario(f'{entity_name}_update', update, requests_per_scenario),
+            Scenario(f'{entity_name}_bulk', bulk, slow),
+            Scenario(f'{entity_name}_import', upload, slow),
+            Scenario(f'{entity_name}_delete', delete, requests_per_scenario),
+            Scenario(f'{entity_name}_changes', changes, requests_per_scenario),
+        ]
+    return scenarios, added_ids
+
+
+class TestClientDriver:
+    """In-process requests through Flask's test client, one logged-in client per worker thread"""
+
+    def __init__(self, flask_app):
+        self.app = flask_app
+        self.local = threading.local()
+
+    def session(self):
+        if not hasattr(self.local, 'client'):
+            self.local.client = self.app.test_client()
+            self.local.client.post('/login', data={'username': BENCH_USERNAME, 'password': BENCH_PASSWORD})
+        return self.local.client
+
+    def send(self, method, path, body, upload):
+        kwargs = {}
+        if body is not None:
+            kwargs['json'] = body
+        if upload is not None:
+            kwargs['data'] = {'file': (io.BytesIO(upload[1]), upload[0])}
+            kwargs['content_type'] = 'multipart/form-data'
+        response = self.session().open(path, method=method, **kwargs)
+        data = response.get_data()
+        return response.status_code, data
+
+    def close(self):
+        pass
+
+
+class HttpDriver:
+    """Real HTTP over keep-alive-less urllib connections, against --url or an in-process threaded server"""
+
+    def __init__(self, flask_app, url, username=BENCH_USERNAME, password=BENCH_PASSWORD):
+        self.server = None
+        self.credentials = {'username': username, 'password': password}
+        if not url:
+            from werkzeug.serving import make_server, WSGIRequestHandler
+
+            class QuietHandler(WSGIRequestHandler):
+                def log_request(self, *args, **kwargs):
+                    pass
+
+            self.server = make_server('127.0.0.1', 0, flask_app, threaded=True, request_handler=QuietHandler)
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+            url = f'http://127.0.0.1:{self.server.server_port}'
+        self.url = url.rstrip('/')
+        self.local = threading.local()
+
+    def session(self):
+        if not hasattr(self.local, 'opener'):
+            self.local.opener = urllib_request.build_opener(urllib_request.HTTPCookieProcessor(CookieJar()))
+            form = urlencode(self.credentials).encode()
+            with self.local.opener.open(self.url + '/login', data=form) as response:
+                # A failed login renders the form again instead of redirecting to the dashboard
+                if urlparse(response.geturl()).path == '/login':
+                    raise RuntimeError(f'Could not log in to {self.url} as {self.credentials["username"]}')
+        return self.local.opener
+
+    def send(self, method, path, body, upload):
+        headers, data = {}, None
+        if body is not None:
+            data = json.dumps(body, default=str).encode()
+            headers['Content-Type'] = 'application/json'
+        if upload is not None:
+            boundary = uuid.uuid4().hex
+            data = (
+                f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{upload[0]}"\r\n'
+                'Content-Type: text/csv\r\n\r\n'
+            ).encode() + upload[1] + f'\r\n--{boundary}--\r\n'.encode()
+            headers['Content-Type'] = f'multipart/form-data; boundary={boundary}'
+        http_request = urllib_request.Request(self.url + path, data=data, headers=headers, method=method)
+        try:
+            with self.session().open(http_request) as response:
+                # login_required redirects to the login page; don't count that page as a success
+                if urlparse(response.geturl()).path == '/login':
+                    return 401, b'Redirected to /login'
+                return response.status, response.read()
+        except HTTPError as e:
+            return e.code, e.read()
+
+    def close(self):
+        if self.server:
+            self.server.shutdown()
+
+
+def warm_up(executor, driver, concurrency):
+    """Start and log in every worker thread up front, so scenario timings never include a login"""
+    barrier = threading.Barrier(concurrency)
+
+    def login(_):
+        driver.session()
+        barrier.wait()
+
+    list(executor.map(login, range(concurrency)))
+
+
+def run_scenario(executor, driver, scenario, seed, added_ids):
+    rng_lock = threading.Lock()
+    rng = random.Random(f'{seed}-{scenario.name}')
+    latencies, errors = [], []
+
+    def one(_):
+        with rng_lock:
+            method, path, body, upload = scenario.build(rng)
+        started = time.perf_counter()
+        status, data = driver.send(method, path, body, upload)
+        elapsed = time.perf_counter() - started
+        if status >= 400:
+            errors.append(f'{status} {data[:200].decode("utf-8", "replace")}')
+        elif scenario.name.endswith('_add'):
+            added_ids[scenario.name[:-len('_add')]].append(json.loads(data)['id'])
+        latencies.append(elapsed)
+
+    started = time.perf_counter()
+    list(executor.map(one, range(scenario.iterations)))
+    wall = time.perf_counter() - started
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None,
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 3),
+        'p95_ms': round(percentile(latencies, 0.95) * 1000, 3),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 3),
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3),
+        'throughput_rps': round(len(latencies) / wall, 1) if wall else None,
+        'peak_rss_mb': peak_rss_mb()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', choices=sorted(datagen.SCALES, key=datagen.SCALES.get), default='1k', help='documents per collection')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--mongo-uri', help='benchmark a real mongod instead of mongomock')
+    parser.add_argument('--db-name', default='fest_sponsor_bench', help='database the benchmark wipes and seeds')
+    parser.add_argument('--driver', choices=['testclient', 'http'], default='testclient')
+    parser.add_argument('--url', help='with --driver http, target an already running server seeded with the same --mongo-uri/--db-name')
+    parser.add_argument('--username', default=os.environ.get('BENCH_TARGET_USERNAME'),
+                        help="with --url, the target's ADMIN_USERNAME; the password is read from BENCH_TARGET_PASSWORD")
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--requests', type=int, default=200, help='requests per scenario (exports, bulk and imports run 1/20th)')
+    parser.add_argument('--import-rows', type=int, default=100, help='rows per import upload')
+    parser.add_argument('--only', help='comma-separated scenario name prefixes to run')
+    parser.add_argument('--output', help='results file (default: benchmarks/results/<time>-<scale>-<driver>.json)')
+    args = parser.parse_args(argv)
+    if args.url and (args.driver != 'http' or not args.username or not os.environ.get('BENCH_TARGET_PASSWORD')):
+        parser.error('--url needs --driver http, --username (or BENCH_TARGET_USERNAME) and BENCH_TARGET_PASSWORD')
+
+    config = {'DB_NAME': args.db_name}
+    if args.mongo_uri:
+        config['MONGO_URI'] = args.mongo_uri
+    else:
+        import mongomock
+        config['MONGO_URI'] = 'mongodb://localhost'
+        config['MONGO_CLIENT_CLASS'] = mongomock.MongoClient
+    import app as flask_module
+    flask_app = flask_module.create_app(config)
+
+    count = datagen.SCALES[args.scale]
+    print(f'Seeding {count} documents per collection into {args.db_name} ({"mongod" if args.mongo_uri else "mongomock"})...')
+    started = time.perf_counter()
+    sample_ids = datagen.seed_database(flask_module.get_db(), count, args.seed, flask_module.derived_fields)
+    flask_module.ensure_indexes()
+    seed_seconds = round(time.perf_counter() - started, 2)
+    flask_module.cache.invalidate('stats')
+    for entity_name in ENTITIES:
+        flask_module.cache.invalidate(entity_name)
+        flask_module.bump_collection_version(entity_name)
+
+    scenarios, added_ids = build_scenarios(flask_module, sample_ids, args.requests, args.import_rows)
+    if args.only:
+        prefixes = tuple(prefix.strip() for prefix in args.only.split(','))
+        scenarios = [scenario for scenario in scenarios if scenario.name.startswith(prefixes)]
+    if args.driver == 'testclient':
+        driver = TestClientDriver(flask_app)
+    elif args.url:
+        driver = HttpDriver(flask_app, args.url, args.username, os.environ['BENCH_TARGET_PASSWORD'])
+    else:
+        driver = HttpDriver(flask_app, None)
+    results = {}
+    executor = ThreadPoolExecutor(max_workers=args.concurrency)
+    try:
+        warm_up(executor, driver, args.concurrency)
+        for scenario in scenarios:
+            if scenario.name.endswith('_delete'):
+                scenario.iterations = min(scenario.iterations, len(added_ids[scenario.name[:-len('_delete')]]))
+                if not scenario.iterations:
+                    continue
+            results[scenario.name] = summary = run_scenario(executor, driver, scenario, args.seed, added_ids)
+            print(f'{scenario.name:<24} p50 {summary["p50_ms"]:>9.2f} ms  p95 {summary["p95_ms"]:>9.2f} ms  '
+                  f'p99 {summary["p99_ms"]:>9.2f} ms  {summary["throughput_rps"]:>8} req/s  errors {summary["errors"]}')
+    finally:
+        executor.shutdown()
+        driver.close()
+
+    report = {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat(),
+            'revision': git_revision(),
+            'scale': args.scale,
+            'documents_per_collection': count,
+            'seed': args.seed,
+            'backend': 'mongod' if args.mongo_uri else 'mongomock',
+            'driver': args.driver,
+            'concurrency': args.concurrency,
+            'requests_per_scenario': args.requests,
+            'python': platform.python_version(),
+            'platform': platform.platform()
+        },
+        'seed_seconds': seed_seconds,
+        'peak_rss_mb': peak_rss_mb(),
+        'scenarios': results
+    }
+    output = args.output or os.path.join(BENCHMARK_DIR, 'results', f'{datetime.utcnow():%Y%m%d-%H%M%S}-{args.scale}-{args.driver}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f'Peak RSS {report["peak_rss_mb"]} MB; results written to {output}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+let currentAlumni = [];
+const isAdmin = document.currentScript.dataset.isAdmin === 'true';
+
+document.addEventListener('DOMContentLoaded', function() {
+    loadAlumniCount();
+    const alumniForm = document.getElementById('addAlumniForm');
+    alumniForm.removeAttribute('action');
+    alumniForm.removeAttribute('method');
+    alumniForm.addEventListener('submit', function(e) {
+        e.preventDefault();
+        addAlumni();
+    });
+    document.getElementById('searchInput').addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') {
+            searchAlumni();
+        }
+    });
+    attachSuggestions(document.getElementById('searchInput'), 'alumni');
+});
+
+async function loadAlumniCount() {
+    try {
+        const response = await fetch('/api/alumni/count');
+        const data = await response.json();
+        document.getElementById('alumni-count').textContent = data.count || 0;
+    } catch (error) {
+        console.error('Error loading alumni count:', error);
+    }
+}
+
+async function searchAlumni() {
+    const searchTerm = document.getElementById('searchInput').value.trim();
+    if (!searchTerm) {
+        showAlert('Please enter a search term', 'warning');
+        return;
+    }
+    try {
+        const response = await fetch('/api/alumni/search?fields=ruetian_name,ruetian_phone,ruetian_mail,ruetian_linkedin', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ search_term: searchTerm })
+        });
+        const alumni = await response.json();
+        displaySearchResults(alumni);
+    } catch (error) {
+        console.error('Error searching alumni:', error);
+        showAlert('Error searching alumni', 'error');
+    }
+}
+
+function displaySearchResults(alumni) {
+    const resultsDiv = document.getElementById('searchResults');
+    if (alumni.length === 0) {
+        resultsDiv.innerHTML = '<p class="no-results">No alumni found matching your search.</p>';
+        return;
+    }
+    let html = `<h4 style="margin-bottom:18px;">Search Results:</h4><div class="table-responsive" style="margin-bottom:24px;"><table class="table table-bordered table-striped" style="margin-bottom:0;">
+        <thead>
+            <tr>
+                <th style="padding:12px 18px;">Ruetian Name</th>
+                <th style="padding:12px 18px;">Ruetian Phone</th>
+                <th style="padding:12px 18px;">Ruetian Mail</th>
+                <th style="padding:12px 18px;">LinkedIn</th>
+            </tr>
+        </thead>
+        <tbody>`;
+    alumni.forEach(a => {
+        html += `<tr>
+            <td style="padding:10px 18px;">${a.ruetian_name || ''}</td>
+            <td style="padding:10px 18px;">${a.ruetian_phone || ''}</td>
+            <td style="padding:10px 18px;">${a.ruetian_mail || ''}</td>
+            <td style="padding:10px 18px;">${a.ruetian_linkedin ? `<a href="${a.ruetian_linkedin}" target="_blank">${a.ruetian_linkedin}</a>` : ''}</td>
+        </tr>`;
+    });
+    html += '</tbody></table></div>';
+    resultsDiv.innerHTML = html;
+}
+
+const alumniSync = createListSync('alumni');
+
+function loadAllAlumni() {
+    alumniSync()
+        .then(alumni => {
+            displayAllAlumniTable(alumni);
+        });
+}
+
+function displayAllAlumniTable(alumni) {
+    const listDiv = document.getElementById('alumniList');
+    if (alumni.length === 0) {
+        listDiv.innerHTML = '<p class="no-results">No alumni found.</p>';
+        return;
+    }
+    let html = `<h4 style="margin-bottom:18px;">All Alumni:</h4><div class="table-responsive" style="margin-bottom:24px;"><table class="table table-bordered table-striped" style="margin-bottom:0;">
+        <thead>
+            <tr>
+                <th style="padding:12px 18px;">Ruetian Name</th>
+                <th style="padding:12px 18px;">Ruetian Phone</th>
+                <th style="padding:12px 18px;">Ruetian Mail</th>
+                <th style="padding:12px 18px;">LinkedIn</th>
+                <th style="padding:12px 18px;">Actions</th>
+            </tr>
+        </thead>
+        <tbody>`;
+    alumni.forEach(a => {
+        html += `<tr>
+            <td style="padding:10px 18px;">${a.ruetian_name || ''}</td>
+            <td style="padding:10px 18px;">${a.ruetian_phone || ''}</td>
+            <td style="padding:10px 18px;">${a.ruetian_mail || ''}</td>
+            <td style="padding:10px 18px;">${a.ruetian_linkedin ? `<a href="${a.ruetian_linkedin}" target="_blank">${a.ruetian_linkedin}</a>` : ''}</td>
+            <td style="padding:10px 18px;">
+                ${isAdmin ? `<button class=\"btn btn-warning btn-sm\" onclick=\"editAlumni('${a._id}')\"><i class=\"fas fa-edit\"></i> Edit</button>
+                <button class=\"btn btn-danger btn-sm\" onclick=\"deleteAlumni('${a._id}')\"><i class=\"fas fa-trash\"></i> Delete</button>` : ''}
+            </td>
+        </tr>`;
+    });
+    html += '</tbody></table></div>';
+    listDiv.innerHTML = html;
+}
+
+function editAlumni(id) {
+    fetch(`/api/alumni/${id}?fields=ruetian_name,ruetian_phone,ruetian_mail,ruetian_linkedin`)
+        .then(response => response.json())
+        .then(a => {
+            if (!a || a.error) return;
+            document.getElementById('editAlumniId').value = a._id;
+            document.getElementById('editRuetianName').value = a.ruetian_name || '';
+            document.getElementById('editRuetianPhone').value = a.ruetian_phone || '';
+            document.getElementById('editRuetianMail').value = a.ruetian_mail || '';
+            document.getElementById('editRuetianLinkedin').value = a.ruetian_linkedin || '';
+            const modal = document.getElementById('editAlumniModal');
+            modal.style.display = 'block';
+            // Scroll to modal for better UX
+            setTimeout(() => {
+                modal.scrollIntoView({ behavior: 'smooth', block: 'center' });
+            }, 100);
+        });
+}
+
+function closeEditAlumniModal() {
+    document.getElementById('editAlumniModal').style.display = 'none';
+}
+
+document.getElementById('editAlumniForm').addEventListener('submit', async function(e) {
+    e.preventDefault();
+    const id = document.getElementById('editAlumniId').value;
+    const data = {
+        ruetian_name: document.getElementById('editRuetianName').value,
+        ruetian_phone: document.getElementById('editRuetianPhone').value,
+        ruetian_mail: document.getElementById('editRuetianMail').value,
+        ruetian_linkedin: document.getElementById('editRuetianLinkedin').value
+    };
+    try {
+        const response = await fetch(`/api/alumni/update/${id}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(data)
+        });
+        const result = await response.json();
+        if (result.success) {
+            showAlert('Alumni updated successfully!', 'success');
+            closeEditAlumniModal();
+            loadAllAlumni();
+        } else {
+            showAlert(result.message || 'Error updating alumni', 'error');
+        }
+    } catch (error) {
+        showAlert('Error updating alumni', 'error');
+    }
+});
+
+
+async function addAlumni() {
+    const form = document.getElementById('addAlumniForm');
+    const formData = new FormData(form);
+    const alumniData = {
+        ruetian_name: formData.get('ruetian_name'),
+        ruetian_phone: formData.get('ruetian_phone'),
+        ruetian_mail: formData.get('ruetian_mail'),
+        ruetian_linkedin: formData.get('ruetian_linkedin')
+    };
+    try {
+        const response = await fetch('/api/alumni/add', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(alumniData)
+        });
+        const result = await response.json();
+        if (result.success) {
+            showAlert(result.message || 'Alumni added successfully!', 'success');
+            form.reset();
+            loadAlumniCount();
+        } else {
+            // Show specific toast for alumni exist
+            if (result.message && result.message.includes('already exists')) {
+                showAlert(result.message, 'warning');
+            } else {
+                showAlert(result.message || 'Error adding alumni', 'error');
+            }
+        }
+    } catch (error) {
+        console.error('Error adding alumni:', error);
+        showAlert('Error adding alumni', 'error');
+    }
+}
+
+async function deleteAlumni(alumniId) {
+    if (!confirm('Are you sure you want to delete this alumni?')) {
+        return;
+    }
+    try {
+        const response = await fetch(`/api/alumni/delete/${alumniId}`, {
+            method: 'DELETE'
+        });
+        const result = await response.json();
+        if (result.success) {
+            showAlert('Alumni deleted successfully!', 'success');
+            loadAlumniCount();
+            if (currentAlumni.length > 0) {
+                loadAllAlumni();
+            }
+        } else {
+            showAlert(result.message || 'Error deleting alumni', 'error');
+        }
+    } catch (error) {
+        console.error('Error deleting alumni:', error);
+        showAlert('Error deleting alumni', 'error');
+    }
+}
+
+function clearSearch() {
+    document.getElementById('searchInput').value = '';
+    document.getElementById('searchResults').innerHTML = '';
+}
+
+function showAlert(message, type) {
+    const alert = document.createElement('div');
+    alert.className = `alert alert-${type}`;
+    alert.innerHTML = `
+        ${message}
+        <button class="close-alert">&times;</button>
+    `;
+    const container = document.querySelector('.management-container');
+    container.insertBefore(alert, container.firstChild);
+    setTimeout(() => {
+        if (alert.parentNode) {
+            alert.remove();
+        }
+    }, 5000);
+    alert.querySelector('.close-alert').addEventListener('click', () => {
+        alert.remove();
+    });
+}
+
+function downloadAllAlumni() {
+    if (isAdmin) {
+        window.location.href = '/api/alumni/download';
+    } else {
+        showAlert('Only admin can download alumni data.', 'warning');
+    }
+}
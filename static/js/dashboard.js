@@ -0,0 +1,28 @@
+// Load dashboard statistics
+document.addEventListener('DOMContentLoaded', function() {
+    loadStats();
+});
+
+async function loadStats() {
+    try {
+        const response = await fetch('/api/stats');
+        const stats = await response.json();
+        const entities = ['sponsors', 'alumni', 'speakers'];
+        
+        for (const entity of entities) {
+            const countElement = document.getElementById(`${entity}-count`);
+            if (countElement) {
+                countElement.textContent = stats[entity] || 0;
+            }
+        }
+        
+        const categoriesElement = document.getElementById('sponsor-categories');
+        if (categoriesElement && stats.sponsor_categories) {
+            categoriesElement.textContent = stats.sponsor_categories
+                .map(c => `${c.category}: ${c.count}`)
+                .join(' · ');
+        }
+    } catch (error) {
+        console.error('Error loading stats:', error);
+    }
+}
@@ -18,6 +18,7 @@ document.addEventListener('DOMContentLoaded', function() {
             searchEntities();
         }
     });
+    attachSuggestions(document.getElementById('searchInput'), ENTITY_TYPE);
 });
 
 async function loadEntityCount() {
@@ -112,10 +113,12 @@ async function addEntity() {
     }
 }
 
+let syncEntities = null;
+
 async function loadAllEntities() {
     try {
-        const response = await fetch(`/api/${ENTITY_TYPE}/list`);
-        const entities = await response.json();
+        syncEntities = syncEntities || createListSync(ENTITY_TYPE);
+        const entities = await syncEntities();
         
         currentEntities = entities;
         displayEntitiesList(entities);
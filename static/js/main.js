@@ -95,6 +95,137 @@ function setLoading(element, isLoading) {
     }
 }
 
+// Pagination
+async function fetchAllPages(url, pageSize = 200) {
+    // Follow the X-Next-Cursor header of the /list endpoints until the last page
+    const items = [];
+    let cursor = null;
+    do {
+        const params = new URLSearchParams({ limit: pageSize });
+        if (cursor) {
+            params.set('cursor', cursor);
+        }
+        const response = await fetch(`${url}?${params}`);
+        items.push(...await response.json());
+        if (!cursor) {
+            // The first page's token covers the whole listing
+            items.changeToken = response.headers.get('X-Change-Token');
+        }
+        cursor = response.headers.get('X-Next-Cursor');
+    } while (cursor);
+    return items;
+}
+
+// Incremental list sync
+function createListSync(entityType) {
+    // Loads /api/<entity>/list once, then keeps the copy current from /api/<entity>/changes
+    let items = null;
+    let token = null;
+    return async function sync() {
+        if (items && token) {
+            const response = await fetch(`/api/${entityType}/changes?since=${encodeURIComponent(token)}`);
+            if (response.ok) {
+                const delta = await response.json();
+                if (!delta.reset) {
+                    applyListChanges(items, delta);
+                    token = delta.token;
+                    return items;
+                }
+            }
+        }
+        items = await fetchAllPages(`/api/${entityType}/list`);
+        token = items.changeToken;
+        return items;
+    };
+}
+
+function applyListChanges(items, delta) {
+    // Updated rows keep their place; new rows are the newest, so they go first
+    const removed = new Set(delta.deleted);
+    for (let i = items.length - 1; i >= 0; i--) {
+        if (removed.has(items[i]._id)) {
+            items.splice(i, 1);
+        }
+    }
+    const positions = new Map(items.map((item, index) => [item._id, index]));
+    const added = [];
+    delta.changed.forEach(item => {
+        if (positions.has(item._id)) {
+            items[positions.get(item._id)] = item;
+        } else {
+            added.push(item);
+        }
+    });
+    items.unshift(...added);
+    return items;
+}
+
+// Typeahead
+function attachSuggestions(input, entityType) {
+    // Offer matching names from /api/<entity>/suggest in a datalist on every keystroke
+    const list = document.createElement('datalist');
+    list.id = `${input.id}Suggestions`;
+    input.after(list);
+    input.setAttribute('list', list.id);
+    input.setAttribute('autocomplete', 'off');
+    let controller = null;
+    input.addEventListener('input', async function() {
+        const query = input.value.trim();
+        if (controller) {
+            controller.abort();
+        }
+        if (!query) {
+            list.innerHTML = '';
+            return;
+        }
+        controller = new AbortController();
+        try {
+            const response = await fetch(`/api/${entityType}/suggest?${new URLSearchParams({ q: query })}`, { signal: controller.signal });
+            const suggestions = await response.json();
+            list.innerHTML = '';
+            suggestions.forEach(suggestion => {
+                const option = document.createElement('option');
+                option.value = suggestion.name;
+                list.appendChild(option);
+            });
+        } catch (error) {
+            if (error.name !== 'AbortError') {
+                console.error('Error loading suggestions:', error);
+            }
+        }
+    });
+}
+
+// Bulk import
+async function importEntities(input, entityType, onDone) {
+    const file = input.files[0];
+    if (!file) return;
+    const formData = new FormData();
+    formData.append('file', file);
+    try {
+        const response = await fetch(`/api/${entityType}/import`, {
+            method: 'POST',
+            body: formData
+        });
+        const result = await response.json();
+        if (result.success) {
+            showAlert(`Imported ${result.rows} rows: ${result.inserted} added, ${result.updated} updated`, 'success');
+            if (result.errors.length > 0) {
+                const shown = result.errors.slice(0, 5).map(e => `row ${e.row}: ${e.message}`).join('; ');
+                showAlert(`${result.errors.length} rows skipped (${shown})`, 'warning');
+            }
+            if (onDone) onDone();
+        } else {
+            showAlert(result.message || 'Error importing file', 'error');
+        }
+    } catch (error) {
+        console.error('Error importing file:', error);
+        showAlert('Error importing file', 'error');
+    } finally {
+        input.value = '';
+    }
+}
+
 // Export functions for global use
 window.showAlert = showAlert;
 window.formatDate = formatDate;
@@ -102,3 +233,7 @@ window.formatCurrency = formatCurrency;
 window.validateEmail = validateEmail;
 window.validateRequired = validateRequired;
 window.setLoading = setLoading;
+window.fetchAllPages = fetchAllPages;
+window.createListSync = createListSync;
+window.attachSuggestions = attachSuggestions;
+window.importEntities = importEntities;
@@ -0,0 +1,267 @@
+let currentSpeakers = [];
+const isAdmin = document.currentScript.dataset.isAdmin === 'true';
+
+document.addEventListener('DOMContentLoaded', function() {
+    loadSpeakerCount();
+    document.getElementById('addSpeakerForm').addEventListener('submit', function(e) {
+        e.preventDefault();
+        addSpeaker();
+    });
+    document.getElementById('searchInput').addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') {
+            searchSpeakers();
+        }
+    });
+    attachSuggestions(document.getElementById('searchInput'), 'speakers');
+});
+
+async function loadSpeakerCount() {
+    try {
+        const response = await fetch('/api/speakers/count');
+        const data = await response.json();
+        document.getElementById('speaker-count').textContent = data.count || 0;
+    } catch (error) {
+        console.error('Error loading speaker count:', error);
+    }
+}
+
+async function searchSpeakers() {
+    const searchTerm = document.getElementById('searchInput').value.trim();
+    if (!searchTerm) {
+        showAlert('Please enter a search term', 'warning');
+        return;
+    }
+    try {
+        const response = await fetch('/api/speakers/search?fields=name,phone,mail,linkedin,designation', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ search_term: searchTerm })
+        });
+        const speakers = await response.json();
+        displaySearchResults(speakers);
+    } catch (error) {
+        console.error('Error searching speakers:', error);
+        showAlert('Error searching speakers', 'error');
+    }
+}
+
+function displaySearchResults(speakers) {
+    const resultsDiv = document.getElementById('searchResults');
+    if (speakers.length === 0) {
+        resultsDiv.innerHTML = '<p class="no-results">No speakers found matching your search.</p>';
+        return;
+    }
+    let html = `<h4 style="margin-bottom:18px;">Search Results:</h4><div class="table-responsive" style="margin-bottom:24px;"><table class="table table-bordered table-striped" style="margin-bottom:0;">
+        <thead>
+            <tr>
+                <th style="padding:12px 18px;">Name</th>
+                <th style="padding:12px 18px;">Phone</th>
+                <th style="padding:12px 18px;">Mail</th>
+                <th style="padding:12px 18px;">LinkedIn</th>
+                <th style="padding:12px 18px;">Designation</th>
+            </tr>
+        </thead>
+        <tbody>`;
+    speakers.forEach(s => {
+        html += `<tr>
+            <td style="padding:10px 18px;">${s.name || ''}</td>
+            <td style="padding:10px 18px;">${s.phone || ''}</td>
+            <td style="padding:10px 18px;">${s.mail || ''}</td>
+            <td style="padding:10px 18px;">${s.linkedin ? `<a href="${s.linkedin}" target="_blank">${s.linkedin}</a>` : ''}</td>
+            <td style="padding:10px 18px;">${s.designation || ''}</td>
+        </tr>`;
+    });
+    html += '</tbody></table></div>';
+    resultsDiv.innerHTML = html;
+}
+
+const speakersSync = createListSync('speakers');
+
+function loadAllSpeakers() {
+    speakersSync()
+        .then(speakers => {
+            displayAllSpeakersTable(speakers);
+        });
+}
+
+function displayAllSpeakersTable(speakers) {
+    const listDiv = document.getElementById('speakersList');
+    if (speakers.length === 0) {
+        listDiv.innerHTML = '<p class="no-results">No speakers found.</p>';
+        return;
+    }
+    let html = `<h4 style="margin-bottom:18px;">All Speakers:</h4><div class="table-responsive" style="margin-bottom:24px;"><table class="table table-bordered table-striped" style="margin-bottom:0;">
+        <thead>
+            <tr>
+                <th style="padding:12px 18px;">Name</th>
+                <th style="padding:12px 18px;">Phone</th>
+                <th style="padding:12px 18px;">Mail</th>
+                <th style="padding:12px 18px;">LinkedIn</th>
+                <th style="padding:12px 18px;">Designation</th>
+                <th style="padding:12px 18px;">Actions</th>
+            </tr>
+        </thead>
+        <tbody>`;
+    speakers.forEach(s => {
+        html += `<tr>
+            <td style="padding:10px 18px;">${s.name || ''}</td>
+            <td style="padding:10px 18px;">${s.phone || ''}</td>
+            <td style="padding:10px 18px;">${s.mail || ''}</td>
+            <td style="padding:10px 18px;">${s.linkedin ? `<a href="${s.linkedin}" target="_blank">${s.linkedin}</a>` : ''}</td>
+            <td style="padding:10px 18px;">${s.designation || ''}</td>
+            <td style="padding:10px 18px;">
+                ${isAdmin ? `<button class=\"btn btn-warning btn-sm\" onclick=\"editSpeaker('${s._id}')\"><i class=\"fas fa-edit\"></i> Edit</button>
+                <button class=\"btn btn-danger btn-sm\" onclick=\"deleteSpeaker('${s._id}')\"><i class=\"fas fa-trash\"></i> Delete</button>` : ''}
+            </td>
+        </tr>`;
+    });
+    html += '</tbody></table></div>';
+    listDiv.innerHTML = html;
+}
+
+function editSpeaker(id) {
+    fetch(`/api/speakers/${id}?fields=name,phone,mail,linkedin,designation`)
+        .then(response => response.json())
+        .then(s => {
+            if (!s || s.error) return;
+            document.getElementById('editSpeakerId').value = s._id;
+            document.getElementById('editSpeakerName').value = s.name || '';
+            document.getElementById('editSpeakerPhone').value = s.phone || '';
+            document.getElementById('editSpeakerMail').value = s.mail || '';
+            document.getElementById('editSpeakerLinkedin').value = s.linkedin || '';
+            document.getElementById('editSpeakerDesignation').value = s.designation || '';
+            const modal = document.getElementById('editSpeakerModal');
+            modal.style.display = 'block';
+            // Scroll to modal for better UX
+            setTimeout(() => {
+                modal.scrollIntoView({ behavior: 'smooth', block: 'center' });
+            }, 100);
+        });
+}
+
+function closeEditSpeakerModal() {
+    document.getElementById('editSpeakerModal').style.display = 'none';
+}
+
+document.getElementById('editSpeakerForm').addEventListener('submit', async function(e) {
+    e.preventDefault();
+    const id = document.getElementById('editSpeakerId').value;
+    const data = {
+        name: document.getElementById('editSpeakerName').value,
+        phone: document.getElementById('editSpeakerPhone').value,
+        mail: document.getElementById('editSpeakerMail').value,
+        linkedin: document.getElementById('editSpeakerLinkedin').value,
+        designation: document.getElementById('editSpeakerDesignation').value
+    };
+    try {
+        const response = await fetch(`/api/speakers/update/${id}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(data)
+        });
+        const result = await response.json();
+        if (result.success) {
+            showAlert('Speaker updated successfully!', 'success');
+            closeEditSpeakerModal();
+            loadAllSpeakers();
+        } else {
+            showAlert(result.message || 'Error updating speaker', 'error');
+        }
+    } catch (error) {
+        showAlert('Error updating speaker', 'error');
+    }
+});
+
+async function addSpeaker() {
+    const form = document.getElementById('addSpeakerForm');
+    const formData = new FormData(form);
+    const speakerData = {
+        name: formData.get('name'),
+        phone: formData.get('phone'),
+        mail: formData.get('mail'),
+        linkedin: formData.get('linkedin'),
+        designation: formData.get('designation')
+    };
+    try {
+        const response = await fetch('/api/speakers/add', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(speakerData)
+        });
+        const result = await response.json();
+        if (result.success) {
+            showAlert(result.message || 'Speaker added successfully!', 'success');
+            form.reset();
+            loadSpeakerCount();
+        } else {
+            if (result.message && result.message.includes('already exists')) {
+                showAlert(result.message, 'warning');
+            } else {
+                showAlert(result.message || 'Error adding speaker', 'error');
+            }
+        }
+    } catch (error) {
+        console.error('Error adding speaker:', error);
+        showAlert('Error adding speaker', 'error');
+    }
+}
+
+async function deleteSpeaker(speakerId) {
+    if (!confirm('Are you sure you want to delete this speaker?')) {
+        return;
+    }
+    try {
+        const response = await fetch(`/api/speakers/delete/${speakerId}`, {
+            method: 'DELETE'
+        });
+        const result = await response.json();
+        if (result.success) {
+            showAlert('Speaker deleted successfully!', 'success');
+            loadSpeakerCount();
+            if (currentSpeakers.length > 0) {
+                loadAllSpeakers();
+            }
+        } else {
+            showAlert(result.message || 'Error deleting speaker', 'error');
+        }
+    } catch (error) {
+        console.error('Error deleting speaker:', error);
+        showAlert('Error deleting speaker', 'error');
+    }
+}
+
+function clearSearch() {
+    document.getElementById('searchInput').value = '';
+    document.getElementById('searchResults').innerHTML = '';
+}
+
+function showAlert(message, type) {
+    const alert = document.createElement('div');
+    alert.className = `alert alert-${type}`;
+    alert.innerHTML = `
+        ${message}
+        <button class="close-alert">&times;</button>
+    `;
+    const container = document.querySelector('.management-container');
+    container.insertBefore(alert, container.firstChild);
+    setTimeout(() => {
+        if (alert.parentNode) {
+            alert.remove();
+        }
+    }, 5000);
+    alert.querySelector('.close-alert').addEventListener('click', () => {
+        alert.remove();
+    });
+}
+
+function downloadAllSpeakers() {
+    if (isAdmin) {
+        window.location.href = '/api/speakers/download';
+    } else {
+        showAlert('Only admin can download speaker data.', 'warning');
+    }
+}
@@ -0,0 +1,644 @@
+let isAdmin = document.currentScript.dataset.isAdmin;
+let currentSponsors = [];
+
+function toggleOtherCategory(select) {
+    const otherGroup = document.getElementById('otherCategoryGroup');
+    if (select.value === 'others') {
+        otherGroup.style.display = 'block';
+    } else {
+        otherGroup.style.display = 'none';
+        document.getElementById('otherCategory').value = '';
+    }
+}
+
+document.addEventListener('DOMContentLoaded', function() {
+    loadSponsorCount();
+    document.getElementById('addSponsorForm').addEventListener('submit', function(e) {
+        e.preventDefault();
+        addSponsor();
+    });
+    document.getElementById('searchInput').addEventListener('keypress', function(e) {
+        if (e.key === 'Enter') {
+            searchSponsors();
+        }
+    });
+    attachSuggestions(document.getElementById('searchInput'), 'sponsors');
+});
+
+async function loadSponsorCount() {
+    try {
+        const response = await fetch('/api/sponsors/count');
+        const data = await response.json();
+        document.getElementById('sponsor-count').textContent = data.count || 0;
+    } catch (error) {
+        console.error('Error loading sponsor count:', error);
+    }
+}
+
+async function searchSponsors() {
+    const searchTerm = document.getElementById('searchInput').value.trim();
+    if (!searchTerm) {
+        showAlert('Please enter a search term', 'warning');
+        return;
+    }
+    try {
+        const response = await fetch('/api/sponsors/search', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ search_term: searchTerm })
+        });
+        const sponsors = await response.json();
+        displaySearchResults(sponsors);
+    } catch (error) {
+        console.error('Error searching sponsors:', error);
+        showAlert('Error searching sponsors', 'error');
+    }
+}
+
+function displaySearchResults(sponsors) {
+    const resultsDiv = document.getElementById('searchResults');
+    if (sponsors.length === 0) {
+        resultsDiv.innerHTML = '<p class="no-results">No sponsors found matching your search.</p>';
+        return;
+    }
+    let html = `<h4 style="margin-bottom:18px;">Search Results:</h4><div class="table-responsive" style="margin-bottom:24px;"><table class="table table-bordered table-striped" style="margin-bottom:0;">
+        <thead>
+            <tr>
+                <th style="padding:12px 18px;">Company Name</th>
+                <th style="padding:12px 18px;">Previous Sponsor</th>
+                <th style="padding:12px 18px;">Website</th>
+            </tr>
+        </thead>
+        <tbody>`;
+    sponsors.forEach(sponsor => {
+        html += `<tr>
+            <td style="padding:10px 18px;">${sponsor.company_name || ''}</td>
+            <td style="padding:10px 18px;">${sponsor.previous_sponsor || ''}</td>
+            <td style="padding:10px 18px;">${sponsor.website ? `<a href="${sponsor.website}" target="_blank">${sponsor.website}</a>` : ''}</td>
+        </tr>`;
+    });
+    html += '</tbody></table></div>';
+    resultsDiv.innerHTML = html;
+}
+
+const sponsorsSync = createListSync('sponsors');
+
+function loadAllSponsors() {
+    sponsorsSync()
+        .then(sponsors => {
+            displayAllSponsorsTable(sponsors);
+        });
+}
+
+// ...existing code...
+
+function displayAllSponsorsTable(sponsors) {
+    const listDiv = document.getElementById('sponsorsList');
+    if (sponsors.length === 0) {
+        listDiv.innerHTML = '<p class="no-results">No sponsors found.</p>';
+        return;
+    }
+    let html = `<h4 style="margin-bottom:18px;">All Sponsors:</h4><div class="table-responsive" style="margin-bottom:24px;"><table class="table table-bordered table-striped" style="margin-bottom:0;">
+        <thead>
+            <tr>
+                <th style="padding:12px 18px;">Company Name</th>
+                <th style="padding:12px 18px;">Website</th>
+                <th style="padding:12px 18px;">Ruetian Name</th>
+                <th style="padding:12px 18px;">Category</th>
+                ${isAdmin ? '<th style="padding:12px 18px;">Actions</th>' : ''}
+            </tr>
+        </thead>
+        <tbody>`;
+    sponsors.forEach(sponsor => {
+        html += `<tr>
+            <td style="padding:10px 18px;">${sponsor.company_name || ''}</td>
+            <td style="padding:10px 18px;">${sponsor.website ? `<a href="${sponsor.website}" target="_blank">${sponsor.website}</a>` : ''}</td>
+            <td style="padding:10px 18px;">${sponsor.ruetian_name || ''}</td>
+            <td style="padding:10px 18px;">${sponsor.category || ''}</td>`;
+        if (isAdmin) {
+            html += `<td style="padding:10px 18px;">
+                <button class="btn btn-warning btn-sm" onclick="editSponsor('${sponsor._id}')"><i class="fas fa-edit"></i> Edit</button>
+                <button class="btn btn-danger btn-sm" onclick="deleteSponsor('${sponsor._id}')"><i class="fas fa-trash"></i> Delete</button>
+            </td>`;
+        }
+        html += `</tr>`;
+    });
+    html += '</tbody></table></div>';
+    listDiv.innerHTML = html;
+}
+
+function editSponsor(id) {
+    if (!isAdmin) return;
+    fetch(`/api/sponsors/${id}`)
+        .then(response => response.json())
+        .then(sponsor => {
+            if (!sponsor || sponsor.error) return;
+            
+            // Reset edit counters
+            editContactCount = 1;
+            editRuetianCount = 1;
+            
+            document.getElementById('editSponsorId').value = sponsor._id;
+            document.getElementById('editCompanyName').value = sponsor.company_name || '';
+            document.getElementById('editWebsite').value = sponsor.website || '';
+            document.getElementById('editCategory').value = sponsor.category || '';
+            document.getElementById('editOtherCategory').value = sponsor.other_category || '';
+            
+            // Set previous sponsor radio
+            document.querySelectorAll('input[name="edit_previous_sponsor"]').forEach(radio => {
+                radio.checked = radio.value === (sponsor.previous_sponsor || '');
+            });
+            
+            // Populate contacts
+            const contactsContainer = document.getElementById('editContactsContainer');
+            contactsContainer.innerHTML = '';
+            if (sponsor.contacts && sponsor.contacts.length > 0) {
+                sponsor.contacts.forEach((contact, index) => {
+                    addEditContact(contact.role, contact.name, contact.phone, contact.mail, contact.linkedin);
+                });
+            } else {
+                addEditContact(); // Add one empty contact field
+            }
+            
+            // Populate ruetians
+            const ruetiansContainer = document.getElementById('editRuetiansContainer');
+            ruetiansContainer.innerHTML = '';
+            if (sponsor.ruetians && sponsor.ruetians.length > 0) {
+                sponsor.ruetians.forEach((ruetian, index) => {
+                    addEditRuetian(ruetian.name, ruetian.phone, ruetian.mail, ruetian.linkedin);
+                });
+            } else {
+                addEditRuetian(); // Add one empty ruetian field
+            }
+            
+            toggleEditOtherCategory(document.getElementById('editCategory'));
+            document.getElementById('editSponsorModal').style.display = 'block';
+            
+            // Scroll to the modal card
+            setTimeout(() => {
+                document.getElementById('editSponsorModal').scrollIntoView({ behavior: 'smooth', block: 'center' });
+            }, 100);
+        });
+}
+
+function closeEditSponsorModal() {
+    document.getElementById('editSponsorModal').style.display = 'none';
+}
+
+document.getElementById('editSponsorForm').addEventListener('submit', async function(e) {
+    if (!isAdmin) return;
+    e.preventDefault();
+    const id = document.getElementById('editSponsorId').value;
+    
+    // Collect contacts from edit form
+    const editContacts = [];
+    const editContactsContainer = document.getElementById('editContactsContainer');
+    const editContactDivs = editContactsContainer.querySelectorAll('.contact-group');
+    editContactDivs.forEach(contactDiv => {
+        const role = contactDiv.querySelector('select[name="edit_roles[]"]').value;
+        const name = contactDiv.querySelector('input[name="edit_contact_names[]"]').value;
+        const phone = contactDiv.querySelector('input[name="edit_contact_phones[]"]').value;
+        const mail = contactDiv.querySelector('input[name="edit_contact_mails[]"]').value;
+        const linkedin = contactDiv.querySelector('input[name="edit_contact_linkedins[]"]').value;
+        if (role) {
+            editContacts.push({ role, name, phone, mail, linkedin });
+        }
+    });
+    
+    // Collect ruetians from edit form
+    const editRuetians = [];
+    const editRuetiansContainer = document.getElementById('editRuetiansContainer');
+    const editRuetianDivs = editRuetiansContainer.querySelectorAll('.ruetian-group');
+    editRuetianDivs.forEach(ruetianDiv => {
+        const name = ruetianDiv.querySelector('input[name="edit_ruetian_names[]"]').value;
+        const phone = ruetianDiv.querySelector('input[name="edit_ruetian_phones[]"]').value;
+        const mail = ruetianDiv.querySelector('input[name="edit_ruetian_mails[]"]').value;
+        const linkedin = ruetianDiv.querySelector('input[name="edit_ruetian_linkedins[]"]').value;
+        if (name) {
+            editRuetians.push({ name, phone, mail, linkedin });
+        }
+    });
+    
+    const data = {
+        company_name: document.getElementById('editCompanyName').value,
+        previous_sponsor: document.querySelector('input[name="edit_previous_sponsor"]:checked')?.value,
+        website: document.getElementById('editWebsite').value,
+        contacts: editContacts,
+        ruetians: editRuetians,
+        category: document.getElementById('editCategory').value,
+        other_category: document.getElementById('editOtherCategory').value
+    };
+    
+    try {
+        const response = await fetch(`/api/sponsors/update/${id}`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(data)
+        });
+        const result = await response.json();
+        if (result.success) {
+            showAlert('Sponsor updated successfully!', 'success');
+            closeEditSponsorModal();
+            loadAllSponsors();
+        } else {
+            showAlert(result.message || 'Error updating sponsor', 'error');
+        }
+    } catch (error) {
+        showAlert('Error updating sponsor', 'error');
+    }
+});
+
+function toggleEditOtherCategory(select) {
+    const otherGroup = document.getElementById('editOtherCategoryGroup');
+    if (select.value === 'others') {
+        otherGroup.style.display = 'block';
+    } else {
+        otherGroup.style.display = 'none';
+        document.getElementById('editOtherCategory').value = '';
+    }
+}
+
+async function addSponsor() {
+    const form = document.getElementById('addSponsorForm');
+    const formData = new FormData(form);
+    
+    // Collect multiple contacts
+    const roles = formData.getAll('roles[]').filter(role => role);
+    const names = formData.getAll('contact_names[]');
+    const phones = formData.getAll('contact_phones[]');
+    const mails = formData.getAll('contact_mails[]');
+    const linkedins = formData.getAll('contact_linkedins[]');
+    const contacts = roles.map((role, index) => ({
+        role: role,
+        name: names[index] || '',
+        phone: phones[index] || '',
+        mail: mails[index] || '',
+        linkedin: linkedins[index] || ''
+    }));
+    
+    // Collect multiple ruetians
+    const ruetianNames = formData.getAll('ruetian_names[]').filter(name => name);
+    const ruetianPhones = formData.getAll('ruetian_phones[]');
+    const ruetianMails = formData.getAll('ruetian_mails[]');
+    const ruetianLinkedins = formData.getAll('ruetian_linkedins[]');
+    const ruetians = ruetianNames.map((name, index) => ({
+        name: name,
+        phone: ruetianPhones[index] || '',
+        mail: ruetianMails[index] || '',
+        linkedin: ruetianLinkedins[index] || ''
+    }));
+    
+    const sponsorData = {
+        company_name: formData.get('company_name'),
+        previous_sponsor: formData.get('previous_sponsor'),
+        website: formData.get('website'),
+        contacts: contacts,
+        ruetians: ruetians,
+        category: formData.get('category'),
+        other_category: formData.get('other_category')
+    };
+    
+    try {
+        const response = await fetch('/api/sponsors/add', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(sponsorData)
+        });
+        let result = await response.json();
+        if (response.status === 409 && confirm(`${result.message}\n\nAdd the new details and contacts to the existing sponsor instead?`)) {
+            const mergeResponse = await fetch('/api/sponsors/add', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                },
+                body: JSON.stringify({ ...sponsorData, on_duplicate: 'merge' })
+            });
+            result = await mergeResponse.json();
+        }
+        if (result.success) {
+            showAlert(result.merged ? result.message : 'Sponsor added successfully!', 'success');
+            form.reset();
+            document.getElementById('otherCategoryGroup').style.display = 'none';
+            // Reset dynamic fields
+            contactCount = 1;
+            ruetianCount = 1;
+            document.getElementById('contactsContainer').innerHTML = `
+                <div class="contact-item">
+                    <div class="form-row">
+                        <div class="form-group">
+                            <label for="role1">Role</label>
+                            <select id="role1" name="roles[]" onchange="toggleContactFields(this, 1)">
+                                <option value="">Select Role</option>
+                                <option value="CEO">CEO</option>
+                                <option value="CTO">CTO</option>
+                                <option value="Brand Manager">Brand Manager</option>
+                                <option value="Sponsor Manager">Sponsor Manager</option>
+                                <option value="HR">HR</option>
+                            </select>
+                        </div>
+                        <div class="form-group contact-fields" id="contactFields1" style="display:none;">
+                            <label for="contactPhone1">Phone (optional)</label>
+                            <input type="tel" id="contactPhone1" name="contact_phones[]">
+                        </div>
+                        <div class="form-group contact-fields" id="contactMail1" style="display:none;">
+                            <label for="contactMail1">Mail (optional)</label>
+                            <input type="email" id="contactMail1" name="contact_mails[]">
+                        </div>
+                    </div>
+                </div>
+            `;
+            document.getElementById('ruetiansContainer').innerHTML = `
+                <div class="ruetian-item">
+                    <div class="form-row">
+                        <div class="form-group">
+                            <label for="ruetianName1">Ruetian Name</label>
+                            <input type="text" id="ruetianName1" name="ruetian_names[]">
+                        </div>
+                        <div class="form-group">
+                            <label for="ruetianPhone1">Ruetian Phone</label>
+                            <input type="tel" id="ruetianPhone1" name="ruetian_phones[]">
+                        </div>
+                        <div class="form-group">
+                            <label for="ruetianMail1">Ruetian Mail</label>
+                            <input type="email" id="ruetianMail1" name="ruetian_mails[]">
+                        </div>
+                        <div class="form-group">
+                            <label for="ruetianLinkedin1">Ruetian LinkedIn</label>
+                            <input type="url" id="ruetianLinkedin1" name="ruetian_linkedins[]">
+                        </div>
+                    </div>
+                </div>
+            `;
+            loadSponsorCount();
+        } else {
+            showAlert(result.message || 'Error adding sponsor', 'error');
+        }
+    } catch (error) {
+        console.error('Error adding sponsor:', error);
+        showAlert('Error adding sponsor', 'error');
+    }
+}
+
+async function deleteSponsor(sponsorId) {
+    if (!isAdmin) return;
+    if (!confirm('Are you sure you want to delete this sponsor?')) {
+        return;
+    }
+    try {
+        const response = await fetch(`/api/sponsors/delete/${sponsorId}`, {
+            method: 'DELETE'
+        });
+        const result = await response.json();
+        if (result.success) {
+            showAlert('Sponsor deleted successfully!', 'success');
+            loadSponsorCount();
+            if (currentSponsors.length > 0) {
+                loadAllSponsors();
+            }
+        } else {
+            showAlert(result.message || 'Error deleting sponsor', 'error');
+        }
+    } catch (error) {
+        console.error('Error deleting sponsor:', error);
+        showAlert('Error deleting sponsor', 'error');
+    }
+}
+
+function clearSearch() {
+    document.getElementById('searchInput').value = '';
+    document.getElementById('searchResults').innerHTML = '';
+}
+
+function showAlert(message, type) {
+    let toastContainer = document.getElementById('toast-container');
+    if (!toastContainer) {
+        toastContainer = document.createElement('div');
+        toastContainer.id = 'toast-container';
+        toastContainer.style.position = 'fixed';
+        toastContainer.style.top = '24px';
+        toastContainer.style.right = '24px';
+        toastContainer.style.zIndex = '9999';
+        document.body.appendChild(toastContainer);
+    }
+    const toast = document.createElement('div');
+    toast.className = `toast-message toast-${type}`;
+    toast.innerHTML = `
+        <span>${message}</span>
+        <button class="close-toast">&times;</button>
+    `;
+    toast.style.background = type === 'success' ? '#28a745' : (type === 'warning' ? '#ffc107' : '#dc3545');
+    toast.style.color = '#fff';
+    toast.style.padding = '14px 22px';
+    toast.style.marginBottom = '12px';
+    toast.style.borderRadius = '8px';
+    toast.style.boxShadow = '0 2px 12px rgba(0,0,0,0.12)';
+    toast.style.display = 'flex';
+    toast.style.alignItems = 'center';
+    toast.style.justifyContent = 'space-between';
+    toast.style.fontSize = '1.08em';
+    toastContainer.appendChild(toast);
+    setTimeout(() => {
+        if (toast.parentNode) {
+            toast.remove();
+        }
+    }, 3500);
+    toast.querySelector('.close-toast').addEventListener('click', () => {
+        toast.remove();
+    });
+}
+
+function downloadAllSponsors() {
+    if (!isAdmin) return;
+    window.location.href = '/api/sponsors/download';
+}
+
+let contactCount = 1;
+let ruetianCount = 1;
+let editContactCount = 1;
+let editRuetianCount = 1;
+
+function toggleContactFields(select, index) {
+    const nameField = document.getElementById(`contactName${index}`);
+    const phoneField = document.getElementById(`contactFields${index}`);
+    const mailField = document.getElementById(`contactMail${index}`);
+    const linkedinField = document.getElementById(`contactLinkedIn${index}`);
+    if (select.value) {
+        nameField.style.display = 'block';
+        phoneField.style.display = 'block';
+        mailField.style.display = 'block';
+        linkedinField.style.display = 'block';
+    } else {
+        nameField.style.display = 'none';
+        phoneField.style.display = 'none';
+        mailField.style.display = 'none';
+        linkedinField.style.display = 'none';
+    }
+}
+
+function addContactField() {
+    contactCount++;
+    const container = document.getElementById('contactsContainer');
+    const newContact = document.createElement('div');
+    newContact.className = 'contact-item';
+    newContact.innerHTML = `
+        <div class="form-row">
+            <div class="form-group">
+                <label for="role${contactCount}">Role</label>
+                <select id="role${contactCount}" name="roles[]" onchange="toggleContactFields(this, ${contactCount})">
+                    <option value="">Select Role</option>
+                    <option value="CEO">CEO</option>
+                    <option value="CTO">CTO</option>
+                    <option value="Brand Manager">Brand Manager</option>
+                    <option value="Sponsor Manager">Sponsor Manager</option>
+                    <option value="HR">HR</option>
+                </select>
+            </div>
+            <div class="form-group contact-fields" id="contactName${contactCount}" style="display:none;">
+                <label for="contactName${contactCount}">Name (optional)</label>
+                <input type="text" id="contactName${contactCount}" name="contact_names[]">
+            </div>
+            <div class="form-group contact-fields" id="contactFields${contactCount}" style="display:none;">
+                <label for="contactPhone${contactCount}">Phone (optional)</label>
+                <input type="tel" id="contactPhone${contactCount}" name="contact_phones[]">
+            </div>
+            <div class="form-group contact-fields" id="contactMail${contactCount}" style="display:none;">
+                <label for="contactMail${contactCount}">Mail (optional)</label>
+                <input type="email" id="contactMail${contactCount}" name="contact_mails[]">
+            </div>
+            <div class="form-group contact-fields" id="contactLinkedIn${contactCount}" style="display:none;">
+                <label for="contactLinkedIn${contactCount}">LinkedIn (optional)</label>
+                <input type="url" id="contactLinkedIn${contactCount}" name="contact_linkedins[]">
+            </div>
+            <div class="form-group">
+                <button type="button" onclick="removeContactField(this)" class="btn btn-danger btn-sm">Remove</button>
+            </div>
+        </div>
+    `;
+    container.appendChild(newContact);
+}
+
+function removeContactField(button) {
+    button.closest('.contact-item').remove();
+}
+
+// Edit modal contact functions
+function addEditContact(role = '', name = '', phone = '', mail = '', linkedin = '') {
+    editContactCount++;
+    const container = document.getElementById('editContactsContainer');
+    const newContact = document.createElement('div');
+    newContact.className = 'contact-group';
+    newContact.innerHTML = `
+        <div class="form-row">
+            <div class="form-group">
+                <label>Role</label>
+                <select name="edit_roles[]">
+                    <option value="">Select Role</option>
+                    <option value="CEO" ${role === 'CEO' ? 'selected' : ''}>CEO</option>
+                    <option value="CTO" ${role === 'CTO' ? 'selected' : ''}>CTO</option>
+                    <option value="Brand Manager" ${role === 'Brand Manager' ? 'selected' : ''}>Brand Manager</option>
+                    <option value="Sponsor Manager" ${role === 'Sponsor Manager' ? 'selected' : ''}>Sponsor Manager</option>
+                    <option value="HR" ${role === 'HR' ? 'selected' : ''}>HR</option>
+                </select>
+            </div>
+            <div class="form-group">
+                <label>Name (optional)</label>
+                <input type="text" name="edit_contact_names[]" value="${name}">
+            </div>
+            <div class="form-group">
+                <label>Phone (optional)</label>
+                <input type="tel" name="edit_contact_phones[]" value="${phone}">
+            </div>
+            <div class="form-group">
+                <label>Mail (optional)</label>
+                <input type="email" name="edit_contact_mails[]" value="${mail}">
+            </div>
+            <div class="form-group">
+                <label>LinkedIn (optional)</label>
+                <input type="url" name="edit_contact_linkedins[]" value="${linkedin}">
+            </div>
+            <div class="form-group">
+                <button type="button" onclick="removeEditContact(this)" class="btn btn-danger btn-sm">Remove</button>
+            </div>
+        </div>
+    `;
+    container.appendChild(newContact);
+}
+
+function removeEditContact(button) {
+    button.closest('.contact-group').remove();
+}
+
+function addRuetianField() {
+    ruetianCount++;
+    const container = document.getElementById('ruetiansContainer');
+    const newRuetian = document.createElement('div');
+    newRuetian.className = 'ruetian-item';
+    newRuetian.innerHTML = `
+        <div class="form-row">
+            <div class="form-group">
+                <label for="ruetianName${ruetianCount}">Ruetian Name</label>
+                <input type="text" id="ruetianName${ruetianCount}" name="ruetian_names[]">
+            </div>
+            <div class="form-group">
+                <label for="ruetianPhone${ruetianCount}">Ruetian Phone</label>
+                <input type="tel" id="ruetianPhone${ruetianCount}" name="ruetian_phones[]">
+            </div>
+            <div class="form-group">
+                <label for="ruetianMail${ruetianCount}">Ruetian Mail</label>
+                <input type="email" id="ruetianMail${ruetianCount}" name="ruetian_mails[]">
+            </div>
+            <div class="form-group">
+                <label for="ruetianLinkedin${ruetianCount}">Ruetian LinkedIn</label>
+                <input type="url" id="ruetianLinkedin${ruetianCount}" name="ruetian_linkedins[]">
+            </div>
+            <div class="form-group">
+                <button type="button" onclick="removeRuetianField(this)" class="btn btn-danger btn-sm">Remove</button>
+            </div>
+        </div>
+    `;
+    container.appendChild(newRuetian);
+}
+
+function removeRuetianField(button) {
+    button.closest('.ruetian-item').remove();
+}
+
+// Edit modal ruetian functions
+function addEditRuetian(name = '', phone = '', mail = '', linkedin = '') {
+    editRuetianCount++;
+    const container = document.getElementById('editRuetiansContainer');
+    const newRuetian = document.createElement('div');
+    newRuetian.className = 'ruetian-group';
+    newRuetian.innerHTML = `
+        <div class="form-row">
+            <div class="form-group">
+                <label>Ruetian Name</label>
+                <input type="text" name="edit_ruetian_names[]" value="${name}">
+            </div>
+            <div class="form-group">
+                <label>Ruetian Phone</label>
+                <input type="tel" name="edit_ruetian_phones[]" value="${phone}">
+            </div>
+            <div class="form-group">
+                <label>Ruetian Mail</label>
+                <input type="email" name="edit_ruetian_mails[]" value="${mail}">
+            </div>
+            <div class="form-group">
+                <label>Ruetian LinkedIn</label>
+                <input type="url" name="edit_ruetian_linkedins[]" value="${linkedin}">
+            </div>
+            <div class="form-group">
+                <button type="button" onclick="removeEditRuetian(this)" class="btn btn-danger btn-sm">Remove</button>
+            </div>
+        </div>
+    `;
+    container.appendChild(newRuetian);
+}
+
+function removeEditRuetian(button) {
+    button.closest('.ruetian-group').remove();
+}
@@ -0,0 +1,20 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import minify_js
+
+
+def test_division_after_postfix_operators():
+    assert minify_js("let half = count++ / 2; // don't round\n") == 'let half=count++/2;\n'
+    assert minify_js('i-- / 2') == 'i--/2\n'
+
+
+def test_regex_after_operator_or_keyword():
+    assert minify_js('x = a ? /re/ : b / c') == 'x=a?/re/:b/c\n'
+    assert minify_js('if (ok) return /[/]x/.test(y)') == 'if(ok)return/[/]x/.test(y)\n'
+
+
+def test_template_literals_are_copied():
+    assert minify_js('t = `a ${b / 2}  c` / 3') == 't=`a ${b/2}  c`/3\n'